@@ -0,0 +1,65 @@
+"""
+Benchmark response size and parse time for each project items query profile.
+
+Builds synthetic GraphQL responses shaped like each profile (bodies of
+random length up to ``--max-body`` bytes) and reports the JSON bytes and the
+time to decode and parse them into ProjectItem records. Live numbers are
+also logged by ``get_project_items`` as "response bytes".
+
+Usage (from backend/):
+    python -m benchmarks.bench_item_profiles [--items 3000] [--max-body 8000]
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime
+
+from src.models.task import ProjectItem
+from src.services.github_projects import PROJECT_ITEMS_PROFILES
+
+
+def make_node(i: int, profile: str, body: str) -> dict:
+    content = {
+        "id": f"I_{i}",
+        "number": i,
+        "title": f"Task number {i}",
+        "repository": {"owner": {"login": "octo"}, "name": "repo"},
+    }
+    if profile in ("board", "full"):
+        content["body"] = body
+    if profile == "full":
+        content["assignees"] = {"nodes": [{"login": "octocat"}]}
+    return {
+        "id": f"PVTI_{i}",
+        "fieldValueByName": {"name": "Todo", "optionId": "opt"},
+        "content": content,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=3000)
+    parser.add_argument("--max-body", type=int, default=8000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    bodies = ["x" * rng.randint(0, args.max_body) for _ in range(args.items)]
+
+    print(f"{args.items} items, bodies up to {args.max_body} bytes")
+    for profile in PROJECT_ITEMS_PROFILES:
+        nodes = [make_node(i, profile, bodies[i]) for i in range(args.items)]
+        raw = json.dumps({"data": {"node": {"items": {"nodes": nodes}}}})
+
+        start = time.perf_counter()
+        fetched_at = datetime.utcnow()
+        decoded = json.loads(raw)["data"]["node"]["items"]["nodes"]
+        [ProjectItem.from_node("PVT_bench", node, fetched_at) for node in decoded]
+        elapsed = time.perf_counter() - start
+
+        print(f"  {profile:8} {len(raw):>12,} bytes  {elapsed * 1000:7.1f} ms decode+parse")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark parsing GraphQL project item nodes.
+
+Compares building a validated ``Task`` per node (the previous
+``get_project_items`` behaviour) with building ``ProjectItem`` records,
+and reports the cost of converting records to ``Task`` at the API boundary.
+
+Usage (from backend/):
+    python -m benchmarks.bench_project_items [--items 10000]
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+from src.models.task import ProjectItem, Task
+
+
+def make_nodes(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"PVTI_{i}",
+            "fieldValueByName": {"name": "Todo", "optionId": "opt"},
+            "content": {
+                "id": f"I_{i}",
+                "number": i,
+                "title": f"Task number {i}",
+                "body": "Some description text " * 10,
+                "repository": {"owner": {"login": "octo"}, "name": "repo"},
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def parse_tasks(project_id: str, nodes: list[dict]) -> list[Task]:
+    tasks = []
+    for item in nodes:
+        content = item.get("content", {})
+        status_value = item.get("fieldValueByName", {})
+        repo_info = content.get("repository", {})
+        tasks.append(
+            Task(
+                project_id=project_id,
+                github_item_id=item["id"],
+                github_content_id=content.get("id"),
+                github_issue_id=content.get("id") if content.get("number") else None,
+                issue_number=content.get("number"),
+                repository_owner=repo_info.get("owner", {}).get("login") if repo_info else None,
+                repository_name=repo_info.get("name") if repo_info else None,
+                title=content.get("title", "Untitled"),
+                description=content.get("body"),
+                status=status_value.get("name", "Todo") if status_value else "Todo",
+                status_option_id=status_value.get("optionId", "") if status_value else "",
+            )
+        )
+    return tasks
+
+
+def parse_items(project_id: str, nodes: list[dict]) -> list[ProjectItem]:
+    fetched_at = datetime.utcnow()
+    return [ProjectItem.from_node(project_id, node, fetched_at) for node in nodes]
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    nodes = make_nodes(args.items)
+    items = parse_items("PVT_bench", nodes)
+
+    old = best_of(lambda: parse_tasks("PVT_bench", nodes), args.repeat)
+    new = best_of(lambda: parse_items("PVT_bench", nodes), args.repeat)
+    convert = best_of(lambda: [item.to_task() for item in items], args.repeat)
+
+    print(f"Parsing {args.items} project item nodes")
+    print(f"  validated Task per node: {old * 1000:8.1f} ms")
+    print(f"  ProjectItem records:     {new * 1000:8.1f} ms  ({old / new:.1f}x faster)")
+    print(f"  ProjectItem -> Task:     {convert * 1000:8.1f} ms  (only at the API boundary)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark bytes per task snapshot for each frame format and compression.
+
+Compares plain JSON frames with the columnar format, raw and compressed
+with deflate (what permessage-deflate uses on the WebSocket), gzip (SSE)
+and brotli (SSE, if the optional ``brotli`` package is installed).
+
+Usage (from backend/, with the usual .env settings):
+    python -m benchmarks.bench_snapshot_compression [--tasks 3000]
+"""
+
+import argparse
+import gzip
+import zlib
+
+from benchmarks.bench_websocket_broadcast import make_items
+from src.services.task_snapshots import ProjectSnapshot
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def deflate(data: bytes) -> bytes:
+    # Raw deflate stream, as sent by permessage-deflate
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=3000)
+    args = parser.parse_args()
+
+    snapshot = ProjectSnapshot(project_id="PVT_bench")
+    snapshot.apply(make_items(args.tasks))
+
+    frames = {
+        "json": snapshot.snapshot_frame("refresh").encode(),
+        "columnar": snapshot.snapshot_frame("refresh", columnar=True).encode(),
+    }
+    codecs = {"raw": lambda data: data, "deflate": deflate, "gzip": gzip.compress}
+    if brotli is not None:
+        codecs["brotli"] = brotli.compress
+
+    baseline = len(frames["json"])
+    print(f"Snapshot of {args.tasks} tasks (ratio vs raw JSON)")
+    for frame_name, frame in frames.items():
+        for codec_name, codec in codecs.items():
+            size = len(codec(frame))
+            print(f"  {frame_name:9} {codec_name:8} {size:>10,} bytes  {baseline / size:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
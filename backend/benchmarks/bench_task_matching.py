@@ -0,0 +1,85 @@
+"""
+Benchmark matching a task reference against many task titles.
+
+Compares the previous linear matcher (lowercase and split every title on
+every call) with a ``TaskMatchIndex`` built once per task list.
+
+Usage (from backend/):
+    python -m benchmarks.bench_task_matching [--titles 10000] [--queries 200]
+"""
+
+import argparse
+import random
+import time
+
+from src.services.task_matching import TaskMatchIndex
+
+WORDS = (
+    "fix add update remove refactor login signup dashboard widget api cache "
+    "sync webhook board column status issue review copilot chat session token "
+    "project task sidebar modal button layout theme error retry timeout export"
+).split()
+
+
+def make_tasks(count: int, rng: random.Random) -> list[dict]:
+    return [
+        {"task_id": str(i), "title": " ".join(rng.sample(WORDS, 5)) + f" {i}"} for i in range(count)
+    ]
+
+
+def linear_match(reference: str, tasks: list[dict]) -> dict | None:
+    reference_lower = reference.lower()
+    for task in tasks:
+        if task["title"].lower() == reference_lower:
+            return task
+    matches = []
+    for task in tasks:
+        title_lower = task["title"].lower()
+        if reference_lower in title_lower or title_lower in reference_lower:
+            matches.append(task)
+    if len(matches) == 1:
+        return matches[0]
+    ref_words = set(reference_lower.split())
+    best_match, best_score = None, 0
+    for task in tasks:
+        overlap = len(ref_words & set(task["title"].lower().split()))
+        if overlap > best_score:
+            best_score, best_match = overlap, task
+    return best_match if best_score > 0 else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--titles", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    tasks = make_tasks(args.titles, rng)
+    queries = [
+        " ".join(rng.sample(WORDS, 2)) + f" {rng.randrange(args.titles)}"
+        for _ in range(args.queries)
+    ]
+
+    start = time.perf_counter()
+    for query in queries:
+        linear_match(query, tasks)
+    linear = (time.perf_counter() - start) / len(queries)
+
+    start = time.perf_counter()
+    index = TaskMatchIndex(tasks)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for query in queries:
+        index.best_match(query)
+    indexed = (time.perf_counter() - start) / len(queries)
+
+    print(f"{args.titles} titles, {args.queries} queries")
+    print(f"  linear matcher:   {linear * 1000:8.3f} ms/query")
+    print(f"  index build:      {build * 1000:8.3f} ms (once per task list)")
+    print(f"  indexed matcher:  {indexed * 1000:8.3f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
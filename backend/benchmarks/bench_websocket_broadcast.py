@@ -0,0 +1,86 @@
+"""
+Benchmark CPU cost of broadcasting a task snapshot to many WebSocket subscribers.
+
+Compares the previous approach (``model_dump`` + ``send_json`` per socket)
+with encoding the task list once and sharing the frame.
+
+Usage (from backend/):
+    python -m benchmarks.bench_websocket_broadcast [--subscribers 100] [--tasks 2000]
+"""
+
+import argparse
+import json
+import time
+
+from pydantic import TypeAdapter
+
+from src.models.task import ProjectItem, Task
+from src.services.websocket import build_snapshot_frame
+
+
+def make_items(count: int) -> list[ProjectItem]:
+    return [
+        ProjectItem(
+            project_id="PVT_bench",
+            github_item_id=f"PVTI_{i}",
+            github_content_id=f"I_{i}",
+            issue_number=i,
+            repository_owner="octo",
+            repository_name="repo",
+            title=f"Task number {i}",
+            description="Some description text " * 10,
+            status="Todo" if i % 2 else "In Progress",
+            status_option_id="opt",
+        )
+        for i in range(count)
+    ]
+
+
+def per_socket(tasks: list[Task], subscribers: int) -> None:
+    for _ in range(subscribers):
+        message = {
+            "type": "refresh",
+            "project_id": "PVT_bench",
+            "tasks": [t.model_dump(mode="json") for t in tasks],
+            "count": len(tasks),
+        }
+        # Starlette's send_json uses json.dumps
+        json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def encode_once(tasks: list[Task], subscribers: int) -> None:
+    tasks_json = TypeAdapter(list[Task]).dump_json(tasks).decode()
+    frame = build_snapshot_frame("refresh", "PVT_bench", tasks_json, len(tasks))
+    for _ in range(subscribers):
+        # Each socket receives the shared frame; no per-socket encoding
+        _ = frame
+
+
+def measure(fn, tasks: list[Task], subscribers: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fn(tasks, subscribers)
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--subscribers", type=int, default=100)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tasks = [item.to_task() for item in make_items(args.tasks)]
+    old = measure(per_socket, tasks, args.subscribers, args.repeat)
+    new = measure(encode_once, tasks, args.subscribers, args.repeat)
+
+    print(f"{args.subscribers} subscribers x {args.tasks} tasks")
+    print(f"  per-socket encode: {old * 1000:9.1f} ms CPU per broadcast")
+    print(f"  encode once:       {new * 1000:9.1f} ms CPU per broadcast")
+    print(f"  speedup:           {old / new:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
 """Chat API endpoints."""
 
 import logging
-from typing import Annotated
+import time
+from collections import deque
+from collections.abc import AsyncGenerator
+from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
 
 from src.api.auth import get_session_dep
 from src.constants import DEFAULT_STATUS_COLUMNS
@@ -21,42 +27,97 @@ from src.models.chat import (
     RecommendationStatus,
     SenderType,
 )
+from src.models.task import ProjectItemList
 from src.models.user import UserSession
-from src.services.ai_agent import get_ai_agent_service
+from src.services.ai_agent import INTENT_FEATURE_REQUEST, AIAgentService, get_ai_agent_service
 from src.services.cache import cache, get_project_items_cache_key, get_user_projects_cache_key
+from src.services.chat_store import CHAT_HISTORY_LIMIT, chat_store
+from src.services.compression import compress_stream, negotiate_stream_encoding
 from src.services.github_projects import github_projects_service
 from src.services.websocket import connection_manager
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# In-memory storage for chat messages and proposals (MVP)
-_messages: dict[str, list[ChatMessage]] = {}
-_proposals: dict[str, AITaskProposal] = {}
-# In-memory storage for issue recommendations (T007)
-_recommendations: dict[str, IssueRecommendation] = {}
+# In-memory storage for proposals and issue recommendations (T007), swept by the chat store
+_proposals: dict[str, AITaskProposal] = chat_store.proposals
+_recommendations: dict[str, IssueRecommendation] = chat_store.recommendations
+
+# T058: Maximum accepted message length
+MAX_FEATURE_REQUEST_LENGTH = 4000
+
+# Recent send_message latencies (seconds) per "pipeline:outcome" path
+CHAT_LATENCY_SAMPLES = 500
+_chat_latencies: dict[str, deque[float]] = {}
+
+
+def record_chat_latency(path: str, seconds: float) -> None:
+    """Record how long a chat message took on a pipeline path."""
+    samples = _chat_latencies.get(path)
+    if samples is None:
+        samples = _chat_latencies[path] = deque(maxlen=CHAT_LATENCY_SAMPLES)
+    samples.append(seconds)
+    logger.info("Chat message handled via %s in %.0f ms", path, seconds * 1000)
+
+
+def get_chat_latency_stats() -> dict[str, dict[str, float]]:
+    """Get count, mean and p50/p95 latency (ms) of recent messages per path."""
+    stats = {}
+    for path, samples in _chat_latencies.items():
+        ordered = sorted(samples)
+        stats[path] = {
+            "count": len(ordered),
+            "mean_ms": sum(ordered) / len(ordered) * 1000,
+            "p50_ms": ordered[len(ordered) // 2] * 1000,
+            "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        }
+    return stats
 
 
 def get_session_messages(session_id: UUID) -> list[ChatMessage]:
     """Get messages for a session."""
-    return _messages.get(str(session_id), [])
+    return chat_store.get_messages(str(session_id))[0]
 
 
 def add_message(session_id: UUID, message: ChatMessage) -> None:
     """Add a message to a session."""
-    key = str(session_id)
-    if key not in _messages:
-        _messages[key] = []
-    _messages[key].append(message)
+    chat_store.add_message(str(session_id), message)
 
 
 @router.get("/messages", response_model=ChatMessagesResponse)
 async def get_messages(
     session: Annotated[UserSession, Depends(get_session_dep)],
+    limit: Annotated[
+        int | None, Query(ge=1, le=CHAT_HISTORY_LIMIT, description="Page size (newest first)")
+    ] = None,
+    before: Annotated[
+        str | None, Query(description="Cursor from a previous page's next_cursor")
+    ] = None,
 ) -> ChatMessagesResponse:
-    """Get chat messages for current session."""
-    messages = get_session_messages(session.session_id)
-    return ChatMessagesResponse(messages=messages)
+    """
+    Get chat messages for current session, oldest first.
+
+    Without ``limit`` all retained messages are returned. With it, the
+    newest ``limit`` messages (before ``before``, if given) are returned
+    along with a ``next_cursor`` for the page of older messages.
+    """
+    messages, next_cursor = chat_store.get_messages(str(session.session_id), limit, before)
+    return ChatMessagesResponse(messages=messages, next_cursor=next_cursor)
+
+
+@router.get("/stats")
+async def get_chat_stats(
+    session: Annotated[UserSession, Depends(get_session_dep)],
+) -> dict[str, Any]:
+    """Get chat latency per pipeline path and AI completion queue/latency histograms."""
+    stats: dict[str, Any] = {"latency": get_chat_latency_stats(), "store": chat_store.stats()}
+    try:
+        ai_service = get_ai_agent_service()
+    except ValueError:
+        return stats
+    stats["completions"] = ai_service.get_completion_stats()
+    stats["completion_cache"] = ai_service.get_completion_cache_stats()
+    return stats
 
 
 @router.delete("/messages")
@@ -64,54 +125,133 @@ async def clear_messages(
     session: Annotated[UserSession, Depends(get_session_dep)],
 ) -> dict[str, str]:
     """Clear all chat messages for current session."""
-    key = str(session.session_id)
-    if key in _messages:
-        _messages[key] = []
+    chat_store.clear_messages(str(session.session_id))
     return {"message": "Chat history cleared"}
 
 
-@router.post("/messages", response_model=ChatMessage)
-async def send_message(
-    request: ChatMessageRequest,
-    session: Annotated[UserSession, Depends(get_session_dep)],
+def _recommendation_message(
+    session: UserSession, recommendation: IssueRecommendation
 ) -> ChatMessage:
-    """Send a chat message and get AI response."""
+    """Store a generated recommendation and add the assistant message offering it."""
+    # Store recommendation (T016)
+    _recommendations[str(recommendation.recommendation_id)] = recommendation
+
+    # Format requirements for display
+    requirements_preview = "\n".join(
+        f"- {req}" for req in recommendation.functional_requirements[:3]
+    )
+    if len(recommendation.functional_requirements) > 3:
+        requirements_preview += (
+            f"\n- ... and {len(recommendation.functional_requirements) - 3} more"
+        )
+
+    # Create assistant response with issue_create action (T015)
+    assistant_message = ChatMessage(
+        session_id=session.session_id,
+        sender_type=SenderType.ASSISTANT,
+        content=f"""I've generated a GitHub issue recommendation:
+
+**{recommendation.title}**
+
+**User Story:**
+{recommendation.user_story}
+
+**UI/UX Description:**
+{recommendation.ui_ux_description[:200]}{'...' if len(recommendation.ui_ux_description) > 200 else ''}
+
+**Functional Requirements:**
+{requirements_preview}
+
+Click **Confirm** to create this issue in GitHub, or **Reject** to discard.""",
+        action_type=ActionType.ISSUE_CREATE,
+        action_data={
+            "recommendation_id": str(recommendation.recommendation_id),
+            "proposed_title": recommendation.title,
+            "user_story": recommendation.user_story,
+            "ui_ux_description": recommendation.ui_ux_description,
+            "functional_requirements": recommendation.functional_requirements,
+            "status": RecommendationStatus.PENDING.value,
+        },
+    )
+    add_message(session.session_id, assistant_message)
+
+    logger.info(
+        "Generated issue recommendation %s: %s",
+        recommendation.recommendation_id,
+        recommendation.title,
+    )
+    return assistant_message
+
+
+def _validate_chat_request(request: ChatMessageRequest, session: UserSession) -> None:
+    """Reject messages sent without a project or over the length limit."""
     # Require project selection
     if not session.selected_project_id:
         raise ValidationError("Please select a project first")
 
     # T058: Input validation for maximum content length
-    MAX_FEATURE_REQUEST_LENGTH = 4000
     if len(request.content) > MAX_FEATURE_REQUEST_LENGTH:
         raise ValidationError(
             f"Message too long. Maximum length is {MAX_FEATURE_REQUEST_LENGTH} characters."
         )
 
-    # Try to get AI service (optional)
-    try:
-        ai_service = get_ai_agent_service()
-    except ValueError:
-        # AI not configured - return error message
-        error_msg = ChatMessage(
-            session_id=session.session_id,
-            sender_type=SenderType.ASSISTANT,
-            content="AI features are not configured. Please set up Azure OpenAI credentials to use chat functionality.",
-        )
-        add_message(session.session_id, error_msg)
-        return error_msg
 
-    # Create user message
+def _ai_not_configured_message(session: UserSession) -> ChatMessage:
+    """Add and return the assistant message shown when AI is not configured."""
+    error_msg = ChatMessage(
+        session_id=session.session_id,
+        sender_type=SenderType.ASSISTANT,
+        content="AI features are not configured. Please set up Azure OpenAI credentials to use chat functionality.",
+    )
+    add_message(session.session_id, error_msg)
+    return error_msg
+
+
+def _add_user_message(session: UserSession, request: ChatMessageRequest) -> ChatMessage:
+    """Add the user's message to the session history."""
     user_message = ChatMessage(
         session_id=session.session_id,
         sender_type=SenderType.USER,
         content=request.content,
     )
     add_message(session.session_id, user_message)
+    return user_message
+
 
-    # Get project details for context
+@router.post("/messages", response_model=ChatMessage)
+async def send_message(
+    request: ChatMessageRequest,
+    session: Annotated[UserSession, Depends(get_session_dep)],
+) -> ChatMessage:
+    """Send a chat message and get AI response."""
+    _validate_chat_request(request, session)
+
+    # Try to get AI service (optional)
+    try:
+        ai_service = get_ai_agent_service()
+    except ValueError:
+        # AI not configured - return error message
+        return _ai_not_configured_message(session)
+
+    _add_user_message(session, request)
+    return await _respond_to_message(request, session, ai_service)
+
+
+def _project_context(
+    session: UserSession,
+) -> tuple[str, list | None, ProjectItemList, list[str]]:
+    """
+    Get what the AI needs to know about the session's selected project.
+
+    Args:
+        session: Current session
+
+    Returns:
+        (project name, cached projects of the user, current tasks, available statuses)
+    """
     project_name = "Unknown Project"
     project_columns = []
-    cache_key = get_user_projects_cache_key(session.github_user_id)
+    cache_key = get_user_projects_cache_key(session.data_scope)
     cached_projects = cache.get(cache_key)
     if cached_projects:
         for p in cached_projects:
@@ -120,79 +260,99 @@ async def send_message(
                 project_columns = [col.name for col in p.status_columns]
                 break
 
-    # Get current tasks for context
     tasks_cache_key = get_project_items_cache_key(session.selected_project_id)
-    current_tasks = cache.get(tasks_cache_key) or []
+    current_tasks = ProjectItemList.of(cache.get(tasks_cache_key) or [])
+
+    available_statuses = project_columns if project_columns else DEFAULT_STATUS_COLUMNS
+    return project_name, cached_projects, current_tasks, available_statuses
+
+
+async def _respond_to_message(
+    request: ChatMessageRequest,
+    session: UserSession,
+    ai_service: AIAgentService,
+    feature_request_checked: bool = False,
+) -> ChatMessage:
+    """
+    Run the AI pipeline for a chat message and add the assistant's reply.
+
+    Args:
+        request: The user's message
+        session: Current session
+        ai_service: AI agent service
+        feature_request_checked: The message is already known not to be a
+            feature request; skip routing and go straight to status change
+            and task generation
+
+    Returns:
+        The assistant message
+    """
+    project_name, cached_projects, current_tasks, available_statuses = _project_context(session)
+    started = time.perf_counter()
 
     # ──────────────────────────────────────────────────────────────────
-    # PRIORITY 1: Check if this is a feature request (T013, T014)
+    # Clear-cut status commands ("move login bug to done") are matched
+    # against the board locally, skipping the model altogether
+    # ──────────────────────────────────────────────────────────────────
+    local_status_change = ai_service.match_status_command(
+        request.content, current_tasks.task_refs, available_statuses
+    )
+
+    # ──────────────────────────────────────────────────────────────────
+    # Classify and answer in a single completion; the separate calls
+    # below are only made when the router result is unusable
     # ──────────────────────────────────────────────────────────────────
-    ai_service = get_ai_agent_service()
+    route = None
+    if not feature_request_checked and not local_status_change:
+        route = await ai_service.route_chat_message(
+            user_input=request.content,
+            project_name=project_name,
+            session_id=str(session.session_id),
+            available_tasks=[t.title for t in current_tasks],
+            available_statuses=available_statuses,
+        )
+    if local_status_change:
+        pipeline = "local"
+    elif route:
+        pipeline = "router"
+    else:
+        pipeline = "stream" if feature_request_checked else "fallback"
 
-    try:
-        is_feature_request = await ai_service.detect_feature_request_intent(request.content)
-    except Exception as e:
-        logger.warning("Feature request detection failed: %s", e)
+    def finish(message: ChatMessage, outcome: str) -> ChatMessage:
+        record_chat_latency(f"{pipeline}:{outcome}", time.perf_counter() - started)
+        return message
+
+    # ──────────────────────────────────────────────────────────────────
+    # PRIORITY 1: Check if this is a feature request (T013, T014)
+    # ──────────────────────────────────────────────────────────────────
+    if route:
+        is_feature_request = route.intent == INTENT_FEATURE_REQUEST
+    elif feature_request_checked or local_status_change:
         is_feature_request = False
+    else:
+        try:
+            is_feature_request = await ai_service.detect_feature_request_intent(
+                request.content, session_id=str(session.session_id)
+            )
+        except Exception as e:
+            logger.warning("Feature request detection failed: %s", e)
+            is_feature_request = False
 
     if is_feature_request:
         # Generate issue recommendation (T015, T016)
         try:
-            recommendation = await ai_service.generate_issue_recommendation(
-                user_input=request.content,
-                project_name=project_name,
-                session_id=str(session.session_id),
-            )
-
-            # Store recommendation (T016)
-            _recommendations[str(recommendation.recommendation_id)] = recommendation
-
-            # Format requirements for display
-            requirements_preview = "\n".join(
-                f"- {req}" for req in recommendation.functional_requirements[:3]
-            )
-            if len(recommendation.functional_requirements) > 3:
-                requirements_preview += (
-                    f"\n- ... and {len(recommendation.functional_requirements) - 3} more"
+            if route:
+                recommendation = route.recommendation
+            else:
+                recommendation = await ai_service.generate_issue_recommendation(
+                    user_input=request.content,
+                    project_name=project_name,
+                    session_id=str(session.session_id),
                 )
 
-            # Create assistant response with issue_create action (T015)
-            assistant_message = ChatMessage(
-                session_id=session.session_id,
-                sender_type=SenderType.ASSISTANT,
-                content=f"""I've generated a GitHub issue recommendation:
-
-**{recommendation.title}**
-
-**User Story:**
-{recommendation.user_story}
-
-**UI/UX Description:**
-{recommendation.ui_ux_description[:200]}{'...' if len(recommendation.ui_ux_description) > 200 else ''}
-
-**Functional Requirements:**
-{requirements_preview}
-
-Click **Confirm** to create this issue in GitHub, or **Reject** to discard.""",
-                action_type=ActionType.ISSUE_CREATE,
-                action_data={
-                    "recommendation_id": str(recommendation.recommendation_id),
-                    "proposed_title": recommendation.title,
-                    "user_story": recommendation.user_story,
-                    "ui_ux_description": recommendation.ui_ux_description,
-                    "functional_requirements": recommendation.functional_requirements,
-                    "status": RecommendationStatus.PENDING.value,
-                },
-            )
-            add_message(session.session_id, assistant_message)
-
-            logger.info(
-                "Generated issue recommendation %s: %s",
-                recommendation.recommendation_id,
-                recommendation.title,
-            )
+            assistant_message = _recommendation_message(session, recommendation)
 
-            return assistant_message
+            return finish(assistant_message, "feature_request")
 
         except Exception as e:
             # T017: Error handling for AI generation failures
@@ -203,26 +363,33 @@ Click **Confirm** to create this issue in GitHub, or **Reject** to discard.""",
                 content=f"I couldn't generate an issue recommendation from your feature request. Please try again with more detail.\n\nError: {str(e)}",
             )
             add_message(session.session_id, error_message)
-            return error_message
+            return finish(error_message, "error")
 
     # ──────────────────────────────────────────────────────────────────
     # PRIORITY 2: Check if this is a status change request
     # ──────────────────────────────────────────────────────────────────
-    status_change = await ai_service.parse_status_change_request(
-        user_input=request.content,
-        available_tasks=[t.title for t in current_tasks],
-        available_statuses=project_columns if project_columns else DEFAULT_STATUS_COLUMNS,
-    )
+    if local_status_change:
+        status_change = local_status_change
+    elif route:
+        status_change = route.status_change
+    else:
+        status_change = await ai_service.parse_status_change_request(
+            user_input=request.content,
+            available_tasks=[t.title for t in current_tasks],
+            available_statuses=available_statuses,
+            session_id=str(session.session_id),
+        )
 
     if status_change:
         # This is a status change request - identify target task and status
-        target_task = ai_service.identify_target_task(
-            query=status_change.get("task_query", ""),
-            tasks=current_tasks,
+        task_ref = ai_service.identify_target_task(
+            status_change.task_reference,
+            current_tasks.task_refs,
         )
+        target_task = current_tasks.get_by_id(task_ref["task_id"]) if task_ref else None
 
         if target_task:
-            target_status = status_change.get("target_status", "")
+            target_status = status_change.target_status
 
             # Find the status column info
             status_option_id = ""
@@ -266,24 +433,28 @@ Click **Confirm** to create this issue in GitHub, or **Reject** to discard.""",
             )
             add_message(session.session_id, assistant_message)
 
-            return assistant_message
+            return finish(assistant_message, "status_change")
         else:
             # Could not identify the task
             error_message = ChatMessage(
                 session_id=session.session_id,
                 sender_type=SenderType.ASSISTANT,
-                content=f"I couldn't find a task matching '{status_change.get('task_query', '')}'. Please try again with a more specific task name.",
+                content=f"I couldn't find a task matching '{status_change.task_reference}'. Please try again with a more specific task name.",
             )
             add_message(session.session_id, error_message)
 
-            return error_message
+            return finish(error_message, "status_change")
 
     # Not a status change - generate task from description
     try:
-        generated = await ai_service.generate_task_from_description(
-            user_input=request.content,
-            project_name=project_name,
-        )
+        if route:
+            generated = route.task
+        else:
+            generated = await ai_service.generate_task_from_description(
+                user_input=request.content,
+                project_name=project_name,
+                session_id=str(session.session_id),
+            )
 
         # Create proposal
         proposal = AITaskProposal(
@@ -309,7 +480,7 @@ Click **Confirm** to create this issue in GitHub, or **Reject** to discard.""",
         )
         add_message(session.session_id, assistant_message)
 
-        return assistant_message
+        return finish(assistant_message, "task")
 
     except Exception as e:
         logger.error("Failed to generate task: %s", e)
@@ -322,7 +493,116 @@ Click **Confirm** to create this issue in GitHub, or **Reject** to discard.""",
         )
         add_message(session.session_id, error_message)
 
-        return error_message
+        return finish(error_message, "error")
+
+
+def _sse(event: str, data: Any) -> str:
+    """Encode one Server-Sent Event."""
+    payload = data.model_dump_json() if isinstance(data, BaseModel) else to_json(data).decode()
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@router.post("/messages/stream")
+async def stream_message(
+    request: ChatMessageRequest,
+    session: Annotated[UserSession, Depends(get_session_dep)],
+    accept_encoding: Annotated[str | None, Header()] = None,
+) -> StreamingResponse:
+    """
+    Send a chat message and stream the AI response as Server-Sent Events.
+
+    An ``accepted`` event is sent right away. For feature requests the
+    issue recommendation is then streamed while the model writes it:
+    ``field`` events carry text deltas of its top-level string fields and
+    ``requirement`` events carry each functional requirement once complete.
+    The stream always ends with a ``message`` event holding the assistant
+    ChatMessage that POST /messages would have returned.
+    """
+    _validate_chat_request(request, session)
+
+    async def event_generator() -> AsyncGenerator[str, None]:
+        try:
+            ai_service = get_ai_agent_service()
+        except ValueError:
+            yield _sse("message", _ai_not_configured_message(session))
+            return
+
+        started = time.perf_counter()
+        user_message = _add_user_message(session, request)
+        yield _sse("accepted", {"message_id": str(user_message.message_id)})
+
+        project_name, _, current_tasks, available_statuses = _project_context(session)
+        if ai_service.match_status_command(
+            request.content, current_tasks.task_refs, available_statuses
+        ):
+            is_feature_request = False
+        else:
+            try:
+                is_feature_request = await ai_service.detect_feature_request_intent(
+                    request.content, session_id=str(session.session_id)
+                )
+            except Exception as e:
+                logger.warning("Feature request detection failed: %s", e)
+                is_feature_request = False
+
+        if not is_feature_request:
+            message = await _respond_to_message(
+                request, session, ai_service, feature_request_checked=True
+            )
+            yield _sse("message", message)
+            return
+
+        first_field = True
+        try:
+            recommendation = None
+            async for item in ai_service.stream_issue_recommendation(
+                user_input=request.content,
+                project_name=project_name,
+                session_id=str(session.session_id),
+            ):
+                if isinstance(item, IssueRecommendation):
+                    recommendation = item
+                    continue
+                if first_field:
+                    record_chat_latency("stream:first_field", time.perf_counter() - started)
+                    first_field = False
+                if item.kind == "delta":
+                    yield _sse("field", {"field": item.field, "delta": item.value})
+                else:
+                    yield _sse(
+                        "requirement",
+                        {"field": item.field, "index": item.index, "text": item.value},
+                    )
+
+            message = _recommendation_message(session, recommendation)
+            outcome = "feature_request"
+
+        except Exception as e:
+            # T017: Error handling for AI generation failures
+            logger.error("Failed to stream issue recommendation: %s", e)
+            message = ChatMessage(
+                session_id=session.session_id,
+                sender_type=SenderType.ASSISTANT,
+                content=f"I couldn't generate an issue recommendation from your feature request. Please try again with more detail.\n\nError: {str(e)}",
+            )
+            add_message(session.session_id, message)
+            outcome = "error"
+
+        record_chat_latency(f"stream:{outcome}", time.perf_counter() - started)
+        yield _sse("message", message)
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",  # Disable nginx buffering
+        "Vary": "Accept-Encoding",
+    }
+    body = event_generator()
+    encoding = negotiate_stream_encoding(accept_encoding)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        body = compress_stream(body, encoding)
+
+    return StreamingResponse(body, media_type="text/event-stream", headers=headers)
 
 
 @router.post("/proposals/{proposal_id}/confirm", response_model=AITaskProposal)
@@ -3,9 +3,10 @@
 import asyncio
 import logging
 from collections.abc import AsyncGenerator
-from typing import Annotated
+from contextlib import aclosing
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, Header, Query, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
 
 from src.api.auth import get_current_session, get_session_dep
@@ -14,14 +15,44 @@ from src.exceptions import NotFoundError
 from src.models.project import GitHubProject, ProjectListResponse
 from src.models.task import TaskListResponse
 from src.models.user import UserResponse, UserSession
-from src.services.cache import cache, get_project_items_cache_key, get_user_projects_cache_key
+from src.services.cache import (
+    cache,
+    get_project_items_cache_key,
+    get_project_repository_cache_key,
+    get_user_projects_cache_key,
+)
+from src.services.change_feed import project_change_feed
+from src.services.compression import compress_stream, negotiate_stream_encoding
 from src.services.github_auth import github_auth_service
 from src.services.github_projects import github_projects_service
+from src.services.task_snapshots import ProjectSnapshot, task_snapshot_store
 from src.services.websocket import connection_manager
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Seconds between WebSocket task snapshot refreshes
+WEBSOCKET_REFRESH_INTERVAL = 5.0
+
+# Project list fetches in flight by data scope, awaited by every concurrent request
+_project_list_fetches: dict[str, asyncio.Future[list[GitHubProject]]] = {}
+
+
+async def _fetch_projects(session: UserSession) -> list[GitHubProject]:
+    """Fetch the user's projects once per data scope, however many sessions ask."""
+    data_scope = session.data_scope
+    fetch = _project_list_fetches.get(data_scope)
+    if fetch is None:
+        fetch = asyncio.ensure_future(
+            github_projects_service.list_user_projects(
+                session.access_token, session.github_username
+            )
+        )
+        _project_list_fetches[data_scope] = fetch
+        fetch.add_done_callback(lambda _: _project_list_fetches.pop(data_scope, None))
+    # A client going away must not cancel the fetch other sessions wait for
+    return await asyncio.shield(fetch)
+
 
 @router.get("", response_model=ProjectListResponse)
 async def list_projects(
@@ -29,7 +60,7 @@ async def list_projects(
     refresh: Annotated[bool, Query(description="Force refresh from GitHub API")] = False,
 ) -> ProjectListResponse:
     """List user's accessible GitHub Projects."""
-    cache_key = get_user_projects_cache_key(session.github_user_id)
+    cache_key = get_user_projects_cache_key(session.data_scope)
 
     # Check cache unless refresh requested
     if not refresh:
@@ -42,9 +73,7 @@ async def list_projects(
     logger.info("Fetching projects for user %s", session.github_username)
 
     # Get user's personal projects
-    user_projects = await github_projects_service.list_user_projects(
-        session.access_token, session.github_username
-    )
+    user_projects = await _fetch_projects(session)
 
     # TODO: Also fetch org projects the user has access to
     # This requires listing orgs first, then querying each
@@ -64,7 +93,7 @@ async def get_project(
 ) -> GitHubProject:
     """Get project details including status columns."""
     # First check if we have the project cached in the list
-    cache_key = get_user_projects_cache_key(session.github_user_id)
+    cache_key = get_user_projects_cache_key(session.data_scope)
     cached_projects = cache.get(cache_key)
 
     if cached_projects:
@@ -89,6 +118,9 @@ async def get_project_tasks(
     refresh: Annotated[bool, Query(description="Force refresh from GitHub API")] = False,
 ) -> TaskListResponse:
     """Get tasks/items for a project."""
+    # Items are cached per project for all users, so check this user may see it
+    await get_project(project_id, session)
+
     cache_key = get_project_items_cache_key(project_id)
 
     # Check cache unless refresh requested
@@ -96,7 +128,7 @@ async def get_project_tasks(
         cached = cache.get(cache_key)
         if cached:
             logger.info("Returning cached tasks for project %s", project_id)
-            return TaskListResponse(tasks=cached)
+            return TaskListResponse(tasks=[item.to_task() for item in cached])
 
     # Fetch from GitHub
     logger.info("Fetching tasks for project %s", project_id)
@@ -105,7 +137,20 @@ async def get_project_tasks(
     # Cache results
     cache.set(cache_key, tasks)
 
-    return TaskListResponse(tasks=tasks)
+    return TaskListResponse(tasks=[item.to_task() for item in tasks])
+
+
+@router.get("/{project_id}/stats")
+async def get_project_stats(
+    project_id: str,
+    session: Annotated[UserSession, Depends(get_session_dep)],
+) -> dict[str, int]:
+    """Get real-time delivery stats: WebSocket queue depths, dropped frames, SSE subscribers."""
+    await get_project(project_id, session)
+
+    stats = connection_manager.get_project_stats(project_id)
+    stats["sse_subscribers"] = project_change_feed.get_subscriber_count(project_id)
+    return stats
 
 
 @router.post("/{project_id}/select", response_model=UserResponse)
@@ -129,6 +174,32 @@ async def select_project(
     return UserResponse.from_session(session)
 
 
+async def get_project_repository(session: UserSession, project_id: str) -> tuple[str, str] | None:
+    """
+    Get the repository of a project the session's user has access to.
+
+    The lookup is cached per project, so it runs once for all users and sessions.
+
+    Args:
+        session: Current session (its user must have access to the project)
+        project_id: GitHub Project V2 node ID
+
+    Returns:
+        Tuple of (owner, repo_name) or None if no repository found
+    """
+    await get_project(project_id, session)
+
+    cache_key = get_project_repository_cache_key(project_id)
+    repo_info = cache.get(cache_key)
+    if repo_info is None:
+        repo_info = await github_projects_service.get_project_repository(
+            session.access_token, project_id
+        )
+        if repo_info:
+            cache.set(cache_key, repo_info)
+    return repo_info
+
+
 async def _start_copilot_polling(session: UserSession, project_id: str) -> None:
     """Start Copilot PR completion polling for the selected project."""
     from src.services.copilot_polling import (
@@ -137,18 +208,23 @@ async def _start_copilot_polling(session: UserSession, project_id: str) -> None:
         stop_polling,
     )
 
-    # Stop any existing polling first
     status = get_polling_status()
     if status["is_running"]:
+        # Another session of the same user already polls this project
+        if (
+            status["project_id"] == project_id
+            and status["github_user_id"] == session.github_user_id
+        ):
+            logger.info("Copilot PR polling already running for project %s", project_id)
+            return
+
+        # Stop any existing polling first
         stop_polling()
         # Wait for polling to stop
         await asyncio.sleep(0.5)
 
     # Get repository info for the project
-    repo_info = await github_projects_service.get_project_repository(
-        session.access_token,
-        project_id,
-    )
+    repo_info = await get_project_repository(session, project_id)
 
     if not repo_info:
         # Try to get from workflow config or settings
@@ -180,6 +256,7 @@ async def _start_copilot_polling(session: UserSession, project_id: str) -> None:
             owner=owner,
             repo=repo,
             interval_seconds=15,
+            github_user_id=session.github_user_id,
         )
     )
 
@@ -195,20 +272,35 @@ async def _start_copilot_polling(session: UserSession, project_id: str) -> None:
 async def websocket_subscribe(
     websocket: WebSocket,
     project_id: str,
+    since_version: int | None = None,
+    snapshot_format: Annotated[Literal["json", "columnar"], Query(alias="format")] = "json",
 ):
     """
     WebSocket endpoint for real-time project updates.
 
-    On connection, sends all current tasks.
-    Periodically refreshes and sends updates every 5 seconds.
-    Also sends real-time updates when tasks are created, updated, or deleted.
+    On connection, sends all current tasks with the snapshot version. A
+    client reconnecting with ``since_version`` only receives the deltas it
+    missed (or a full snapshot if that version is no longer retained).
+    The project is re-checked every 5 seconds by a refresh task shared by
+    all of the user's subscribers, and a ``tasks_delta`` is sent only when
+    something changed. Also sends real-time updates when tasks are
+    created, updated, or deleted.
 
     Message format:
     {
-        "type": "initial_data" | "refresh" | "task_created" | "task_update" | "status_changed",
-        "tasks": [...] | "task_id": "...",
-        "data": {...}
+        "type": "initial_data" | "refresh" | "tasks_delta" | "task_created" | "task_update"
+                | "status_changed",
+        "version": 42,
+        "tasks": [...],
+        "base_version": 41,
+        "tasks_added": [...], "tasks_removed": ["PVTI_..."], "tasks_patched": [{...}]
     }
+
+    Clients may send ``{"type": "resync"}`` to request a full snapshot.
+
+    With ``?format=columnar``, snapshots list each task field name once and
+    carry the values as arrays under ``"columns"``; deltas are unchanged.
+    Frames are compressed with permessage-deflate when the client offers it.
     """
     # Get session from cookie to authenticate
     session_id = websocket.cookies.get(SESSION_COOKIE_NAME)
@@ -221,73 +313,86 @@ async def websocket_subscribe(
 
     await connection_manager.connect(websocket, project_id)
 
-    async def send_tasks():
-        """Fetch and send current tasks."""
-        try:
-            # Fetch fresh data from GitHub (bypass cache for WebSocket)
-            tasks = await github_projects_service.get_project_items(
-                session.access_token, project_id
+    # Snapshot version this client is known to have
+    client_version = since_version
+
+    def sync(snapshot: ProjectSnapshot, message_type: str, full: bool = False) -> None:
+        """Bring the client up to the snapshot's version."""
+        nonlocal client_version
+        deltas = None
+        if not full and client_version is not None:
+            deltas = snapshot.deltas_since(client_version)
+
+        if deltas is None:
+            connection_manager.send_to_connection(
+                websocket,
+                {"type": message_type},
+                frame=snapshot.snapshot_frame(message_type, columnar=snapshot_format == "columnar"),
             )
-
-            # Update cache
-            cache_key = get_project_items_cache_key(project_id)
-            cache.set(cache_key, tasks)
-
-            return tasks
-        except Exception as e:
-            logger.error("Failed to fetch tasks for WebSocket: %s", e)
-            return None
-
-    try:
-        # Send all current tasks immediately on connection
-        tasks = await send_tasks()
-        if tasks is not None:
-            await websocket.send_json(
-                {
-                    "type": "initial_data",
-                    "project_id": project_id,
-                    "tasks": [task.model_dump(mode="json") for task in tasks],
-                    "count": len(tasks),
-                }
+            logger.debug(
+                "Sent %s with %d tasks for project %s", message_type, snapshot.count, project_id
             )
-            logger.info("Sent %d initial tasks to WebSocket for project %s", len(tasks), project_id)
-
-        # Keep connection alive and periodically refresh
-        last_refresh = asyncio.get_event_loop().time()
-        refresh_interval = 5.0  # Refresh every 5 seconds
-
+        else:
+            for frame in deltas:
+                connection_manager.send_to_connection(
+                    websocket, {"type": "tasks_delta"}, frame=frame
+                )
+        client_version = snapshot.version
+
+    async def read_messages() -> None:
+        """Handle inbound client messages until the socket closes."""
         while True:
-            try:
-                # Wait for incoming messages with timeout
-                data = await asyncio.wait_for(websocket.receive_json(), timeout=1.0)
-
-                # Handle ping
-                if data.get("type") == "ping":
-                    await websocket.send_json({"type": "pong"})
-
-            except TimeoutError:
-                # Check if we need to refresh
-                current_time = asyncio.get_event_loop().time()
-                if current_time - last_refresh >= refresh_interval:
-                    # Refresh and send updated tasks
-                    tasks = await send_tasks()
-                    if tasks is not None:
-                        await websocket.send_json(
-                            {
-                                "type": "refresh",
-                                "project_id": project_id,
-                                "tasks": [task.model_dump(mode="json") for task in tasks],
-                                "count": len(tasks),
-                            }
-                        )
-                        logger.debug("Refreshed %d tasks for project %s", len(tasks), project_id)
-                    last_refresh = current_time
+            data = await websocket.receive_json()
+
+            # Handle ping
+            if data.get("type") == "ping":
+                connection_manager.send_to_connection(websocket, {"type": "pong"})
+            elif data.get("type") == "resync":
+                try:
+                    snapshot = await task_snapshot_store.get(
+                        session.access_token,
+                        session.github_user_id,
+                        project_id,
+                        max_age=WEBSOCKET_REFRESH_INTERVAL,
+                    )
+                except Exception as e:
+                    logger.error("Failed to fetch tasks for WebSocket: %s", e)
+                    continue
+                sync(snapshot, "refresh", full=True)
+
+    async def follow_snapshots() -> None:
+        """Send the current tasks, then whatever changes are published."""
+        message_type = "initial_data"
+        async with aclosing(
+            task_snapshot_store.watch(
+                session.access_token,
+                session.github_user_id,
+                project_id,
+                interval=WEBSOCKET_REFRESH_INTERVAL,
+            )
+        ) as snapshots:
+            async for snapshot in snapshots:
+                sync(snapshot, message_type)
+                message_type = "refresh"
+
+    # Both tasks sleep until there is something to do; neither polls a timer
+    tasks = [
+        asyncio.create_task(read_messages()),
+        asyncio.create_task(follow_snapshots()),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result()
 
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected for project %s", project_id)
     except Exception as e:
         logger.error("WebSocket error for project %s: %s", project_id, e)
     finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         connection_manager.disconnect(websocket)
 
 
@@ -295,65 +400,51 @@ async def websocket_subscribe(
 async def sse_subscribe(
     project_id: str,
     session: Annotated[UserSession, Depends(get_session_dep)],
+    last_event_id: Annotated[int | None, Header(alias="Last-Event-ID")] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
 ):
     """
     Server-Sent Events endpoint for real-time updates.
 
-    This is a fallback for clients that don't support WebSocket.
-    Uses polling internally with 10-second intervals.
+    This is a fallback for clients that don't support WebSocket. Changes
+    come from a shared feed that polls the project every 10 seconds, no
+    matter how many clients are subscribed. Browsers reconnecting with
+    ``Last-Event-ID`` receive the events they missed, or a ``resync``
+    event if those are no longer buffered. The stream is gzip (or brotli)
+    compressed when the client accepts it, flushing after every event.
     """
 
     async def event_generator() -> AsyncGenerator[str, None]:
-        """Generate SSE events by polling for changes."""
-        # Get initial state
-        cache_key = get_project_items_cache_key(project_id)
-        cached_tasks = cache.get(cache_key) or []
-
+        """Generate SSE events from the project's change feed."""
         # Send initial connection event
         yield f'event: connected\ndata: {{"project_id": "{project_id}"}}\n\n'
 
         try:
-            while True:
-                # Poll for changes
-                try:
-                    result = await github_projects_service.poll_project_changes(
-                        session.access_token,
-                        project_id,
-                        cached_tasks,
-                    )
-
-                    changes = result.get("changes", [])
-
-                    if changes:
-                        # Update cache
-                        cached_tasks = result.get("current_tasks", [])
-                        cache.set(cache_key, cached_tasks)
-
-                        # Send change events
-                        for change in changes:
-                            import json
-
-                            yield f"event: {change['type']}\ndata: {json.dumps(change)}\n\n"
-
-                    # Send heartbeat
-                    yield f'event: heartbeat\ndata: {{"timestamp": "{asyncio.get_event_loop().time()}"}}\n\n'
-
-                except Exception as e:
-                    logger.error("SSE polling error: %s", e)
-                    yield 'event: error\ndata: {"message": "Polling error"}\n\n'
-
-                # Wait before next poll
-                await asyncio.sleep(10)
+            async with aclosing(
+                project_change_feed.subscribe(
+                    session.access_token,
+                    session.github_user_id,
+                    project_id,
+                    last_event_id=last_event_id,
+                )
+            ) as events:
+                async for event in events:
+                    event_id = f"id: {event.id}\n" if event.id is not None else ""
+                    yield f"{event_id}event: {event.event}\ndata: {event.data}\n\n"
 
         except asyncio.CancelledError:
             logger.info("SSE connection closed for project %s", project_id)
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-        },
-    )
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",  # Disable nginx buffering
+        "Vary": "Accept-Encoding",
+    }
+    body = event_generator()
+    encoding = negotiate_stream_encoding(accept_encoding)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        body = compress_stream(body, encoding)
+
+    return StreamingResponse(body, media_type="text/event-stream", headers=headers)
@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends
 
 from src.api.auth import get_session_dep
 from src.exceptions import NotFoundError, ValidationError
-from src.models.task import Task, TaskCreateRequest
+from src.models.task import ProjectItemList, Task, TaskCreateRequest
 from src.models.user import UserSession
 from src.services.cache import cache, get_project_items_cache_key
 from src.services.github_projects import github_projects_service
@@ -94,11 +94,7 @@ async def update_task_status(
         cache.set(cache_key, tasks)
 
     # Find the task
-    target_task = None
-    for t in tasks:
-        if str(t.task_id) == task_id or t.github_item_id == task_id:
-            target_task = t
-            break
+    target_task = ProjectItemList.of(tasks).get_by_id(task_id)
 
     if not target_task:
         raise NotFoundError(f"Task not found: {task_id}")
@@ -126,4 +122,4 @@ async def update_task_status(
         },
     )
 
-    return target_task
+    return target_task.to_task()
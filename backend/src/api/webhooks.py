@@ -9,17 +9,24 @@ from typing import Any
 from fastapi import APIRouter, Header, HTTPException, Request, status
 
 from src.config import get_settings
+from src.services.change_feed import project_change_feed
+from src.services.dedupe import BoundedDedupeSet
 from src.services.github_projects import github_projects_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# In-memory storage for tracking processed events (deduplication)
-_processed_delivery_ids: set[str] = set()
-
 # Maximum delivery IDs to keep (prevent memory leak)
 MAX_DELIVERY_IDS = 1000
 
+# Deliveries can be redelivered from GitHub for up to 3 days
+DELIVERY_ID_TTL_SECONDS = 72 * 60 * 60
+
+# Recently processed delivery IDs (deduplication), oldest evicted first
+_processed_delivery_ids = BoundedDedupeSet(
+    max_size=MAX_DELIVERY_IDS, ttl_seconds=DELIVERY_ID_TTL_SECONDS
+)
+
 
 def verify_webhook_signature(payload: bytes, signature: str | None, secret: str) -> bool:
     """
@@ -223,19 +230,10 @@ async def github_webhook(
 
     # Deduplicate by delivery ID
     if x_github_delivery:
-        if x_github_delivery in _processed_delivery_ids:
+        if not _processed_delivery_ids.add(x_github_delivery):
             logger.info("Duplicate delivery %s, skipping", x_github_delivery)
             return {"status": "duplicate", "delivery_id": x_github_delivery}
 
-        _processed_delivery_ids.add(x_github_delivery)
-
-        # Prevent memory leak
-        if len(_processed_delivery_ids) > MAX_DELIVERY_IDS:
-            # Remove oldest entries (convert to list, slice, convert back)
-            oldest = list(_processed_delivery_ids)[: MAX_DELIVERY_IDS // 2]
-            for delivery_id in oldest:
-                _processed_delivery_ids.discard(delivery_id)
-
     # Parse JSON payload
     try:
         payload = await request.json()
@@ -435,6 +433,7 @@ async def update_issue_status_for_copilot_pr(
                 items = await github_projects_service.get_project_items(
                     settings.github_webhook_token,
                     project.project_id,
+                    profile="summary",
                 )
 
                 for item in items:
@@ -491,6 +490,8 @@ async def update_issue_status_for_copilot_pr(
                 "Successfully updated issue #%d to 'In Review' status",
                 issue_number,
             )
+            # Push the change to SSE subscribers without waiting for the next poll
+            project_change_feed.request_refresh(target_project.project_id)
             return {
                 "status": "success",
                 "event": "copilot_pr_ready",
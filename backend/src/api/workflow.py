@@ -9,8 +9,11 @@ from fastapi import APIRouter, BackgroundTasks, Depends, Query
 
 from src.api.auth import get_session_dep
 from src.api.chat import _recommendations
-from src.exceptions import NotFoundError, ValidationError
+from src.exceptions import AuthorizationError, NotFoundError, ValidationError
 from src.models.chat import (
+    BulkConfirmRequest,
+    BulkWorkflowResult,
+    IssueRecommendation,
     RecommendationStatus,
     WorkflowConfiguration,
     WorkflowResult,
@@ -36,6 +39,10 @@ router = APIRouter(prefix="/workflow", tags=["Workflow"])
 _recent_requests: dict[str, tuple[datetime, str]] = {}
 DUPLICATE_WINDOW_MINUTES = 5
 
+# Recommendations whose issues are being created; claimed before any
+# GitHub call so a concurrent confirm cannot create the same issue twice
+_confirming: set[str] = set()
+
 
 def _check_duplicate(original_input: str, recommendation_id: str) -> bool:
     """
@@ -82,7 +89,7 @@ def _get_repository_info(session: UserSession) -> tuple[str, str]:
         Tuple of (owner, repo_name)
     """
     # Try to get from cached projects
-    cache_key = get_user_projects_cache_key(session.github_user_id)
+    cache_key = get_user_projects_cache_key(session.data_scope)
     cached_projects = cache.get(cache_key)
 
     if cached_projects and session.selected_project_id:
@@ -102,21 +109,27 @@ def _get_repository_info(session: UserSession) -> tuple[str, str]:
     return session.github_username or "", ""
 
 
-@router.post("/recommendations/{recommendation_id}/confirm", response_model=WorkflowResult)
-async def confirm_recommendation(
-    recommendation_id: str,
-    session: Annotated[UserSession, Depends(get_session_dep)],
-) -> WorkflowResult:
+def _claim_pending_recommendation(
+    recommendation_id: str, session: UserSession
+) -> IssueRecommendation:
     """
-    Confirm an AI-generated issue recommendation (T025).
+    Get a recommendation of this session that can be confirmed and claim it.
 
-    This triggers:
-    1. GitHub Issue creation (REST API)
-    2. Project attachment (GraphQL API)
-    3. Initial status set to "Backlog"
-    4. Auto-transition to "Ready"
+    The caller must release the claim (discard the ID from ``_confirming``)
+    once the workflow has finished, whether it succeeded or not.
+
+    Args:
+        recommendation_id: Recommendation to confirm
+        session: Current user session
+
+    Returns:
+        The pending recommendation
+
+    Raises:
+        NotFoundError: If the session has no such recommendation
+        ValidationError: If it was already handled, is being confirmed, or
+            repeats a recent request
     """
-    # Get recommendation
     recommendation = _recommendations.get(recommendation_id)
     if not recommendation:
         raise NotFoundError(f"Recommendation not found: {recommendation_id}")
@@ -127,12 +140,35 @@ async def confirm_recommendation(
     if recommendation.status != RecommendationStatus.PENDING:
         raise ValidationError(f"Recommendation already {recommendation.status.value}")
 
+    if recommendation_id in _confirming:
+        raise ValidationError("Recommendation is already being confirmed")
+
     # Check for duplicates (T029)
     if _check_duplicate(recommendation.original_input, recommendation_id):
         raise ValidationError(
             "A similar request was recently processed. Please wait a few minutes."
         )
 
+    _confirming.add(recommendation_id)
+    return recommendation
+
+
+async def _get_workflow_context(
+    session: UserSession, recommendation_id: str | None = None
+) -> WorkflowContext:
+    """
+    Resolve the repository for new issues and build the workflow context.
+
+    Args:
+        session: Current user session (with a selected project)
+        recommendation_id: Recommendation being confirmed, if only one
+
+    Returns:
+        Workflow context for the selected project
+
+    Raises:
+        ValidationError: If no project is selected or no repository is found
+    """
     # Require project selection
     if not session.selected_project_id:
         raise ValidationError("Please select a project first")
@@ -196,7 +232,7 @@ async def confirm_recommendation(
             config.copilot_assignee = settings.default_assignee
 
     # Create workflow context
-    ctx = WorkflowContext(
+    return WorkflowContext(
         session_id=str(session.session_id),
         project_id=session.selected_project_id,
         access_token=session.access_token,
@@ -206,57 +242,174 @@ async def confirm_recommendation(
         config=config,
     )
 
-    # Execute workflow (T030 - error handling included in orchestrator)
+
+async def _mark_confirmed(
+    project_id: str, recommendation: IssueRecommendation, result: WorkflowResult
+) -> None:
+    """Mark a recommendation confirmed and notify the project's WebSocket subscribers."""
+    # Update recommendation status
+    recommendation.status = RecommendationStatus.CONFIRMED
+    recommendation.confirmed_at = datetime.utcnow()
+
+    # Broadcast WebSocket notification for issue creation
+    await connection_manager.broadcast_to_project(
+        project_id,
+        {
+            "type": "issue_created",
+            "issue_id": result.issue_id,
+            "issue_number": result.issue_number,
+            "issue_url": result.issue_url,
+            "title": recommendation.title,
+            "status": result.current_status,
+        },
+    )
+
+    # T035: Send WebSocket notification for Ready status transition
+    if result.current_status == "Ready":
+        await connection_manager.broadcast_to_project(
+            project_id,
+            {
+                "type": "status_updated",
+                "issue_id": result.issue_id,
+                "issue_number": result.issue_number,
+                "from_status": "Backlog",
+                "to_status": "Ready",
+                "title": recommendation.title,
+            },
+        )
+
+    logger.info(
+        "Workflow completed: issue #%d created",
+        result.issue_number,
+    )
+
+
+@router.post("/recommendations/{recommendation_id}/confirm", response_model=WorkflowResult)
+async def confirm_recommendation(
+    recommendation_id: str,
+    session: Annotated[UserSession, Depends(get_session_dep)],
+) -> WorkflowResult:
+    """
+    Confirm an AI-generated issue recommendation (T025).
+
+    This triggers:
+    1. GitHub Issue creation (REST API)
+    2. Project attachment (GraphQL API)
+    3. Initial status set to "Backlog"
+    4. Auto-transition to "Ready"
+    """
+    recommendation = _claim_pending_recommendation(recommendation_id, session)
     try:
-        orchestrator = get_workflow_orchestrator()
-        result = await orchestrator.execute_full_workflow(ctx, recommendation)
+        ctx = await _get_workflow_context(session, recommendation_id)
 
-        if result.success:
-            # Update recommendation status
-            recommendation.status = RecommendationStatus.CONFIRMED
-            recommendation.confirmed_at = datetime.utcnow()
+        # Execute workflow (T030 - error handling included in orchestrator)
+        try:
+            orchestrator = get_workflow_orchestrator()
+            result = await orchestrator.execute_full_workflow(ctx, recommendation)
 
-            # Broadcast WebSocket notification for issue creation
-            await connection_manager.broadcast_to_project(
-                session.selected_project_id,
-                {
-                    "type": "issue_created",
-                    "issue_id": result.issue_id,
-                    "issue_number": result.issue_number,
-                    "issue_url": result.issue_url,
-                    "title": recommendation.title,
-                    "status": result.current_status,
-                },
-            )
+            if result.success:
+                await _mark_confirmed(ctx.project_id, recommendation, result)
 
-            # T035: Send WebSocket notification for Ready status transition
-            if result.current_status == "Ready":
-                await connection_manager.broadcast_to_project(
-                    session.selected_project_id,
-                    {
-                        "type": "status_updated",
-                        "issue_id": result.issue_id,
-                        "issue_number": result.issue_number,
-                        "from_status": "Backlog",
-                        "to_status": "Ready",
-                        "title": recommendation.title,
-                    },
-                )
+            return result
 
-            logger.info(
-                "Workflow completed: issue #%d created",
-                result.issue_number,
+        except Exception as e:
+            logger.error("Workflow failed: %s", e)
+            return WorkflowResult(
+                success=False,
+                message=f"Failed to create issue: {str(e)}",
             )
+    finally:
+        _confirming.discard(recommendation_id)
 
-        return result
 
-    except Exception as e:
-        logger.error("Workflow failed: %s", e)
-        return WorkflowResult(
-            success=False,
-            message=f"Failed to create issue: {str(e)}",
+@router.post("/recommendations/confirm", response_model=BulkWorkflowResult)
+async def confirm_recommendations(
+    request: BulkConfirmRequest,
+    session: Annotated[UserSession, Depends(get_session_dep)],
+) -> BulkWorkflowResult:
+    """
+    Confirm several AI-generated issue recommendations at once.
+
+    Issues are created in parallel under a rate budget and added to the
+    project with batched mutations (see execute_bulk_workflow). Each
+    recommendation's progress is sent to the project's WebSocket
+    subscribers as ``bulk_confirm_progress`` messages, followed by one
+    ``bulk_confirm_completed`` message. Recommendations that cannot be
+    confirmed are reported as failed without stopping the others.
+    """
+    ctx = await _get_workflow_context(session)
+    recommendation_ids = list(dict.fromkeys(request.recommendation_ids))
+    results: dict[str, WorkflowResult] = {}
+    finished = 0
+
+    async def on_progress(recommendation_id: str, stage: str, result: WorkflowResult) -> None:
+        nonlocal finished
+        if stage in ("completed", "failed"):
+            finished += 1
+        await connection_manager.broadcast_to_project(
+            ctx.project_id,
+            {
+                "type": "bulk_confirm_progress",
+                "recommendation_id": recommendation_id,
+                "stage": stage,
+                "result": result,
+                "finished": finished,
+                "total": len(recommendation_ids),
+            },
         )
 
+    recommendations: list[IssueRecommendation] = []
+    try:
+        # Claim every accepted recommendation before the first progress await
+        for recommendation_id in recommendation_ids:
+            try:
+                recommendations.append(_claim_pending_recommendation(recommendation_id, session))
+            except (NotFoundError, ValidationError) as e:
+                results[recommendation_id] = WorkflowResult(success=False, message=e.message)
+        for recommendation_id, result in list(results.items()):
+            await on_progress(recommendation_id, "failed", result)
+
+        if recommendations:
+            try:
+                orchestrator = get_workflow_orchestrator()
+                outcomes = await orchestrator.execute_bulk_workflow(
+                    ctx, recommendations, on_progress
+                )
+            except Exception as e:
+                logger.error("Bulk workflow failed: %s", e)
+                outcomes = [
+                    WorkflowResult(success=False, message=f"Failed to create issue: {str(e)}")
+                    for _ in recommendations
+                ]
+
+            for recommendation, result in zip(recommendations, outcomes, strict=True):
+                results[str(recommendation.recommendation_id)] = result
+                if result.success:
+                    await _mark_confirmed(ctx.project_id, recommendation, result)
+    finally:
+        for recommendation in recommendations:
+            _confirming.discard(str(recommendation.recommendation_id))
+
+    succeeded = sum(1 for result in results.values() if result.success)
+    await connection_manager.broadcast_to_project(
+        ctx.project_id,
+        {
+            "type": "bulk_confirm_completed",
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+        },
+    )
+    logger.info("Bulk confirmed %d/%d recommendations", succeeded, len(results))
+
+    return BulkWorkflowResult(
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results={
+            recommendation_id: results[recommendation_id]
+            for recommendation_id in recommendation_ids
+        },
+    )
+
 
 @router.post("/recommendations/{recommendation_id}/reject")
 async def reject_recommendation(
@@ -276,6 +429,9 @@ async def reject_recommendation(
     if recommendation.status != RecommendationStatus.PENDING:
         raise ValidationError(f"Recommendation already {recommendation.status.value}")
 
+    if recommendation_id in _confirming:
+        raise ValidationError("Recommendation is already being confirmed")
+
     recommendation.status = RecommendationStatus.REJECTED
     logger.info("Recommendation %s rejected", recommendation_id)
 
@@ -329,12 +485,21 @@ async def update_config(
 async def get_transition_history(
     session: Annotated[UserSession, Depends(get_session_dep)],
     issue_id: str | None = Query(None, description="Filter by issue ID"),
+    project_id: str | None = Query(None, description="Filter by project ID"),
+    since: Annotated[
+        datetime | None, Query(description="Only transitions at or after this time")
+    ] = None,
+    until: Annotated[
+        datetime | None, Query(description="Only transitions at or before this time")
+    ] = None,
     limit: int = Query(50, ge=1, le=200, description="Maximum results"),
 ) -> list[WorkflowTransition]:
     """
     Get workflow transition history (T034).
     """
-    transitions = get_transitions(issue_id=issue_id, limit=limit)
+    transitions = get_transitions(
+        issue_id=issue_id, limit=limit, project_id=project_id, since=since, until=until
+    )
     return transitions
 
 
@@ -479,11 +644,10 @@ async def start_copilot_polling(
     if status["is_running"]:
         return {"message": "Polling is already running", "status": status}
 
+    from src.api.projects import get_project_repository
+
     # Get repository info
-    repo_info = await github_projects_service.get_project_repository(
-        session.access_token,
-        session.selected_project_id,
-    )
+    repo_info = await get_project_repository(session, session.selected_project_id)
 
     if not repo_info:
         config = get_workflow_config(session.selected_project_id)
@@ -510,6 +674,7 @@ async def start_copilot_polling(
             owner=owner,
             repo=repo,
             interval_seconds=interval_seconds,
+            github_user_id=session.github_user_id,
         )
     )
 
@@ -538,6 +703,9 @@ async def stop_copilot_polling(
     if not status["is_running"]:
         return {"message": "Polling is not running", "status": status}
 
+    if status["github_user_id"] not in (None, session.github_user_id):
+        raise AuthorizationError("Polling was started by another user")
+
     stop_polling()
 
     logger.info("Stopped Copilot PR polling")
@@ -25,6 +25,9 @@ class Settings(BaseSettings):
     azure_openai_endpoint: str | None = None
     azure_openai_key: str | None = None
     azure_openai_deployment: str = "gpt-4"
+    # Completions run at once and the deployment's tokens-per-minute quota (0 = no budget)
+    ai_max_concurrent_completions: int = 4
+    ai_tokens_per_minute: int = 0
 
     # Session
     session_secret_key: str
@@ -56,6 +59,18 @@ class Settings(BaseSettings):
     # Copilot PR polling interval in seconds (0 to disable polling)
     copilot_polling_interval: int = 60
 
+    # Directory for persisting webhook/polling dedupe state across restarts
+    # (empty to keep dedupe state in memory only)
+    dedupe_state_dir: str | None = None
+
+    # Directory for persisting user sessions across restarts, encrypted with
+    # session_secret_key (empty to keep sessions in memory only)
+    session_state_dir: str | None = None
+
+    # Directory for workflow transition audit log segments kept beyond memory
+    # (empty to keep only the most recent transitions in memory)
+    transition_log_dir: str | None = None
+
     @property
     def cors_origins_list(self) -> list[str]:
         """Parse CORS origins from comma-separated string."""
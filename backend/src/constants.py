@@ -6,6 +6,7 @@ DEFAULT_STATUS_COLUMNS = ["Todo", "In Progress", "Done"]
 # Cache key prefixes
 CACHE_PREFIX_PROJECTS = "projects:user"
 CACHE_PREFIX_PROJECT_ITEMS = "project:items"
+CACHE_PREFIX_PROJECT_REPOSITORY = "project:repository"
 
 # Session cookie name
 SESSION_COOKIE_NAME = "session_id"
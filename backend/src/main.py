@@ -1,6 +1,8 @@
 """FastAPI application entry point."""
 
+import asyncio
 import logging
+import os
 import time
 from collections import defaultdict
 from collections.abc import AsyncGenerator
@@ -67,13 +69,53 @@ class RateLimiter:
 rate_limiter = RateLimiter()
 
 
+def _enable_dedupe_persistence(state_dir: str) -> None:
+    """Persist webhook delivery and Copilot polling dedupe state to disk."""
+    from src.api.webhooks import _processed_delivery_ids
+    from src.services.copilot_polling import _processed_issue_prs
+
+    _processed_delivery_ids.enable_persistence(os.path.join(state_dir, "webhook_deliveries.jsonl"))
+    _processed_issue_prs.enable_persistence(os.path.join(state_dir, "copilot_processed.jsonl"))
+
+
+def _enable_session_persistence(state_dir: str, secret_key: str) -> None:
+    """Persist user sessions to disk so restarts do not log everyone out."""
+    from src.services.github_auth import _sessions
+    from src.services.session_store import FileSessionBackend
+
+    path = os.path.join(state_dir, "sessions.jsonl")
+    restored = _sessions.use_backend(FileSessionBackend(path, secret_key))
+    logger.info("Restored %d sessions from %s", restored, path)
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler."""
     settings = get_settings()
     setup_logging(settings.debug)
     logger.info("Starting GitHub Projects Chat API")
+
+    if settings.dedupe_state_dir:
+        _enable_dedupe_persistence(settings.dedupe_state_dir)
+    if settings.session_state_dir:
+        _enable_session_persistence(settings.session_state_dir, settings.session_secret_key)
+    if settings.transition_log_dir:
+        from src.services.transition_log import transition_log
+
+        transition_log.enable_persistence(settings.transition_log_dir)
+
+    from src.services.chat_store import chat_store
+    from src.services.github_auth import _sessions
+
+    sweepers = [
+        asyncio.create_task(chat_store.run_sweeper()),
+        asyncio.create_task(_sessions.run_sweeper()),
+    ]
+
     yield
+    for sweeper in sweepers:
+        sweeper.cancel()
+    await asyncio.gather(*sweepers, return_exceptions=True)
     logger.info("Shutting down GitHub Projects Chat API")
 
 
@@ -138,4 +180,5 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        ws_per_message_deflate=True,
     )
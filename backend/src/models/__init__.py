@@ -15,7 +15,7 @@ from src.models.chat import (
     SenderType,
 )
 from src.models.project import GitHubProject, StatusColumn
-from src.models.task import Task
+from src.models.task import ProjectItem, ProjectItemList, Task
 from src.models.user import UserSession
 
 __all__ = [
@@ -23,6 +23,8 @@ __all__ = [
     "GitHubProject",
     "StatusColumn",
     "Task",
+    "ProjectItem",
+    "ProjectItemList",
     "ChatMessage",
     "AITaskProposal",
     "SenderType",
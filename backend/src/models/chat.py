@@ -151,6 +151,9 @@ class ChatMessagesResponse(BaseModel):
     """Response for listing chat messages."""
 
     messages: list[ChatMessage]
+    next_cursor: str | None = Field(
+        None, description="Cursor for the page of older messages, if any"
+    )
 
 
 class ProposalConfirmRequest(BaseModel):
@@ -345,3 +348,26 @@ class WorkflowResult(BaseModel):
     project_item_id: str | None = Field(None, description="GitHub Project item ID")
     current_status: str | None = Field(None, description="Current workflow status")
     message: str = Field(..., description="Human-readable result message")
+    step_timings_ms: dict[str, float] = Field(
+        default_factory=dict, description="Duration of each finished workflow step (ms)"
+    )
+
+
+# Recommendations confirmed per bulk request
+MAX_BULK_CONFIRM = 50
+
+
+class BulkConfirmRequest(BaseModel):
+    """Request to confirm several issue recommendations at once."""
+
+    recommendation_ids: list[str] = Field(
+        ..., min_length=1, max_length=MAX_BULK_CONFIRM, description="Recommendations to confirm"
+    )
+
+
+class BulkWorkflowResult(BaseModel):
+    """Results of a bulk confirmation, per recommendation in request order."""
+
+    succeeded: int = Field(..., description="Recommendations confirmed")
+    failed: int = Field(..., description="Recommendations rejected or failed")
+    results: dict[str, WorkflowResult] = Field(..., description="Result per recommendation ID")
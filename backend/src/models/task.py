@@ -1,7 +1,9 @@
 """Task model for GitHub Project items."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from functools import lru_cache
+from typing import Any
+from uuid import UUID, uuid4, uuid5
 
 from pydantic import BaseModel, Field
 
@@ -60,3 +62,230 @@ class TaskListResponse(BaseModel):
     """Response for listing tasks."""
 
     tasks: list[Task]
+
+
+# Namespace for task IDs derived from GitHub Project item IDs
+TASK_ID_NAMESPACE = UUID("5b0c4a2e-6f1d-4c59-9a38-2f7e1d0c8b41")
+
+
+@lru_cache(maxsize=65536)
+def task_id_for_item(github_item_id: str) -> UUID:
+    """Get the stable task ID for a GitHub Project item (memoized, items are refetched often)."""
+    return uuid5(TASK_ID_NAMESPACE, github_item_id)
+
+
+class ProjectItem:
+    """
+    Lightweight project item record used internally between fetches.
+
+    Built straight from GraphQL nodes without validation and exposes the
+    same attributes as ``Task``. ``task_id`` is derived from the GitHub
+    item ID, so refetching the same item yields the same record. Convert
+    with ``to_task()`` where a ``Task`` leaves the service (API responses,
+    real-time frames).
+    """
+
+    __slots__ = (
+        "project_id",
+        "github_item_id",
+        "github_content_id",
+        "github_issue_id",
+        "issue_number",
+        "repository_owner",
+        "repository_name",
+        "title",
+        "description",
+        "status",
+        "status_option_id",
+        "assignees",
+        "fetched_at",
+    )
+
+    def __init__(
+        self,
+        project_id: str,
+        github_item_id: str,
+        title: str,
+        status: str,
+        status_option_id: str,
+        github_content_id: str | None = None,
+        github_issue_id: str | None = None,
+        issue_number: int | None = None,
+        repository_owner: str | None = None,
+        repository_name: str | None = None,
+        description: str | None = None,
+        assignees: list[str] | None = None,
+        fetched_at: datetime | None = None,
+    ):
+        self.project_id = project_id
+        self.github_item_id = github_item_id
+        self.github_content_id = github_content_id
+        self.github_issue_id = github_issue_id
+        self.issue_number = issue_number
+        self.repository_owner = repository_owner
+        self.repository_name = repository_name
+        self.title = title
+        self.description = description
+        self.status = status
+        self.status_option_id = status_option_id
+        self.assignees = assignees
+        self.fetched_at = fetched_at or datetime.utcnow()
+
+    @classmethod
+    def from_node(
+        cls, project_id: str, node: dict[str, Any], fetched_at: datetime
+    ) -> "ProjectItem | None":
+        """
+        Build a record from a project items query node (any profile).
+
+        Args:
+            project_id: Parent project ID
+            node: GraphQL ProjectV2Item node
+            fetched_at: Time of the fetch, shared by all items of a page
+
+        Returns:
+            The record, or None for items without content
+        """
+        content = node.get("content")
+        if not content:
+            return None
+
+        status_value = node.get("fieldValueByName")
+        repo_info = content.get("repository")
+        number = content.get("number")
+        assignees = content.get("assignees")
+
+        return cls(
+            project_id=project_id,
+            github_item_id=node["id"],
+            github_content_id=content.get("id"),
+            github_issue_id=content.get("id") if number else None,
+            issue_number=number,
+            repository_owner=repo_info.get("owner", {}).get("login") if repo_info else None,
+            repository_name=repo_info.get("name") if repo_info else None,
+            title=content.get("title", "Untitled"),
+            description=content.get("body"),
+            status=status_value.get("name", "Todo") if status_value else "Todo",
+            status_option_id=status_value.get("optionId", "") if status_value else "",
+            assignees=[a["login"] for a in assignees["nodes"] if a] if assignees else None,
+            fetched_at=fetched_at,
+        )
+
+    @property
+    def task_id(self) -> UUID:
+        return task_id_for_item(self.github_item_id)
+
+    def to_task(self) -> Task:
+        """Convert to the public ``Task`` model."""
+        return Task(
+            task_id=self.task_id,
+            project_id=self.project_id,
+            github_item_id=self.github_item_id,
+            github_content_id=self.github_content_id,
+            github_issue_id=self.github_issue_id,
+            issue_number=self.issue_number,
+            repository_owner=self.repository_owner,
+            repository_name=self.repository_name,
+            title=self.title,
+            description=self.description,
+            status=self.status,
+            status_option_id=self.status_option_id,
+            assignees=self.assignees,
+            created_at=self.fetched_at,
+            updated_at=self.fetched_at,
+        )
+
+    def __repr__(self) -> str:
+        return f"ProjectItem(github_item_id={self.github_item_id!r}, title={self.title!r}, status={self.status!r})"
+
+
+class ProjectItemList(list[ProjectItem]):
+    """
+    Project items of one fetch, with lookup indexes built on first use.
+
+    Fetched lists are cached and shared, so lookups by item ID, issue and
+    status are served from dicts built once per fetch instead of scanning
+    the list each time. Treat instances as read-only: indexes are not
+    updated if the list or its items change afterwards.
+    """
+
+    _by_id: dict[str, ProjectItem] | None = None
+    _by_issue: dict[tuple[int, str, str], ProjectItem]
+    _by_issue_number: dict[int, ProjectItem]
+    _by_status: dict[str, list[ProjectItem]]
+    _task_refs: list[dict[str, str]]
+
+    @classmethod
+    def of(cls, items: list[ProjectItem]) -> "ProjectItemList":
+        """Return ``items`` if already indexed, else wrap them (e.g. older cache entries)."""
+        return items if isinstance(items, cls) else cls(items)
+
+    def _build_indexes(self) -> None:
+        by_id: dict[str, ProjectItem] = {}
+        self._by_issue = {}
+        self._by_issue_number = {}
+        self._by_status = {}
+        self._task_refs = []
+        for item in self:
+            by_id.setdefault(item.github_item_id, item)
+            by_id.setdefault(str(item.task_id), item)
+            if item.issue_number is not None:
+                # First item wins, matching the order a linear scan would find
+                self._by_issue_number.setdefault(item.issue_number, item)
+                self._by_issue.setdefault(
+                    (
+                        item.issue_number,
+                        (item.repository_owner or "").lower(),
+                        (item.repository_name or "").lower(),
+                    ),
+                    item,
+                )
+            if item.status:
+                self._by_status.setdefault(item.status.lower(), []).append(item)
+            self._task_refs.append({"task_id": item.github_item_id, "title": item.title})
+        self._by_id = by_id
+
+    def get_by_id(self, item_id: str) -> ProjectItem | None:
+        """Find an item by GitHub item ID or by its task ID."""
+        if self._by_id is None:
+            self._build_indexes()
+        return self._by_id.get(item_id)
+
+    def get_by_issue(
+        self, issue_number: int, owner: str | None = None, repo: str | None = None
+    ) -> ProjectItem | None:
+        """
+        Find the item for an issue.
+
+        Args:
+            issue_number: Issue number
+            owner: Repository owner; preferred match when given with ``repo``
+            repo: Repository name
+
+        Returns:
+            The item in the given repository if there is one, else the first
+            item with that issue number, else None
+        """
+        if self._by_id is None:
+            self._build_indexes()
+        if owner and repo:
+            item = self._by_issue.get((issue_number, owner.lower(), repo.lower()))
+            if item:
+                return item
+        return self._by_issue_number.get(issue_number)
+
+    def with_status(self, *statuses: str) -> list[ProjectItem]:
+        """Get the items in any of the given status columns (case-insensitive)."""
+        if self._by_id is None:
+            self._build_indexes()
+        if len(statuses) == 1:
+            return list(self._by_status.get(statuses[0].lower(), ()))
+        wanted = {status.lower() for status in statuses}
+        return [item for item in self if item.status and item.status.lower() in wanted]
+
+    @property
+    def task_refs(self) -> list[dict[str, str]]:
+        """``{"task_id", "title"}`` dicts of all items, for AI task matching."""
+        if self._by_id is None:
+            self._build_indexes()
+        return self._task_refs
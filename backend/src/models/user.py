@@ -1,5 +1,6 @@
 """User session model for OAuth tokens and preferences."""
 
+import re
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
@@ -16,6 +17,7 @@ class UserSession(BaseModel):
     access_token: str = Field(..., description="Encrypted GitHub OAuth access token")
     refresh_token: str | None = Field(None, description="Encrypted OAuth refresh token")
     token_expires_at: datetime | None = Field(None, description="Token expiration timestamp")
+    token_scope: str | None = Field(None, description="OAuth scopes granted to the access token")
     selected_project_id: str | None = Field(
         None, description="Currently selected GitHub Project ID"
     )
@@ -45,6 +47,20 @@ class UserSession(BaseModel):
         }
     }
 
+    @property
+    def data_scope(self) -> str:
+        """
+        Key for GitHub data shared by all sessions of this user.
+
+        Sessions of the same user share data only when their tokens were
+        granted the same scopes, so a narrower token never sees what only a
+        broader one could fetch.
+        """
+        if not self.token_scope:
+            return self.github_user_id
+        scopes = sorted({scope for scope in re.split(r"[,\s]+", self.token_scope) if scope})
+        return f"{self.github_user_id}:{','.join(scopes)}"
+
 
 class UserResponse(BaseModel):
     """User response for API endpoints (excludes sensitive tokens)."""
@@ -0,0 +1,86 @@
+"""Token estimates and budgets for prompt content."""
+
+import math
+
+# Average characters per token of English text and markdown for GPT-style tokenizers
+CHARS_PER_TOKEN = 4
+
+# Budget for free text typed by a user into any prompt
+MAX_USER_INPUT_TOKENS = 2000
+
+TRUNCATION_MARKER = "\n\n…[truncated]"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in text.
+
+    A character-count heuristic keeps this cheap and dependency-free; it is
+    used for budgeting and logging, not for billing.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Estimated token count
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text to about ``max_tokens``, marking the cut.
+
+    Args:
+        text: Text to shorten
+        max_tokens: Token budget including the marker
+
+    Returns:
+        ``text`` if within budget, else its beginning followed by a marker
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    keep = max(max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER), 0)
+    # Prefer cutting at a line or word boundary
+    cut = max(text.rfind("\n", 0, keep), text.rfind(" ", 0, keep))
+    if cut < keep // 2:
+        cut = keep
+    return text[:cut].rstrip() + TRUNCATION_MARKER
+
+
+def fit_comments(
+    comments: list[str], max_tokens: int, max_comment_tokens: int
+) -> tuple[list[str], int]:
+    """
+    Choose which comments of a thread fit a token budget.
+
+    Each comment is first cut to ``max_comment_tokens``. The first comment
+    (usually the one that frames the discussion) is kept, then the most
+    recent ones as long as they fit; the oldest of the rest are dropped.
+
+    Args:
+        comments: Formatted comments, oldest first
+        max_tokens: Budget for all kept comments
+        max_comment_tokens: Budget for any single comment
+
+    Returns:
+        (kept comments in their original order, number of dropped comments)
+    """
+    trimmed = [truncate_to_tokens(comment, max_comment_tokens) for comment in comments]
+    if not trimmed:
+        return [], 0
+
+    kept_tail: list[str] = []
+    used = estimate_tokens(trimmed[0])
+    if used > max_tokens:
+        return [], len(trimmed)
+
+    for comment in reversed(trimmed[1:]):
+        tokens = estimate_tokens(comment)
+        if used + tokens > max_tokens:
+            break
+        kept_tail.append(comment)
+        used += tokens
+
+    kept = [trimmed[0], *reversed(kept_tail)]
+    return kept, len(trimmed) - len(kept)
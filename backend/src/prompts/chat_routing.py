@@ -0,0 +1,89 @@
+"""Prompt template for routing a chat message and answering it in one call."""
+
+from datetime import date
+
+from src.prompts.budget import MAX_USER_INPUT_TOKENS
+from src.prompts.issue_generation import ISSUE_GENERATION_SYSTEM_PROMPT
+from src.prompts.task_generation import MAX_STATUS_CHANGE_TASKS
+from src.prompts.templates import PromptTemplate
+
+CHAT_ROUTER_SYSTEM_PROMPT = f"""You are the assistant of a GitHub Projects chat. For every user message you must
+classify the intent AND produce the result for that intent in the same response.
+
+Intents:
+- "feature_request": the user wants new functionality or describes a capability they need
+  ("I need", "I want", "add feature", "implement", "build", "create a new").
+- "status_change": the user wants to move an existing task to another status
+  ("move fix login to in progress", "mark the auth task as done").
+- "task": anything else the user wants tracked as a task.
+
+Respond with ONE JSON object with exactly these keys:
+{{
+  "intent": "feature_request" | "status_change" | "task",
+  "confidence": 0.0 to 1.0,
+  "feature_request": null or the issue object described below,
+  "status_change": null or {{"task_reference": "...", "target_status": "..."}},
+  "task": null or {{"title": "...", "description": "..."}}
+}}
+Fill in only the key matching the intent and set the other two to null.
+
+For "status_change", task_reference is the task title or description the user mentioned and
+target_status is one of the available statuses.
+
+For "task", the title is a concise, action-oriented title (max 100 characters, starting with a
+verb) and the description is markdown with Overview, Technical Details and Acceptance Criteria
+sections (2-5 checkbox criteria).
+
+For "feature_request", build the issue object as follows:
+
+{ISSUE_GENERATION_SYSTEM_PROMPT}
+Important:
+- Output ONLY valid JSON, no additional text
+- Do not include code blocks or markdown formatting around the JSON"""
+
+
+CHAT_ROUTER_USER_TEMPLATE = """Project Context: {project_name}
+Today's Date: {today}
+
+Available tasks in the project:
+{tasks}
+
+Available statuses:
+{statuses}
+
+User message:
+{user_input}"""
+
+CHAT_ROUTER_TEMPLATE = PromptTemplate(
+    "chat_router",
+    CHAT_ROUTER_SYSTEM_PROMPT,
+    CHAT_ROUTER_USER_TEMPLATE,
+    field_budgets={"user_input": MAX_USER_INPUT_TOKENS},
+)
+
+
+def create_chat_router_prompt(
+    user_input: str,
+    project_name: str,
+    available_tasks: list[str],
+    available_statuses: list[str],
+) -> list[dict]:
+    """
+    Create prompt messages for single-call chat routing.
+
+    Args:
+        user_input: User's message
+        project_name: Name of the target project for context
+        available_tasks: Task titles in the project
+        available_statuses: Available status options
+
+    Returns:
+        List of message dicts with role and content
+    """
+    return CHAT_ROUTER_TEMPLATE.render(
+        project_name=project_name,
+        today=date.today().isoformat(),
+        tasks="\n".join(f"- {task}" for task in available_tasks[:MAX_STATUS_CHANGE_TASKS]),
+        statuses=", ".join(available_statuses),
+        user_input=user_input,
+    )
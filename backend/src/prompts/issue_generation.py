@@ -1,6 +1,10 @@
 """Prompt templates for AI-assisted GitHub issue generation."""
 
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
+
+from src.prompts.budget import MAX_USER_INPUT_TOKENS
+from src.prompts.templates import PromptTemplate
 
 # Pre-defined labels that can be assigned to issues
 PREDEFINED_LABELS = [
@@ -129,6 +133,46 @@ Respond with JSON:
 """
 
 
+# Static instructions come first so consecutive requests share the longest prefix
+ISSUE_GENERATION_USER_TEMPLATE = """Generate a structured GitHub issue for the following feature request.
+Respond with a JSON object containing title, user_story, ui_ux_description, functional_requirements, and metadata (with priority, size, estimate_hours, labels).
+Calculate appropriate start_date and target_date based on the size estimate.
+
+Project Context: {project_name}
+Today's Date: {start_date}
+Suggested Start Date: {start_date}
+Suggested Target Date: {target_date} (adjust based on size - XS/S: same day, M: +1 day, L: +2-3 days, XL: +4-5 days)
+
+Feature Request:
+{user_input}"""
+
+FEATURE_REQUEST_DETECTION_USER_TEMPLATE = """Classify this user input:
+
+"{user_input}"
+
+Is this a feature request? Respond with JSON containing intent, confidence, and reasoning."""
+
+ISSUE_GENERATION_TEMPLATE = PromptTemplate(
+    "issue_generation",
+    ISSUE_GENERATION_SYSTEM_PROMPT,
+    ISSUE_GENERATION_USER_TEMPLATE,
+    field_budgets={"user_input": MAX_USER_INPUT_TOKENS},
+)
+
+FEATURE_REQUEST_DETECTION_TEMPLATE = PromptTemplate(
+    "feature_request_detection",
+    FEATURE_REQUEST_DETECTION_PROMPT,
+    FEATURE_REQUEST_DETECTION_USER_TEMPLATE,
+    field_budgets={"user_input": MAX_USER_INPUT_TOKENS},
+)
+
+
+@lru_cache(maxsize=1)
+def _suggested_dates(today: date) -> tuple[str, str]:
+    """Suggested start and default target date (tomorrow; AI agents complete quickly)."""
+    return today.isoformat(), (today + timedelta(days=1)).isoformat()
+
+
 def create_issue_generation_prompt(user_input: str, project_name: str) -> list[dict]:
     """
     Create prompt messages for issue recommendation generation.
@@ -140,29 +184,13 @@ def create_issue_generation_prompt(user_input: str, project_name: str) -> list[d
     Returns:
         List of message dicts with role and content
     """
-    # Calculate suggested dates (AI agent can complete quickly)
-    today = datetime.now()
-    start_date = today.strftime("%Y-%m-%d")
-    # Default target is tomorrow for typical features
-    default_target = (today + timedelta(days=1)).strftime("%Y-%m-%d")
-
-    user_message = f"""Generate a structured GitHub issue for the following feature request.
-
-Project Context: {project_name}
-Today's Date: {start_date}
-Suggested Start Date: {start_date}
-Suggested Target Date: {default_target} (adjust based on size - XS/S: same day, M: +1 day, L: +2-3 days, XL: +4-5 days)
-
-Feature Request:
-{user_input}
-
-Respond with a JSON object containing title, user_story, ui_ux_description, functional_requirements, and metadata (with priority, size, estimate_hours, labels).
-Calculate appropriate start_date and target_date based on the size estimate."""
-
-    return [
-        {"role": "system", "content": ISSUE_GENERATION_SYSTEM_PROMPT},
-        {"role": "user", "content": user_message},
-    ]
+    start_date, target_date = _suggested_dates(date.today())
+    return ISSUE_GENERATION_TEMPLATE.render(
+        user_input=user_input,
+        project_name=project_name,
+        start_date=start_date,
+        target_date=target_date,
+    )
 
 
 def create_feature_request_detection_prompt(user_input: str) -> list[dict]:
@@ -175,13 +203,4 @@ def create_feature_request_detection_prompt(user_input: str) -> list[dict]:
     Returns:
         List of message dicts with role and content
     """
-    user_message = f"""Classify this user input:
-
-"{user_input}"
-
-Is this a feature request? Respond with JSON containing intent, confidence, and reasoning."""
-
-    return [
-        {"role": "system", "content": FEATURE_REQUEST_DETECTION_PROMPT},
-        {"role": "user", "content": user_message},
-    ]
+    return FEATURE_REQUEST_DETECTION_TEMPLATE.render(user_input=user_input)
@@ -1,5 +1,8 @@
 """AI prompt templates for task generation."""
 
+from src.prompts.budget import MAX_USER_INPUT_TOKENS
+from src.prompts.templates import PromptTemplate
+
 TASK_GENERATION_SYSTEM_PROMPT = """You are an AI assistant that helps developers create well-structured tasks for GitHub Projects.
 
 When a user describes a task they want to create, you must:
@@ -64,33 +67,43 @@ Important:
 - Do not include code blocks or markdown formatting around the JSON"""
 
 
+STATUS_CHANGE_USER_TEMPLATE = """Available tasks in the project:
+{tasks}
+
+Available statuses:
+{statuses}
+
+User request: {user_input}"""
+
+# Task titles listed in the status change prompt
+MAX_STATUS_CHANGE_TASKS = 20
+
+TASK_GENERATION_TEMPLATE = PromptTemplate(
+    "task_generation",
+    TASK_GENERATION_SYSTEM_PROMPT,
+    TASK_GENERATION_USER_PROMPT_TEMPLATE,
+    field_budgets={"user_input": MAX_USER_INPUT_TOKENS},
+)
+
+STATUS_CHANGE_TEMPLATE = PromptTemplate(
+    "status_change",
+    STATUS_CHANGE_SYSTEM_PROMPT,
+    STATUS_CHANGE_USER_TEMPLATE,
+    field_budgets={"user_input": MAX_USER_INPUT_TOKENS},
+)
+
+
 def create_task_generation_prompt(user_input: str, project_name: str) -> list[dict]:
     """Create messages for task generation API call."""
-    return [
-        {"role": "system", "content": TASK_GENERATION_SYSTEM_PROMPT},
-        {
-            "role": "user",
-            "content": TASK_GENERATION_USER_PROMPT_TEMPLATE.format(
-                user_input=user_input, project_name=project_name
-            ),
-        },
-    ]
+    return TASK_GENERATION_TEMPLATE.render(user_input=user_input, project_name=project_name)
 
 
 def create_status_change_prompt(
     user_input: str, available_tasks: list[str], available_statuses: list[str]
 ) -> list[dict]:
     """Create messages for status change intent detection."""
-    context = f"""Available tasks in the project:
-{chr(10).join(f'- {task}' for task in available_tasks[:20])}
-
-Available statuses:
-{', '.join(available_statuses)}"""
-
-    return [
-        {"role": "system", "content": STATUS_CHANGE_SYSTEM_PROMPT},
-        {
-            "role": "user",
-            "content": f"{context}\n\nUser request: {user_input}",
-        },
-    ]
+    return STATUS_CHANGE_TEMPLATE.render(
+        tasks="\n".join(f"- {task}" for task in available_tasks[:MAX_STATUS_CHANGE_TASKS]),
+        statuses=", ".join(available_statuses),
+        user_input=user_input,
+    )
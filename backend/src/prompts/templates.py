@@ -0,0 +1,71 @@
+"""Precompiled chat prompt templates."""
+
+import logging
+
+from src.prompts.budget import estimate_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class PromptTemplate:
+    """
+    A static system prompt and a user message template.
+
+    The system message is built once and every request starts with the
+    same text, so provider-side prompt caching can reuse it; anything
+    that varies per call (input, project, dates) belongs in the user
+    template. Fields listed in ``field_budgets`` are cut to their token
+    budget before rendering, and token counts are logged per call.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        system_prompt: str,
+        user_template: str,
+        field_budgets: dict[str, int] | None = None,
+    ):
+        """
+        Compile the template.
+
+        Args:
+            name: Name used in logs
+            system_prompt: Static system prompt
+            user_template: ``str.format`` template of the user message
+            field_budgets: Maximum tokens per user template field
+        """
+        self.name = name
+        self.system_prompt = system_prompt
+        self.system_tokens = estimate_tokens(system_prompt)
+        self._user_template = user_template
+        self._field_budgets = field_budgets or {}
+
+    def render(self, **fields: str) -> list[dict]:
+        """
+        Build the messages for one call.
+
+        Args:
+            **fields: Values of the user template fields
+
+        Returns:
+            List of message dicts with role and content
+        """
+        for field, max_tokens in self._field_budgets.items():
+            value = fields.get(field)
+            if value is not None:
+                fields[field] = truncate_to_tokens(value, max_tokens)
+
+        user_message = self._user_template.format(**fields)
+        user_tokens = estimate_tokens(user_message)
+        logger.debug(
+            "Prompt %s: ~%d tokens (%d static system + %d user)",
+            self.name,
+            self.system_tokens + user_tokens,
+            self.system_tokens,
+            user_tokens,
+        )
+
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": user_message},
+        ]
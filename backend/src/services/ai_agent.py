@@ -1,9 +1,13 @@
 """AI agent service for task generation using Azure OpenAI or Azure AI Foundry."""
 
+import asyncio
 import json
 import logging
 import re
-from dataclasses import dataclass
+import threading
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime
 
 from src.config import get_settings
@@ -14,6 +18,8 @@ from src.models.chat import (
     IssueSize,
     RecommendationStatus,
 )
+from src.prompts.budget import estimate_tokens
+from src.prompts.chat_routing import create_chat_router_prompt
 from src.prompts.issue_generation import (
     create_feature_request_detection_prompt,
     create_issue_generation_prompt,
@@ -22,12 +28,32 @@ from src.prompts.task_generation import (
     create_status_change_prompt,
     create_task_generation_prompt,
 )
+from src.services.completion_cache import CompletionCache, fingerprint
+from src.services.llm_admission import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    AdmissionController,
+)
+from src.services.status_commands import STATUS_ALIASES, parse_status_command
+from src.services.streaming_json import FieldEvent, JSONFieldStream
+from src.services.task_matching import TaskMatchIndexCache
 
 logger = logging.getLogger(__name__)
 
 # Azure OpenAI API version
 AZURE_API_VERSION = "2024-02-15-preview"
 
+# Completions allowed in flight at once; further calls wait for a free slot
+MAX_CONCURRENT_COMPLETIONS = 4
+
+# Seconds a caller waits for one completion before giving up
+COMPLETION_TIMEOUT_SECONDS = 60.0
+
+# Chat route intents
+INTENT_FEATURE_REQUEST = "feature_request"
+INTENT_STATUS_CHANGE = "status_change"
+INTENT_TASK = "task"
+
 
 @dataclass
 class GeneratedTask:
@@ -46,17 +72,42 @@ class StatusChangeIntent:
     confidence: float
 
 
+@dataclass
+class ChatRoute:
+    """Intent of a chat message together with the result for that intent."""
+
+    intent: str
+    confidence: float
+    recommendation: IssueRecommendation | None = None
+    status_change: StatusChangeIntent | None = None
+    task: GeneratedTask | None = None
+
+
 class AIAgentService:
     """Service for AI-powered task generation and intent detection.
 
     Supports both Azure OpenAI and Azure AI Foundry (Azure AI Inference SDK).
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_concurrent_completions: int = MAX_CONCURRENT_COMPLETIONS,
+        completion_timeout: float = COMPLETION_TIMEOUT_SECONDS,
+        tokens_per_minute: int = 0,
+    ):
         settings = get_settings()
         self._deployment = settings.azure_openai_deployment
         self._client = None
         self._use_azure_inference = False
+        self._match_indexes = TaskMatchIndexCache()
+        self._completion_cache = CompletionCache()
+
+        # The SDK clients block, so completions run on dedicated threads
+        self._completion_timeout = completion_timeout
+        self._admission = AdmissionController(max_concurrent_completions, tokens_per_minute)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_completions, thread_name_prefix="ai-completion"
+        )
 
         # Try Azure OpenAI SDK first (openai package)
         try:
@@ -66,6 +117,7 @@ class AIAgentService:
                 azure_endpoint=settings.azure_openai_endpoint,
                 api_key=settings.azure_openai_key,
                 api_version=AZURE_API_VERSION,
+                timeout=completion_timeout,
             )
             self._use_azure_inference = False
             logger.info("Initialized Azure OpenAI client for deployment: %s", self._deployment)
@@ -81,23 +133,50 @@ class AIAgentService:
             self._use_azure_inference = True
             logger.info("Initialized Azure AI Inference client for model: %s", self._deployment)
 
+    async def _complete(
+        self,
+        messages: list[dict],
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        session_id: str | None = None,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> str:
+        """
+        Run a completion without blocking the event loop.
+
+        The blocking SDK call runs on the service's thread pool once the
+        admission controller lets it start (concurrency limit, token budget,
+        fair per-session queue). Each caller waits at most
+        ``completion_timeout`` seconds for the completion itself.
+
+        Raises:
+            TimeoutError: If the completion did not finish in time
+        """
+        loop = asyncio.get_running_loop()
+        async with self._admit(messages, max_tokens, session_id, priority):
+            future = loop.run_in_executor(
+                self._executor, self._call_completion, messages, temperature, max_tokens
+            )
+            try:
+                return await asyncio.wait_for(future, timeout=self._completion_timeout)
+            except TimeoutError:
+                raise TimeoutError(
+                    f"AI completion timed out after {self._completion_timeout:g}s"
+                ) from None
+
+    def _admit(self, messages: list[dict], max_tokens: int, session_id: str | None, priority: int):
+        """Admission for one completion, reserving its prompt and maximum reply tokens."""
+        tokens = sum(estimate_tokens(message["content"]) for message in messages) + max_tokens
+        return self._admission.admit(session_id or "", priority, tokens)
+
     def _call_completion(
         self, messages: list[dict], temperature: float = 0.7, max_tokens: int = 1000
     ) -> str:
-        """Call the completion API using the appropriate SDK."""
+        """Call the completion API using the appropriate SDK (blocking; see ``_complete``)."""
         if self._use_azure_inference:
-            from azure.ai.inference.models import SystemMessage, UserMessage
-
             response = self._client.complete(
                 model=self._deployment,
-                messages=[
-                    (
-                        SystemMessage(content=messages[0]["content"])
-                        if messages[0]["role"] == "system"
-                        else UserMessage(content=messages[0]["content"])
-                    ),
-                    UserMessage(content=messages[1]["content"]),
-                ],
+                messages=self._azure_inference_messages(messages),
                 temperature=temperature,
                 max_tokens=max_tokens,
             )
@@ -111,21 +190,196 @@ class AIAgentService:
 
         return response.choices[0].message.content
 
+    def _call_completion_stream(
+        self, messages: list[dict], temperature: float = 0.7, max_tokens: int = 1000
+    ) -> Iterator[str]:
+        """Stream completion text using the appropriate SDK (blocking; see ``_complete_stream``)."""
+        if self._use_azure_inference:
+            response = self._client.complete(
+                model=self._deployment,
+                messages=self._azure_inference_messages(messages),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+        else:
+            response = self._client.chat.completions.create(
+                model=self._deployment,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+
+        for update in response:
+            if update.choices and update.choices[0].delta and update.choices[0].delta.content:
+                yield update.choices[0].delta.content
+
+    @staticmethod
+    def _azure_inference_messages(messages: list[dict]) -> list:
+        from azure.ai.inference.models import SystemMessage, UserMessage
+
+        return [
+            (
+                SystemMessage(content=messages[0]["content"])
+                if messages[0]["role"] == "system"
+                else UserMessage(content=messages[0]["content"])
+            ),
+            UserMessage(content=messages[1]["content"]),
+        ]
+
+    async def _complete_stream(
+        self,
+        messages: list[dict],
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        session_id: str | None = None,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion without blocking the event loop.
+
+        The blocking SDK stream is read on the service's thread pool and each
+        chunk is handed to the loop as it arrives. The stream is admitted
+        like any completion and holds its slot until it ends.
+
+        Raises:
+            TimeoutError: If no chunk arrived within ``completion_timeout`` seconds
+        """
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        end = object()
+
+        def deliver(item: object) -> None:
+            try:
+                loop.call_soon_threadsafe(chunks.put_nowait, item)
+            except RuntimeError:
+                # The loop is gone; nobody is listening any more
+                stop.set()
+
+        def produce() -> None:
+            try:
+                for chunk in self._call_completion_stream(messages, temperature, max_tokens):
+                    if stop.is_set():
+                        break
+                    deliver(chunk)
+            except Exception as e:
+                deliver(e)
+            finally:
+                deliver(end)
+
+        async with self._admit(messages, max_tokens, session_id, priority):
+            loop.run_in_executor(self._executor, produce)
+            try:
+                while True:
+                    try:
+                        item = await asyncio.wait_for(
+                            chunks.get(), timeout=self._completion_timeout
+                        )
+                    except TimeoutError:
+                        raise TimeoutError(
+                            f"AI completion stalled for {self._completion_timeout:g}s"
+                        ) from None
+                    if item is end:
+                        return
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                stop.set()
+
+    # ──────────────────────────────────────────────────────────────────
+    # Single-call Chat Routing
+    # ──────────────────────────────────────────────────────────────────
+
+    async def route_chat_message(
+        self,
+        user_input: str,
+        project_name: str,
+        session_id: str,
+        available_tasks: list[str],
+        available_statuses: list[str],
+    ) -> ChatRoute | None:
+        """
+        Classify a chat message and generate its result in one completion.
+
+        Replaces the detect/parse/generate sequence of separate completions.
+        Callers fall back to that sequence when this returns None.
+
+        Args:
+            user_input: User's message
+            project_name: Name of the target project for context
+            session_id: Current session ID
+            available_tasks: Task titles in the project
+            available_statuses: Available status options
+
+        Returns:
+            ChatRoute with the payload for its intent, or None if the response
+            was unusable (error, low confidence, missing or invalid payload)
+        """
+        messages = create_chat_router_prompt(
+            user_input, project_name, available_tasks, available_statuses
+        )
+
+        try:
+            content = await self._complete(
+                messages, temperature=0.5, max_tokens=2000, session_id=session_id
+            )
+            logger.debug("Chat router response: %s", content[:500] if content else "None")
+
+            data = self._parse_json_response(content)
+            intent = data.get("intent")
+            confidence = float(data.get("confidence", 0))
+            payload = data.get(intent) if isinstance(intent, str) else None
+            if confidence < 0.5 or not isinstance(payload, dict):
+                logger.info("Chat router gave no usable %s result (%.2f)", intent, confidence)
+                return None
+
+            if intent == INTENT_FEATURE_REQUEST:
+                recommendation = self._build_issue_recommendation(payload, user_input, session_id)
+                return ChatRoute(intent, confidence, recommendation=recommendation)
+            if intent == INTENT_STATUS_CHANGE:
+                status_change = StatusChangeIntent(
+                    task_reference=payload.get("task_reference", ""),
+                    target_status=payload.get("target_status", ""),
+                    confidence=confidence,
+                )
+                return ChatRoute(intent, confidence, status_change=status_change)
+            if intent == INTENT_TASK:
+                task = self._validate_generated_task(payload)
+                return ChatRoute(intent, confidence, task=task)
+
+            logger.info("Chat router returned unknown intent: %s", intent)
+            return None
+
+        except Exception as e:
+            logger.warning("Chat routing failed, using separate calls: %s", e)
+            return None
+
     # ──────────────────────────────────────────────────────────────────
     # Issue Recommendation Methods (T011, T012, T013)
     # ──────────────────────────────────────────────────────────────────
 
-    async def detect_feature_request_intent(self, user_input: str) -> bool:
+    async def detect_feature_request_intent(
+        self, user_input: str, session_id: str | None = None
+    ) -> bool:
         """
         Detect if user input is a feature request (T013).
 
         Args:
             user_input: User's message
+            session_id: Current session ID (queues the completion fairly)
 
         Returns:
             True if this appears to be a feature request
         """
         prompt_messages = create_feature_request_detection_prompt(user_input)
+        method = "detect_feature_request_intent"
+        context = fingerprint(prompt_messages[0]["content"])
+        hit, cached = self._completion_cache.get(method, user_input, context)
+        if hit:
+            return cached
 
         try:
             messages = [
@@ -133,18 +387,22 @@ class AIAgentService:
                 {"role": "user", "content": prompt_messages[1]["content"]},
             ]
 
-            content = self._call_completion(messages, temperature=0.3, max_tokens=200)
+            content = await self._complete(
+                messages, temperature=0.3, max_tokens=200, session_id=session_id
+            )
             logger.debug("Feature request detection response: %s", content)
 
             data = self._parse_json_response(content)
 
+            is_feature_request = False
             if data.get("intent") == "feature_request":
                 confidence = float(data.get("confidence", 0))
                 if confidence >= 0.6:
                     logger.info("Detected feature request with confidence: %.2f", confidence)
-                    return True
+                    is_feature_request = True
 
-            return False
+            self._completion_cache.set(method, user_input, context, is_feature_request)
+            return is_feature_request
 
         except Exception as e:
             logger.warning("Failed to detect feature request intent: %s", e)
@@ -175,23 +433,70 @@ class AIAgentService:
                 {"role": "user", "content": prompt_messages[1]["content"]},
             ]
 
-            content = self._call_completion(messages, temperature=0.7, max_tokens=2000)
+            # Long and not streamed: queued behind short interactive completions
+            content = await self._complete(
+                messages,
+                temperature=0.7,
+                max_tokens=2000,
+                session_id=session_id,
+                priority=PRIORITY_BACKGROUND,
+            )
             logger.debug("Issue recommendation response: %s", content[:500])
 
             return self._parse_issue_recommendation_response(content, user_input, session_id)
 
         except Exception as e:
-            error_msg = str(e)
-            logger.error("Failed to generate issue recommendation: %s", error_msg)
+            raise self._recommendation_error(e) from e
 
-            if "401" in error_msg or "Access denied" in error_msg:
-                raise ValueError(
-                    "Azure OpenAI authentication failed. Please verify your API key."
-                ) from e
-            elif "404" in error_msg or "Resource not found" in error_msg:
-                raise ValueError(f"Azure OpenAI deployment '{self._deployment}' not found.") from e
-            else:
-                raise ValueError(f"Failed to generate recommendation: {error_msg}") from e
+    async def stream_issue_recommendation(
+        self, user_input: str, project_name: str, session_id: str
+    ) -> AsyncIterator[FieldEvent | IssueRecommendation]:
+        """
+        Generate an issue recommendation, yielding its fields as they are written.
+
+        Yields a FieldEvent for each piece of a top-level string field (title,
+        user_story, ui_ux_description) and for each completed functional
+        requirement, then the IssueRecommendation parsed and validated from
+        the complete response.
+
+        Args:
+            user_input: User's feature request description
+            project_name: Name of the target project for context
+            session_id: Current session ID
+
+        Raises:
+            ValueError: If the AI call fails or its response cannot be parsed
+        """
+        messages = create_issue_generation_prompt(user_input, project_name)
+        fields = JSONFieldStream()
+        content: list[str] = []
+
+        try:
+            async for chunk in self._complete_stream(
+                messages, temperature=0.7, max_tokens=2000, session_id=session_id
+            ):
+                content.append(chunk)
+                for event in fields.feed(chunk):
+                    yield event
+
+            yield self._parse_issue_recommendation_response(
+                "".join(content), user_input, session_id
+            )
+
+        except Exception as e:
+            raise self._recommendation_error(e) from e
+
+    def _recommendation_error(self, error: Exception) -> ValueError:
+        """Map a failed recommendation completion to a user-facing error."""
+        error_msg = str(error)
+        logger.error("Failed to generate issue recommendation: %s", error_msg)
+
+        if "401" in error_msg or "Access denied" in error_msg:
+            return ValueError("Azure OpenAI authentication failed. Please verify your API key.")
+        elif "404" in error_msg or "Resource not found" in error_msg:
+            return ValueError(f"Azure OpenAI deployment '{self._deployment}' not found.")
+        else:
+            return ValueError(f"Failed to generate recommendation: {error_msg}")
 
     def _parse_issue_recommendation_response(
         self, content: str, original_input: str, session_id: str
@@ -210,8 +515,14 @@ class AIAgentService:
         Raises:
             ValueError: If response is invalid
         """
-        data = self._parse_json_response(content)
+        return self._build_issue_recommendation(
+            self._parse_json_response(content), original_input, session_id
+        )
 
+    def _build_issue_recommendation(
+        self, data: dict, original_input: str, session_id: str
+    ) -> IssueRecommendation:
+        """Validate parsed issue fields and build an IssueRecommendation."""
         title = data.get("title", "").strip()
         user_story = data.get("user_story", "").strip()
         ui_ux_description = data.get("ui_ux_description", "").strip()
@@ -370,7 +681,7 @@ class AIAgentService:
     # ──────────────────────────────────────────────────────────────────
 
     async def generate_task_from_description(
-        self, user_input: str, project_name: str
+        self, user_input: str, project_name: str, session_id: str | None = None
     ) -> GeneratedTask:
         """
         Generate a structured task from natural language description.
@@ -378,6 +689,7 @@ class AIAgentService:
         Args:
             user_input: User's natural language task description
             project_name: Name of the target project for context
+            session_id: Current session ID (queues the completion fairly)
 
         Returns:
             GeneratedTask with title and description
@@ -386,6 +698,11 @@ class AIAgentService:
             ValueError: If AI response cannot be parsed
         """
         prompt_messages = create_task_generation_prompt(user_input, project_name)
+        method = "generate_task_from_description"
+        context = fingerprint(prompt_messages[0]["content"], project_name)
+        hit, cached = self._completion_cache.get(method, user_input, context)
+        if hit:
+            return replace(cached)
 
         try:
             messages = [
@@ -393,12 +710,21 @@ class AIAgentService:
                 {"role": "user", "content": prompt_messages[1]["content"]},
             ]
 
-            content = self._call_completion(messages, temperature=0.7, max_tokens=1000)
+            # Not streamed: queued behind short interactive completions
+            content = await self._complete(
+                messages,
+                temperature=0.7,
+                max_tokens=1000,
+                session_id=session_id,
+                priority=PRIORITY_BACKGROUND,
+            )
             logger.debug("AI response: %s", content[:200] if content else "None")
 
             # Parse JSON response
             task_data = self._parse_json_response(content)
-            return self._validate_generated_task(task_data)
+            task = self._validate_generated_task(task_data)
+            self._completion_cache.set(method, user_input, context, task)
+            return replace(task)
 
         except Exception as e:
             error_msg = str(e)
@@ -424,6 +750,7 @@ class AIAgentService:
         user_input: str,
         available_tasks: list[str],
         available_statuses: list[str],
+        session_id: str | None = None,
     ) -> StatusChangeIntent | None:
         """
         Parse user input to detect status change intent.
@@ -432,6 +759,7 @@ class AIAgentService:
             user_input: User's message
             available_tasks: List of task titles in the project
             available_statuses: List of available status options
+            session_id: Current session ID (queues the completion fairly)
 
         Returns:
             StatusChangeIntent if detected with high confidence, None otherwise
@@ -439,6 +767,12 @@ class AIAgentService:
         prompt_messages = create_status_change_prompt(
             user_input, available_tasks, available_statuses
         )
+        method = "parse_status_change_request"
+        # The board is part of the prompt, so a changed board is a different entry
+        context = fingerprint(prompt_messages[0]["content"], available_tasks, available_statuses)
+        hit, cached = self._completion_cache.get(method, user_input, context)
+        if hit:
+            return None if cached is None else replace(cached)
 
         try:
             messages = [
@@ -446,33 +780,79 @@ class AIAgentService:
                 {"role": "user", "content": prompt_messages[1]["content"]},
             ]
 
-            content = self._call_completion(messages, temperature=0.3, max_tokens=200)
+            content = await self._complete(
+                messages, temperature=0.3, max_tokens=200, session_id=session_id
+            )
             logger.debug("Status intent response: %s", content)
 
             data = self._parse_json_response(content)
 
-            if data.get("intent") != "status_change":
-                return None
-
-            confidence = float(data.get("confidence", 0))
-            if confidence < 0.5:
-                logger.info("Low confidence status change intent: %.2f", confidence)
-                return None
+            intent = None
+            if data.get("intent") == "status_change":
+                confidence = float(data.get("confidence", 0))
+                if confidence >= 0.5:
+                    intent = StatusChangeIntent(
+                        task_reference=data.get("task_reference", ""),
+                        target_status=data.get("target_status", ""),
+                        confidence=confidence,
+                    )
+                else:
+                    logger.info("Low confidence status change intent: %.2f", confidence)
 
-            return StatusChangeIntent(
-                task_reference=data.get("task_reference", ""),
-                target_status=data.get("target_status", ""),
-                confidence=confidence,
-            )
+            self._completion_cache.set(method, user_input, context, intent)
+            return None if intent is None else replace(intent)
 
         except Exception as e:
             logger.warning("Failed to parse status change intent: %s", e)
             return None
 
+    def match_status_command(
+        self,
+        user_input: str,
+        available_tasks: list[dict],
+        available_statuses: list[str],
+    ) -> StatusChangeIntent | None:
+        """
+        Recognize a status change command without calling the model.
+
+        Args:
+            user_input: User's message
+            available_tasks: Task dicts with 'task_id' and 'title' keys
+            available_statuses: List of available status options
+
+        Returns:
+            StatusChangeIntent naming the exact task title, or None if the
+            message is not a clear-cut command (ask the model instead)
+        """
+        command = parse_status_command(
+            user_input, self._match_indexes.get(available_tasks), available_statuses
+        )
+        if command is None:
+            return None
+
+        logger.info("Matched status change locally with confidence: %.2f", command.confidence)
+        return StatusChangeIntent(
+            task_reference=command.task["title"],
+            target_status=command.target_status,
+            confidence=command.confidence,
+        )
+
+    def get_completion_stats(self) -> dict:
+        """Get AI completion load, queue-wait and latency histograms."""
+        return self._admission.stats()
+
+    def get_completion_cache_stats(self) -> dict[str, dict[str, float]]:
+        """Get hit counts and hit rate of the completion cache per method."""
+        return self._completion_cache.stats()
+
     def identify_target_task(self, task_reference: str, available_tasks: list[dict]) -> dict | None:
         """
         Find the best matching task for a reference string.
 
+        Matching uses a token index built once per task list, so passing the
+        same list again (e.g. ``ProjectItemList.task_refs`` of a cached fetch)
+        skips re-tokenizing every title.
+
         Args:
             task_reference: Reference string from AI (partial title/description)
             available_tasks: List of task dicts with 'title' and 'task_id'
@@ -483,36 +863,27 @@ class AIAgentService:
         if not task_reference or not available_tasks:
             return None
 
-        reference_lower = task_reference.lower()
-
-        # Exact match
-        for task in available_tasks:
-            if task["title"].lower() == reference_lower:
-                return task
-
-        # Partial match
-        matches = []
-        for task in available_tasks:
-            title_lower = task["title"].lower()
-            if reference_lower in title_lower or title_lower in reference_lower:
-                matches.append(task)
+        return self._match_indexes.get(available_tasks).best_match(task_reference)
 
-        if len(matches) == 1:
-            return matches[0]
+    def rank_target_tasks(
+        self, task_reference: str, available_tasks: list[dict], limit: int = 5
+    ) -> list[dict]:
+        """
+        Rank candidate tasks for a reference string, best first.
 
-        # Fuzzy match - find task with most word overlap
-        ref_words = set(reference_lower.split())
-        best_match = None
-        best_score = 0
+        Args:
+            task_reference: Reference string from AI
+            available_tasks: List of task dicts with 'title' and 'task_id'
+            limit: Maximum number of candidates
 
-        for task in available_tasks:
-            title_words = set(task["title"].lower().split())
-            overlap = len(ref_words & title_words)
-            if overlap > best_score:
-                best_score = overlap
-                best_match = task
+        Returns:
+            Up to ``limit`` task dicts sharing at least one word with the reference
+        """
+        if not task_reference or not available_tasks:
+            return []
 
-        return best_match if best_score > 0 else None
+        index = self._match_indexes.get(available_tasks)
+        return [task for _, task in index.search(task_reference, limit)]
 
     def identify_target_status(
         self, status_reference: str, available_statuses: list[str]
@@ -544,16 +915,10 @@ class AIAgentService:
                 return status
 
         # Common aliases
-        aliases = {
-            "todo": ["to do", "backlog", "not started"],
-            "in progress": ["doing", "started", "working", "in-progress"],
-            "done": ["complete", "completed", "finished", "closed"],
-        }
-
         for status in available_statuses:
             status_key = status.lower()
-            if status_key in aliases:
-                for alias in aliases[status_key]:
+            if status_key in STATUS_ALIASES:
+                for alias in STATUS_ALIASES[status_key]:
                     if alias in ref_lower or ref_lower in alias:
                         return status
 
@@ -605,5 +970,8 @@ def get_ai_agent_service() -> AIAgentService:
         settings = get_settings()
         if not settings.azure_openai_endpoint or not settings.azure_openai_key:
             raise ValueError("Azure OpenAI credentials not configured")
-        _ai_agent_service_instance = AIAgentService()
+        _ai_agent_service_instance = AIAgentService(
+            max_concurrent_completions=settings.ai_max_concurrent_completions,
+            tokens_per_minute=settings.ai_tokens_per_minute,
+        )
     return _ai_agent_service_instance
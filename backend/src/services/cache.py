@@ -114,15 +114,32 @@ def get_cache_key(prefix: str, identifier: str) -> str:
     return f"{prefix}:{identifier}"
 
 
-def get_user_projects_cache_key(user_id: str) -> str:
-    """Get cache key for user's projects list."""
+def get_user_projects_cache_key(data_scope: str) -> str:
+    """Get cache key for a user's projects list (see ``UserSession.data_scope``)."""
     from src.constants import CACHE_PREFIX_PROJECTS
 
-    return get_cache_key(CACHE_PREFIX_PROJECTS, user_id)
+    return get_cache_key(CACHE_PREFIX_PROJECTS, data_scope)
 
 
-def get_project_items_cache_key(project_id: str) -> str:
-    """Get cache key for project items."""
+def get_project_items_cache_key(project_id: str, profile: str = "board") -> str:
+    """Get cache key for project items fetched with a query profile."""
     from src.constants import CACHE_PREFIX_PROJECT_ITEMS
 
+    if profile != "board":
+        project_id = f"{project_id}:{profile}"
     return get_cache_key(CACHE_PREFIX_PROJECT_ITEMS, project_id)
+
+
+def get_project_repository_cache_key(project_id: str) -> str:
+    """Get cache key for the repository a project's issues live in."""
+    from src.constants import CACHE_PREFIX_PROJECT_REPOSITORY
+
+    return get_cache_key(CACHE_PREFIX_PROJECT_REPOSITORY, project_id)
+
+
+def get_project_items_by_status_cache_key(
+    project_id: str, statuses: list[str], profile: str = "summary"
+) -> str:
+    """Get cache key for project items filtered to a set of status columns."""
+    status_key = ",".join(sorted(status.lower() for status in statuses))
+    return get_project_items_cache_key(project_id, profile=f"{profile}:status={status_key}")
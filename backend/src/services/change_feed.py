@@ -0,0 +1,215 @@
+"""Shared per-project change feed for Server-Sent Events subscribers."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from pydantic_core import to_json
+
+from src.models.task import ProjectItem
+from src.services.cache import cache, get_project_items_cache_key
+from src.services.github_projects import github_projects_service, is_auth_error
+from src.services.task_snapshots import task_snapshot_store
+
+logger = logging.getLogger(__name__)
+
+# Seconds between polls of a project with active subscribers
+CHANGE_FEED_POLL_INTERVAL = 10.0
+
+# Change events kept per feed for Last-Event-ID resume
+CHANGE_FEED_REPLAY_SIZE = 200
+
+
+@dataclass(frozen=True)
+class FeedEvent:
+    """A single event delivered to feed subscribers."""
+
+    event: str
+    data: str
+    # Only change events have IDs; heartbeats and errors are not replayable
+    id: int | None = None
+
+
+class _ProjectFeed:
+    """Change events and polling state for one project, as seen by one user."""
+
+    def __init__(self, project_id: str):
+        self.project_id = project_id
+        # Access tokens of current subscribers; the newest accepted one is used to poll
+        self.tokens: list[str] = []
+        # Tokens GitHub rejected, skipped until their subscribers leave
+        self.rejected: set[str] = set()
+        # Seeded from the same profile the poll fetches, so the first diff compares like with like
+        self.cached_tasks: list[ProjectItem] = (
+            cache.get(get_project_items_cache_key(project_id, profile="summary")) or []
+        )
+        # Millisecond timestamp base so event IDs keep increasing across restarts
+        self.last_id = int(time.time() * 1000)
+        self.events: deque[FeedEvent] = deque(maxlen=CHANGE_FEED_REPLAY_SIZE)
+        # Completed polls and the heartbeat or error event that ended the latest one
+        self.polls = 0
+        self.poll_status: FeedEvent | None = None
+        self.updated = asyncio.Condition()
+        self.wakeup = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    def replay_since(self, last_event_id: int) -> list[FeedEvent] | None:
+        """Events after ``last_event_id``, or None if they are no longer buffered."""
+        if last_event_id == self.last_id:
+            return []
+        oldest_id = self.events[0].id if self.events else self.last_id + 1
+        if not oldest_id - 1 <= last_event_id < self.last_id:
+            return None
+        return [e for e in self.events if e.id > last_event_id]
+
+
+class ProjectChangeFeed:
+    """
+    Polls each watched project once and fans changes out to all subscribers.
+
+    Feeds are keyed by (project_id, github_user_id), so subscribers only
+    receive changes read with their own user's token. Each feed keeps a
+    bounded replay buffer so reconnecting clients can resume from the
+    ``Last-Event-ID`` they last saw.
+    """
+
+    def __init__(self, poll_interval: float = CHANGE_FEED_POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._feeds: dict[tuple[str, str], _ProjectFeed] = {}
+
+    async def subscribe(
+        self,
+        access_token: str,
+        github_user_id: str,
+        project_id: str,
+        last_event_id: int | None = None,
+    ) -> AsyncIterator[FeedEvent]:
+        """
+        Yield change events for a project until the subscriber goes away.
+
+        Args:
+            access_token: GitHub OAuth access token of the subscriber
+            github_user_id: Subscriber's GitHub user ID
+            project_id: GitHub Project node ID
+            last_event_id: ID of the last event the client received, if resuming
+
+        Yields:
+            Missed events (or a ``resync`` event if they are gone), then new
+            change events followed by a ``heartbeat`` or ``error`` per poll
+        """
+        key = (project_id, github_user_id)
+        feed = self._feeds.get(key)
+        if feed is None:
+            feed = self._feeds[key] = _ProjectFeed(project_id)
+        feed.tokens.append(access_token)
+        if feed.task is None:
+            feed.task = asyncio.create_task(self._poll_loop(feed))
+
+        try:
+            # Taken before any yield: polls finishing while the subscriber is
+            # suspended must still be delivered afterwards
+            seen_id, seen_polls = feed.last_id, feed.polls
+            if last_event_id is not None:
+                missed = feed.replay_since(last_event_id)
+                if missed is None:
+                    yield FeedEvent("resync", to_json({"project_id": project_id}).decode())
+                else:
+                    for event in missed:
+                        yield event
+
+            while True:
+                async with feed.updated:
+                    await feed.updated.wait_for(lambda seen=seen_polls: feed.polls != seen)
+                seen_polls = feed.polls
+
+                # A copy, since polls append to the buffer while we are suspended
+                for event in list(feed.events):
+                    if event.id > seen_id:
+                        seen_id = event.id
+                        yield event
+
+                yield feed.poll_status
+        finally:
+            feed.tokens.remove(access_token)
+            if access_token not in feed.tokens:
+                feed.rejected.discard(access_token)
+            if not feed.tokens:
+                feed.task.cancel()
+                self._feeds.pop(key, None)
+
+    def request_refresh(self, project_id: str) -> None:
+        """
+        Poll a project now instead of waiting for the next interval (e.g. after a webhook).
+
+        WebSocket snapshots of the project are refreshed as well.
+        """
+        for (feed_project_id, _), feed in self._feeds.items():
+            if feed_project_id == project_id:
+                feed.wakeup.set()
+        task_snapshot_store.request_refresh(project_id)
+
+    def get_subscriber_count(self, project_id: str) -> int:
+        """Get number of SSE subscribers for a project."""
+        return sum(len(feed.tokens) for (pid, _), feed in self._feeds.items() if pid == project_id)
+
+    async def _poll_loop(self, feed: _ProjectFeed) -> None:
+        while True:
+            await self._poll(feed)
+            try:
+                await asyncio.wait_for(feed.wakeup.wait(), timeout=self.poll_interval)
+            except TimeoutError:
+                pass
+            feed.wakeup.clear()
+
+    async def _fetch_changes(self, feed: _ProjectFeed) -> dict:
+        """Poll with subscribers' tokens newest first, skipping ones GitHub rejects."""
+        error: Exception = ValueError("No accepted access token")
+        for token in reversed(list(feed.tokens)):
+            if token in feed.rejected:
+                continue
+            try:
+                return await github_projects_service.poll_project_changes(
+                    token, feed.project_id, feed.cached_tasks
+                )
+            except Exception as e:
+                if not is_auth_error(e):
+                    raise
+                logger.warning("Skipping rejected token for project %s", feed.project_id)
+                feed.rejected.add(token)
+                error = e
+        raise error
+
+    async def _poll(self, feed: _ProjectFeed) -> None:
+        try:
+            result = await self._fetch_changes(feed)
+            changes = result.get("changes", [])
+            if changes:
+                # Update cache (items are fetched without bodies)
+                feed.cached_tasks = result.get("current_tasks", [])
+                cache.set(
+                    get_project_items_cache_key(feed.project_id, profile="summary"),
+                    feed.cached_tasks,
+                )
+
+                for change in changes:
+                    feed.last_id += 1
+                    feed.events.append(
+                        FeedEvent(change["type"], to_json(change).decode(), id=feed.last_id)
+                    )
+            timestamp = str(asyncio.get_running_loop().time())
+            status = FeedEvent("heartbeat", to_json({"timestamp": timestamp}).decode())
+        except Exception as e:
+            logger.error("SSE polling error for project %s: %s", feed.project_id, e)
+            status = FeedEvent("error", '{"message": "Polling error"}')
+
+        async with feed.updated:
+            feed.poll_status = status
+            feed.polls += 1
+            feed.updated.notify_all()
+
+
+# Global change feed instance
+project_change_feed = ProjectChangeFeed()
@@ -0,0 +1,162 @@
+"""Bounded in-memory storage for chat messages, proposals and recommendations."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from pydantic_core import to_json
+
+from src.config import get_settings
+from src.models.chat import AITaskProposal, ChatMessage, IssueRecommendation
+
+logger = logging.getLogger(__name__)
+
+# Messages kept per session; the oldest are dropped first
+CHAT_HISTORY_LIMIT = 200
+
+# Expired proposals are kept this long so confirming one reports "expired", not "not found"
+PROPOSAL_RETENTION = timedelta(hours=1)
+
+# Recommendations (confirmed or not) are dropped this long after creation
+RECOMMENDATION_TTL = timedelta(hours=24)
+
+# Seconds between sweeps of expired entries
+CHAT_SWEEP_INTERVAL_SECONDS = 300.0
+
+
+class _History:
+    """Ring buffer of one session's messages with sequence numbers for cursors."""
+
+    def __init__(self, limit: int):
+        self.messages: deque[ChatMessage] = deque(maxlen=limit)
+        self.sizes: deque[int] = deque(maxlen=limit)
+        # Sequence number the next message gets; the oldest kept is next_seq - len(messages)
+        self.next_seq = 0
+        self.bytes = 0
+        self.last_active = time.monotonic()
+
+
+class ChatStore:
+    """
+    Chat state of all sessions, bounded in size and age.
+
+    Each session keeps its latest ``history_limit`` messages in a ring
+    buffer; pages are addressed by opaque cursors (sequence numbers), so
+    reading recent history never copies the whole buffer. A periodic sweep
+    drops expired proposals and recommendations, and the messages of
+    sessions idle for longer than a session can live.
+    """
+
+    def __init__(self, history_limit: int = CHAT_HISTORY_LIMIT):
+        self.history_limit = history_limit
+        self._histories: dict[str, _History] = {}
+        self.proposals: dict[str, AITaskProposal] = {}
+        self.recommendations: dict[str, IssueRecommendation] = {}
+        self._evicted_messages = 0
+
+    def add_message(self, session_id: str, message: ChatMessage) -> None:
+        """Append a message to a session's history, dropping the oldest if full."""
+        history = self._histories.get(session_id)
+        if history is None:
+            history = self._histories[session_id] = _History(self.history_limit)
+        if len(history.messages) == self.history_limit:
+            history.bytes -= history.sizes[0]
+            self._evicted_messages += 1
+        size = len(to_json(message))
+        history.messages.append(message)
+        history.sizes.append(size)
+        history.bytes += size
+        history.next_seq += 1
+        history.last_active = time.monotonic()
+
+    def get_messages(
+        self, session_id: str, limit: int | None = None, before: str | None = None
+    ) -> tuple[list[ChatMessage], str | None]:
+        """
+        Get a page of a session's messages, oldest first.
+
+        Args:
+            session_id: Session ID
+            limit: Maximum messages to return (None = everything kept)
+            before: Cursor from a previous page; only older messages are returned
+
+        Returns:
+            (messages, cursor for the next older page or None if there is none)
+        """
+        history = self._histories.get(session_id)
+        if history is None:
+            return [], None
+        history.last_active = time.monotonic()
+
+        first_seq = history.next_seq - len(history.messages)
+        end = len(history.messages)
+        if before is not None:
+            try:
+                end = min(max(int(before) - first_seq, 0), end)
+            except ValueError:
+                end = 0
+        start = 0 if limit is None else max(end - limit, 0)
+
+        page = [history.messages[i] for i in range(start, end)]
+        return page, str(first_seq + start) if start > 0 else None
+
+    def clear_messages(self, session_id: str) -> None:
+        """Forget a session's messages."""
+        self._histories.pop(session_id, None)
+
+    def sweep(self) -> int:
+        """
+        Drop expired proposals and recommendations and idle sessions' messages.
+
+        Returns:
+            Number of entries removed
+        """
+        now = datetime.utcnow()
+        removed = 0
+
+        for key in [
+            k for k, p in self.proposals.items() if now > p.expires_at + PROPOSAL_RETENTION
+        ]:
+            del self.proposals[key]
+            removed += 1
+
+        for key in [
+            k for k, r in self.recommendations.items() if now > r.created_at + RECOMMENDATION_TTL
+        ]:
+            del self.recommendations[key]
+            removed += 1
+
+        idle_cutoff = time.monotonic() - get_settings().session_expire_hours * 3600
+        for key in [k for k, h in self._histories.items() if h.last_active < idle_cutoff]:
+            del self._histories[key]
+            removed += 1
+
+        if removed:
+            logger.info("Chat store sweep removed %d entries", removed)
+        return removed
+
+    async def run_sweeper(self, interval: float = CHAT_SWEEP_INTERVAL_SECONDS) -> None:
+        """Sweep every ``interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error("Chat store sweep failed: %s", e)
+
+    def stats(self) -> dict[str, int]:
+        """Get entry counts and the approximate size of stored messages."""
+        return {
+            "sessions": len(self._histories),
+            "messages": sum(len(h.messages) for h in self._histories.values()),
+            "message_bytes": sum(h.bytes for h in self._histories.values()),
+            "evicted_messages": self._evicted_messages,
+            "proposals": len(self.proposals),
+            "recommendations": len(self.recommendations),
+        }
+
+
+# Global chat store instance
+chat_store = ChatStore()
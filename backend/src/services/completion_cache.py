@@ -0,0 +1,211 @@
+"""Response cache for AI completions with an exact LRU tier and a similarity tier."""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Cached completions kept across all methods (least recently used are evicted)
+MAX_COMPLETION_CACHE_ENTRIES = 1000
+
+# Character n-gram size for the similarity tier
+SHINGLE_SIZE = 3
+
+
+@dataclass(frozen=True)
+class CompletionCachePolicy:
+    """How long a method's results stay valid and whether near-duplicates may reuse them."""
+
+    ttl_seconds: float
+    # Minimum Jaccard similarity of input shingles for a near-duplicate hit; None = exact only
+    similarity_threshold: float | None = None
+
+
+# Per-method policies. Only classification is safe to share between similar
+# inputs: "move X to done" and "move X to todo" are near-duplicates with
+# different answers, so status parsing and task generation are exact-only.
+COMPLETION_CACHE_POLICIES = {
+    "detect_feature_request_intent": CompletionCachePolicy(3600, similarity_threshold=0.85),
+    "parse_status_change_request": CompletionCachePolicy(300),
+    "generate_task_from_description": CompletionCachePolicy(900),
+}
+
+
+def normalize_input(text: str) -> str:
+    """Lowercase text and collapse whitespace."""
+    return " ".join(text.lower().split())
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> frozenset[str]:
+    """Character n-grams of normalized text."""
+    padded = f" {text} "
+    if len(padded) <= size:
+        return frozenset({padded})
+    return frozenset(padded[i : i + size] for i in range(len(padded) - size + 1))
+
+
+def fingerprint(*parts: Any) -> str:
+    """Short stable hash of prompt templates and context (template version + inputs)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    bucket: tuple[str, str]
+    shingles: frozenset[str]
+
+
+@dataclass
+class _MethodStats:
+    exact_hits: int = 0
+    similar_hits: int = 0
+    misses: int = 0
+
+
+class CompletionCache:
+    """
+    Caches parsed completion results per method, prompt version and input.
+
+    Entries are keyed by method, a fingerprint of the prompt template and
+    context (so editing a template or changing the context never serves
+    stale answers), and the normalized user input. Lookups first try an
+    exact LRU match, then, for methods whose policy allows it, the most
+    similar cached input in the same method and context.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = MAX_COMPLETION_CACHE_ENTRIES,
+        policies: dict[str, CompletionCachePolicy] | None = None,
+    ):
+        self._max_entries = max_entries
+        self._policies = dict(COMPLETION_CACHE_POLICIES if policies is None else policies)
+        self._entries: OrderedDict[tuple[str, str, str], _Entry] = OrderedDict()
+        # (method, context fingerprint) -> keys, scanned by the similarity tier
+        self._buckets: dict[tuple[str, str], set[tuple[str, str, str]]] = {}
+        self._stats: dict[str, _MethodStats] = {}
+
+    def get(self, method: str, user_input: str, context: str) -> tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            method: AIAgentService method name
+            user_input: Raw user input
+            context: Fingerprint of the prompt template and other prompt inputs
+
+        Returns:
+            (True, value) on a hit, (False, None) on a miss; cached values may be None
+        """
+        stats = self._stats.setdefault(method, _MethodStats())
+        policy = self._policies.get(method)
+        if policy is None:
+            stats.misses += 1
+            return False, None
+
+        now = time.monotonic()
+        normalized = normalize_input(user_input)
+        key = (method, context, normalized)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > now:
+                self._entries.move_to_end(key)
+                stats.exact_hits += 1
+                logger.debug("Completion cache hit for %s", method)
+                return True, entry.value
+            self._remove(key)
+
+        if policy.similarity_threshold is not None:
+            best_key, best_score = None, policy.similarity_threshold
+            query = shingles(normalized)
+            for candidate in list(self._buckets.get((method, context), ())):
+                candidate_entry = self._entries[candidate]
+                if candidate_entry.expires_at <= now:
+                    self._remove(candidate)
+                    continue
+                score = len(query & candidate_entry.shingles) / len(
+                    query | candidate_entry.shingles
+                )
+                if score >= best_score:
+                    best_key, best_score = candidate, score
+            if best_key is not None:
+                self._entries.move_to_end(best_key)
+                stats.similar_hits += 1
+                logger.debug(
+                    "Completion cache near-duplicate hit for %s (%.2f)", method, best_score
+                )
+                return True, self._entries[best_key].value
+
+        stats.misses += 1
+        return False, None
+
+    def set(self, method: str, user_input: str, context: str, value: Any) -> None:
+        """
+        Store a result (methods without a policy are not cached).
+
+        Args:
+            method: AIAgentService method name
+            user_input: Raw user input
+            context: Fingerprint of the prompt template and other prompt inputs
+            value: Parsed result to reuse
+        """
+        policy = self._policies.get(method)
+        if policy is None:
+            return
+
+        normalized = normalize_input(user_input)
+        key = (method, context, normalized)
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(
+            value=value,
+            expires_at=time.monotonic() + policy.ttl_seconds,
+            bucket=(method, context),
+            shingles=(
+                shingles(normalized) if policy.similarity_threshold is not None else frozenset()
+            ),
+        )
+        self._buckets.setdefault((method, context), set()).add(key)
+
+        while len(self._entries) > self._max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Hit counts and hit rate per method."""
+        result = {}
+        for method, stats in self._stats.items():
+            lookups = stats.exact_hits + stats.similar_hits + stats.misses
+            result[method] = {
+                "exact_hits": stats.exact_hits,
+                "similar_hits": stats.similar_hits,
+                "misses": stats.misses,
+                "hit_rate": (stats.exact_hits + stats.similar_hits) / lookups if lookups else 0.0,
+            }
+        return result
+
+    def clear(self) -> None:
+        """Drop all entries and statistics."""
+        self._entries.clear()
+        self._buckets.clear()
+        self._stats.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: tuple[str, str, str]) -> None:
+        entry = self._entries.pop(key)
+        bucket = self._buckets.get(entry.bucket)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[entry.bucket]
@@ -0,0 +1,66 @@
+"""Streaming compression for Server-Sent Events."""
+
+import zlib
+from collections.abc import AsyncIterator
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+# gzip container for zlib (window size 15, +16 selects the gzip header)
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def negotiate_stream_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Pick a content encoding for an event stream from an Accept-Encoding header.
+
+    Prefers brotli when the optional ``brotli`` package is installed, then gzip.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+
+    Returns:
+        "br", "gzip", or None for identity
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        accepted.add(coding.strip().lower())
+
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+async def compress_stream(chunks: AsyncIterator[str], encoding: str) -> AsyncIterator[bytes]:
+    """
+    Compress an event stream, flushing after every chunk.
+
+    Each chunk is flushed so the client can decode every event as soon as
+    it arrives, while the compression context keeps referencing earlier
+    events (repeated keys and values compress across events).
+
+    Args:
+        chunks: Encoded SSE events
+        encoding: "gzip" or "br"
+    """
+    if encoding == "br":
+        compressor = brotli.Compressor(mode=brotli.MODE_TEXT)
+        async for chunk in chunks:
+            yield compressor.process(chunk.encode()) + compressor.flush()
+        yield compressor.finish()
+        return
+
+    compressor = zlib.compressobj(wbits=GZIP_WBITS)
+    async for chunk in chunks:
+        yield compressor.compress(chunk.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
@@ -13,10 +13,14 @@ This provides a fallback mechanism in addition to webhooks.
 
 import asyncio
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from src.models.task import ProjectItemList
+from src.services.dedupe import BoundedDedupeSet
+from src.services.github_auth import github_auth_service
 from src.services.github_projects import github_projects_service
 
 logger = logging.getLogger(__name__)
@@ -27,6 +31,13 @@ class PollingState:
     """State tracking for the polling service."""
 
     is_running: bool = False
+    project_id: str | None = None
+    # GitHub user the polling runs for; it polls with that user's newest session token
+    github_user_id: str | None = None
+    # Token of the running sweep; cleared by stop_polling, never reported in status
+    access_token: str | None = None
+    # Incremented per started loop, so a loop stopped and replaced cannot resume
+    run: int = 0
     last_poll_time: datetime | None = None
     poll_count: int = 0
     errors_count: int = 0
@@ -37,8 +48,12 @@ class PollingState:
 # Global polling state
 _polling_state = PollingState()
 
+# Maximum processed issue/PR keys to remember
+MAX_PROCESSED_ISSUE_PRS = 1000
+
 # Track issues we've already processed to avoid duplicate updates
-_processed_issue_prs: set[str] = set()  # "issue_number:pr_number"
+# Keys: "issue_number:pr_number" or "copilot_review_requested:issue_number"
+_processed_issue_prs = BoundedDedupeSet(max_size=MAX_PROCESSED_ISSUE_PRS)
 
 
 async def check_in_progress_issues(
@@ -46,6 +61,7 @@ async def check_in_progress_issues(
     project_id: str,
     owner: str,
     repo: str,
+    is_active: Callable[[], bool] | None = None,
 ) -> list[dict[str, Any]]:
     """
     Check all issues in "In Progress" status for completed Copilot PRs.
@@ -55,6 +71,7 @@ async def check_in_progress_issues(
         project_id: GitHub Project V2 node ID
         owner: Repository owner (fallback if not in task)
         repo: Repository name (fallback if not in task)
+        is_active: Checked before each issue; the sweep ends once it returns False
 
     Returns:
         List of results for each processed issue
@@ -62,8 +79,10 @@ async def check_in_progress_issues(
     results = []
 
     try:
-        # Get all project items
-        tasks = await github_projects_service.get_project_items(access_token, project_id)
+        # Get only the items in the "In Progress" column
+        tasks = await github_projects_service.get_project_items_by_status(
+            access_token, project_id, ["In Progress"]
+        )
 
         # Filter to "In Progress" items with issue numbers
         in_progress_tasks = [
@@ -80,6 +99,10 @@ async def check_in_progress_issues(
         )
 
         for task in in_progress_tasks:
+            if is_active is not None and not is_active():
+                logger.info("Polling stopped, ending in-progress sweep")
+                break
+
             # Use task's repository info if available, otherwise fallback
             task_owner = task.repository_owner or owner
             task_repo = task.repository_name or repo
@@ -117,6 +140,7 @@ async def check_in_review_issues_for_copilot_review(
     project_id: str,
     owner: str,
     repo: str,
+    is_active: Callable[[], bool] | None = None,
 ) -> list[dict[str, Any]]:
     """
     Check all issues in "In Review" status to ensure Copilot has reviewed their PRs.
@@ -128,6 +152,7 @@ async def check_in_review_issues_for_copilot_review(
         project_id: GitHub Project V2 node ID
         owner: Repository owner
         repo: Repository name
+        is_active: Checked before each issue; the sweep ends once it returns False
 
     Returns:
         List of results for each processed issue
@@ -135,8 +160,10 @@ async def check_in_review_issues_for_copilot_review(
     results = []
 
     try:
-        # Get all project items
-        tasks = await github_projects_service.get_project_items(access_token, project_id)
+        # Get only the items in the "In Review" column
+        tasks = await github_projects_service.get_project_items_by_status(
+            access_token, project_id, ["In Review"]
+        )
 
         # Filter to "In Review" items with issue numbers
         in_review_tasks = [
@@ -151,6 +178,10 @@ async def check_in_review_issues_for_copilot_review(
         )
 
         for task in in_review_tasks:
+            if is_active is not None and not is_active():
+                logger.info("Polling stopped, ending in-review sweep")
+                break
+
             task_owner = task.repository_owner or owner
             task_repo = task.repository_name or repo
 
@@ -388,16 +419,9 @@ async def process_in_progress_issue(
         )
 
         if success:
-            # Mark as processed to avoid duplicate updates
+            # Mark as processed to avoid duplicate updates (oldest keys evicted first)
             _processed_issue_prs.add(cache_key)
 
-            # Limit cache size
-            if len(_processed_issue_prs) > 1000:
-                # Remove oldest entries
-                to_remove = list(_processed_issue_prs)[:500]
-                for key in to_remove:
-                    _processed_issue_prs.discard(key)
-
             logger.info(
                 "Successfully updated issue #%d to 'In Review' (PR #%d ready)",
                 issue_number,
@@ -467,6 +491,7 @@ async def poll_for_copilot_completion(
     owner: str,
     repo: str,
     interval_seconds: int = 60,
+    github_user_id: str | None = None,
 ) -> None:
     """
     Background polling loop to check for Copilot PR completions.
@@ -477,15 +502,39 @@ async def poll_for_copilot_completion(
         owner: Repository owner
         repo: Repository name
         interval_seconds: Polling interval in seconds (default: 60)
+        github_user_id: User the polling runs for; when set, each poll uses the
+            token of that user's newest session and polling stops once the
+            user has no sessions left
     """
     logger.info(
         "Starting Copilot PR completion polling (interval: %ds)",
         interval_seconds,
     )
 
+    _polling_state.run += 1
+    run = _polling_state.run
     _polling_state.is_running = True
+    _polling_state.project_id = project_id
+    _polling_state.github_user_id = github_user_id
+    _polling_state.access_token = access_token
+
+    def is_active() -> bool:
+        # False once stopped (token cleared) or replaced by a newer loop
+        return (
+            _polling_state.is_running
+            and _polling_state.run == run
+            and _polling_state.access_token is not None
+        )
+
+    while is_active():
+        if github_user_id is not None:
+            access_token = _owner_access_token(github_user_id)
+            if access_token is None:
+                logger.info("Stopping Copilot PR polling: user %s has no sessions", github_user_id)
+                stop_polling()
+                break
+        _polling_state.access_token = access_token
 
-    while _polling_state.is_running:
         try:
             _polling_state.last_poll_time = datetime.utcnow()
             _polling_state.poll_count += 1
@@ -498,6 +547,7 @@ async def poll_for_copilot_completion(
                 project_id=project_id,
                 owner=owner,
                 repo=repo,
+                is_active=is_active,
             )
 
             if results:
@@ -507,12 +557,17 @@ async def poll_for_copilot_completion(
                     len(results),
                 )
 
+            # Stopped during step 1: the token must not be used again
+            if not is_active():
+                break
+
             # Step 2: Check "In Review" issues to ensure Copilot has reviewed their PRs
             review_results = await check_in_review_issues_for_copilot_review(
                 access_token=access_token,
                 project_id=project_id,
                 owner=owner,
                 repo=repo,
+                is_active=is_active,
             )
 
             if review_results:
@@ -533,15 +588,31 @@ async def poll_for_copilot_completion(
     logger.info("Copilot PR completion polling stopped")
 
 
+def _owner_access_token(github_user_id: str) -> str | None:
+    """Get the access token of the user's most recently updated session."""
+    sessions = github_auth_service.get_user_sessions(github_user_id)
+    return sessions[0].access_token if sessions else None
+
+
 def stop_polling() -> None:
-    """Stop the background polling loop."""
+    """
+    Stop the background polling loop.
+
+    Runs without awaiting, so the owner's token is gone before any
+    in-flight sweep resumes; sweeps check ``is_running`` before each issue.
+    """
     _polling_state.is_running = False
+    _polling_state.project_id = None
+    _polling_state.github_user_id = None
+    _polling_state.access_token = None
 
 
 def get_polling_status() -> dict[str, Any]:
     """Get current polling status."""
     return {
         "is_running": _polling_state.is_running,
+        "project_id": _polling_state.project_id,
+        "github_user_id": _polling_state.github_user_id,
         "last_poll_time": (
             _polling_state.last_poll_time.isoformat() if _polling_state.last_poll_time else None
         ),
@@ -581,14 +652,12 @@ async def check_issue_for_copilot_completion(
     """
     try:
         # Find the project item for this issue
-        tasks = await github_projects_service.get_project_items(access_token, project_id)
+        tasks = await github_projects_service.get_project_items(
+            access_token, project_id, profile="summary"
+        )
 
-        # Find matching task by issue number
-        target_task = None
-        for task in tasks:
-            if task.issue_number == issue_number:
-                target_task = task
-                break
+        # Find matching task by issue number, preferring the given repository
+        target_task = ProjectItemList.of(tasks).get_by_issue(issue_number, owner, repo)
 
         if not target_task:
             return {
@@ -0,0 +1,169 @@
+"""Bounded, insertion-ordered dedupe set with TTL and optional persistence."""
+
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedDedupeSet:
+    """
+    Set of recently seen keys with O(1) insert, lookup and eviction.
+
+    Keys are kept in insertion order so that when the set is full the
+    oldest entry is evicted first. Entries older than ``ttl_seconds`` are
+    treated as absent and dropped lazily.
+
+    When persistence is enabled, every insert (and discard, as a tombstone)
+    is appended to a JSON-lines file so dedupe survives restarts. The file is compacted on load and
+    again whenever the number of appended lines reaches ``max_size``.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: float | None = None):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # key -> wall-clock insertion time (time.time())
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._persist_path: str | None = None
+        # Lines appended since the last compaction
+        self._appended = 0
+
+    def __contains__(self, key: object) -> bool:
+        seen_at = self._entries.get(key)  # type: ignore[arg-type]
+        if seen_at is None:
+            return False
+        if self._is_expired(seen_at, time.time()):
+            del self._entries[key]  # type: ignore[arg-type]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def add(self, key: str) -> bool:
+        """
+        Record a key as seen.
+
+        Args:
+            key: Key to record
+
+        Returns:
+            True if the key was newly added, False if it was already present
+        """
+        now = time.time()
+        if key in self:
+            return False
+
+        self._entries[key] = now
+        self._evict(now)
+
+        if self._persist_path:
+            if self._appended >= self.max_size:
+                self._rewrite()
+            else:
+                self._append({"key": key, "ts": now})
+
+        return True
+
+    def discard(self, key: str) -> None:
+        """Remove a key if present (persisted as a tombstone so it stays removed)."""
+        if self._entries.pop(key, None) is not None and self._persist_path:
+            self._append({"key": key, "del": True})
+
+    def clear(self) -> None:
+        """Remove all keys (persisted state is truncated as well)."""
+        self._entries.clear()
+        if self._persist_path:
+            self._rewrite()
+
+    def enable_persistence(self, path: str) -> int:
+        """
+        Persist inserts to ``path`` and load any previously recorded keys.
+
+        Args:
+            path: JSON-lines file used to store seen keys
+
+        Returns:
+            Number of keys restored from disk
+        """
+        self._persist_path = path
+        restored = self._load()
+        # Compact the log down to the live entries
+        self._rewrite()
+        logger.info("Restored %d dedupe keys from %s", restored, path)
+        return restored
+
+    # ──────────────────────────────────────────────────────────────────
+    # Internal helpers
+    # ──────────────────────────────────────────────────────────────────
+
+    def _is_expired(self, seen_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - seen_at > self.ttl_seconds
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries from the front and enforce the size bound."""
+        while self._entries:
+            oldest_at = next(iter(self._entries.values()))
+            if len(self._entries) > self.max_size or self._is_expired(oldest_at, now):
+                self._entries.popitem(last=False)
+            else:
+                break
+
+    def _load(self) -> int:
+        if not self._persist_path or not os.path.exists(self._persist_path):
+            return 0
+
+        now = time.time()
+        try:
+            with open(self._persist_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        key = record["key"]
+                        if record.get("del"):
+                            self._entries.pop(key, None)
+                            continue
+                        seen_at = float(record["ts"])
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        continue
+                    if self._is_expired(seen_at, now):
+                        continue
+                    self._entries.pop(key, None)
+                    self._entries[key] = seen_at
+        except OSError as e:
+            logger.warning("Failed to load dedupe state from %s: %s", self._persist_path, e)
+            return 0
+
+        self._evict(now)
+        return len(self._entries)
+
+    def _append(self, record: dict) -> None:
+        try:
+            with open(self._persist_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+            self._appended += 1
+        except OSError as e:
+            logger.warning("Failed to persist dedupe key to %s: %s", self._persist_path, e)
+
+    def _rewrite(self) -> None:
+        tmp_path = f"{self._persist_path}.tmp"
+        try:
+            directory = os.path.dirname(self._persist_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for key, seen_at in self._entries.items():
+                    f.write(json.dumps({"key": key, "ts": seen_at}) + "\n")
+            os.replace(tmp_path, self._persist_path)
+            self._appended = 0
+        except OSError as e:
+            logger.warning("Failed to compact dedupe state at %s: %s", self._persist_path, e)
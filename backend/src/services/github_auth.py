@@ -10,11 +10,19 @@ import httpx
 
 from src.config import get_settings
 from src.models.user import UserSession
+from src.services.session_store import SessionStore
 
 logger = logging.getLogger(__name__)
 
-# In-memory session storage (MVP)
-_sessions: dict[str, UserSession] = {}
+# OAuth states expire this long after the login started
+OAUTH_STATE_TTL = timedelta(minutes=10)
+
+# Pending OAuth states kept at most; the oldest (abandoned) logins are dropped first
+MAX_PENDING_OAUTH_STATES = 10_000
+
+# Sessions by ID, expiring session_expire_hours after their last update
+_sessions = SessionStore()
+# state -> creation time, in insertion (= creation) order
 _oauth_states: dict[str, datetime] = {}
 
 GITHUB_AUTHORIZE_URL = "https://github.com/login/oauth/authorize"
@@ -22,6 +30,16 @@ GITHUB_TOKEN_URL = "https://github.com/login/oauth/access_token"
 GITHUB_USER_API_URL = "https://api.github.com/user"
 
 
+def _prune_oauth_states(now: datetime) -> None:
+    """Drop expired states of abandoned logins and enforce the size bound."""
+    while _oauth_states:
+        state, created_at = next(iter(_oauth_states.items()))
+        if len(_oauth_states) >= MAX_PENDING_OAUTH_STATES or now - created_at >= OAUTH_STATE_TTL:
+            del _oauth_states[state]
+        else:
+            break
+
+
 class GitHubAuthService:
     """Service for GitHub OAuth authentication."""
 
@@ -41,7 +59,9 @@ class GitHubAuthService:
             Tuple of (authorization_url, state)
         """
         state = secrets.token_urlsafe(32)
-        _oauth_states[state] = datetime.now(UTC)
+        now = datetime.now(UTC)
+        _prune_oauth_states(now)
+        _oauth_states[state] = now
 
         params = {
             "client_id": self.settings.github_client_id,
@@ -67,8 +87,7 @@ class GitHubAuthService:
             return False
 
         created_at = _oauth_states.pop(state)
-        # State expires after 10 minutes
-        return datetime.now(UTC) - created_at < timedelta(minutes=10)
+        return datetime.now(UTC) - created_at < OAUTH_STATE_TTL
 
     async def exchange_code_for_token(self, code: str) -> dict:
         """
@@ -152,6 +171,7 @@ class GitHubAuthService:
             access_token=access_token,
             refresh_token=refresh_token,
             token_expires_at=token_expires_at,
+            token_scope=token_data.get("scope"),
         )
 
         # Store session
@@ -194,12 +214,13 @@ class GitHubAuthService:
         # Update session
         session.access_token = token_data["access_token"]
         session.refresh_token = token_data.get("refresh_token", session.refresh_token)
+        session.token_scope = token_data.get("scope", session.token_scope)
 
         expires_in = token_data.get("expires_in")
         if expires_in:
-            session.token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+            session.token_expires_at = datetime.now(UTC) + timedelta(seconds=expires_in)
 
-        session.updated_at = datetime.utcnow()
+        session.updated_at = datetime.now(UTC)
         _sessions[str(session.session_id)] = session
 
         logger.info("Refreshed token for user %s", session.github_username)
@@ -244,7 +265,7 @@ class GitHubAuthService:
             session_id: Session ID to lookup
 
         Returns:
-            User session or None if not found
+            User session or None if not found or expired
         """
         return _sessions.get(str(session_id))
 
@@ -258,6 +279,18 @@ class GitHubAuthService:
         session.updated_at = datetime.now(UTC)
         _sessions[str(session.session_id)] = session
 
+    def get_user_sessions(self, github_user_id: str) -> list[UserSession]:
+        """
+        Get all live sessions of a GitHub user.
+
+        Args:
+            github_user_id: GitHub user ID
+
+        Returns:
+            The user's sessions, most recently updated first
+        """
+        return _sessions.sessions_for_user(github_user_id)
+
     def revoke_session(self, session_id: str | UUID) -> bool:
         """
         Revoke and remove session.
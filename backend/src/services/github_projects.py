@@ -7,7 +7,9 @@ from datetime import datetime
 import httpx
 
 from src.models.project import GitHubProject, ProjectType, StatusColumn
-from src.models.task import Task
+from src.models.task import ProjectItem, ProjectItemList
+from src.prompts.budget import estimate_tokens, fit_comments, truncate_to_tokens
+from src.services.cache import cache, get_project_items_by_status_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -78,60 +80,123 @@ query($login: String!, $first: Int!) {
 }
 """
 
-GET_PROJECT_ITEMS_QUERY = """
-query($projectId: ID!, $first: Int!, $after: String) {
-  node(id: $projectId) {
-    ... on ProjectV2 {
-      items(first: $first, after: $after) {
-        pageInfo {
+# Item query profiles, from leanest to richest:
+#   summary - ids, number, title, status and repository (polling and diffing)
+#   board   - summary plus bodies (task lists and the real-time board)
+#   full    - board plus assignees
+PROJECT_ITEMS_PROFILES = ("summary", "board", "full")
+
+_ITEM_REPOSITORY_FIELDS = """
+              repository {
+                owner {
+                  login
+                }
+                name
+              }"""
+_ITEM_BODY_FIELDS = """
+              body"""
+_ITEM_ASSIGNEE_FIELDS = """
+              assignees(first: 10) {
+                nodes {
+                  login
+                }
+              }"""
+
+
+def build_project_items_query(profile: str = "board", filtered: bool = False) -> str:
+    """
+    Build the paginated project items query for a profile.
+
+    Args:
+        profile: One of PROJECT_ITEMS_PROFILES
+        filtered: Add a ``$filter`` variable passed as the Projects ``query:`` filter
+
+    Returns:
+        GraphQL query string
+    """
+    if profile not in PROJECT_ITEMS_PROFILES:
+        raise ValueError(f"Unknown project items profile: {profile}")
+
+    extra = ""
+    if profile in ("board", "full"):
+        extra += _ITEM_BODY_FIELDS
+    if profile == "full":
+        extra += _ITEM_ASSIGNEE_FIELDS
+
+    filter_variable = ", $filter: String!" if filtered else ""
+    filter_argument = ", query: $filter" if filtered else ""
+
+    return f"""
+query($projectId: ID!, $first: Int!, $after: String{filter_variable}) {{
+  node(id: $projectId) {{
+    ... on ProjectV2 {{
+      items(first: $first, after: $after{filter_argument}) {{
+        pageInfo {{
           hasNextPage
           endCursor
-        }
-        nodes {
+        }}
+        nodes {{
           id
-          fieldValueByName(name: "Status") {
-            ... on ProjectV2ItemFieldSingleSelectValue {
+          fieldValueByName(name: "Status") {{
+            ... on ProjectV2ItemFieldSingleSelectValue {{
               name
               optionId
-            }
-          }
-          content {
-            ... on DraftIssue {
-              title
-              body
-            }
-            ... on Issue {
+            }}
+          }}
+          content {{
+            ... on DraftIssue {{
+              title{extra}
+            }}
+            ... on Issue {{
               id
               number
-              title
-              body
-              repository {
-                owner {
-                  login
-                }
-                name
-              }
-            }
-            ... on PullRequest {
+              title{extra}{_ITEM_REPOSITORY_FIELDS}
+            }}
+            ... on PullRequest {{
               id
               number
-              title
-              body
-              repository {
-                owner {
-                  login
-                }
-                name
-              }
-            }
-          }
-        }
-      }
-    }
-  }
-}
+              title{extra}{_ITEM_REPOSITORY_FIELDS}
+            }}
+          }}
+        }}
+      }}
+    }}
+  }}
+}}
 """
 
+
+PROJECT_ITEMS_QUERIES = {
+    profile: build_project_items_query(profile) for profile in PROJECT_ITEMS_PROFILES
+}
+
+FILTERED_PROJECT_ITEMS_QUERIES = {
+    profile: build_project_items_query(profile, filtered=True) for profile in PROJECT_ITEMS_PROFILES
+}
+
+GET_PROJECT_ITEMS_QUERY = PROJECT_ITEMS_QUERIES["board"]
+
+# Status-filtered results back frequent sweeps; keep them short-lived
+STATUS_FILTER_CACHE_TTL_SECONDS = 15
+
+# Token budgets of issue context handed to a custom agent
+ISSUE_CONTEXT_MAX_TOKENS = 8000
+ISSUE_BODY_MAX_TOKENS = 3000
+ISSUE_COMMENT_MAX_TOKENS = 1000
+
+
+def build_status_filter(statuses: list[str]) -> str:
+    """Build a Projects filter query matching any of the given status names."""
+    values = ",".join('"{}"'.format(status.replace('"', "")) for status in statuses)
+    return f"status:{values}"
+
+
+def is_unsupported_filter_error(error: ValueError) -> bool:
+    """Whether a GraphQL error says the items connection has no ``query`` argument."""
+    message = str(error).lower()
+    return "'query'" in message and "argument" in message
+
+
 CREATE_DRAFT_ITEM_MUTATION = """
 mutation($projectId: ID!, $title: String!, $body: String) {
   addProjectV2DraftIssue(input: {projectId: $projectId, title: $title, body: $body}) {
@@ -530,12 +595,110 @@ mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $text: String!) {
 }
 """
 
+# Standard metadata fields (project field name -> metadata key, field type)
+METADATA_FIELD_MAPPINGS = {
+    "Priority": ("priority", "select"),
+    "Size": ("size", "select"),
+    "Estimate": ("estimate_hours", "number"),
+    "Start date": ("start_date", "date"),
+    "Target date": ("target_date", "date"),
+}
+
+# Aliased mutations sent per GraphQL request by the batch methods
+BULK_MUTATION_BATCH_SIZE = 25
+
+
+def build_add_items_mutation(count: int) -> str:
+    """
+    Build a mutation adding ``count`` issues to a project, aliased ``add0``..``addN``.
+
+    Args:
+        count: Number of issues (variables ``$content0``.. hold their node IDs)
+
+    Returns:
+        GraphQL mutation string
+    """
+    variables = "".join(f", $content{i}: ID!" for i in range(count))
+    mutations = "".join(f"""
+  add{i}: addProjectV2ItemById(input: {{projectId: $projectId, contentId: $content{i}}}) {{
+    item {{
+      id
+    }}
+  }}""" for i in range(count))
+    return f"mutation($projectId: ID!{variables}) {{{mutations}\n}}"
+
+
+def build_update_fields_mutation(count: int) -> str:
+    """
+    Build a mutation setting ``count`` item field values, aliased ``update0``..``updateN``.
+
+    Args:
+        count: Number of updates (variables ``$item``/``$field``/``$value`` + index)
+
+    Returns:
+        GraphQL mutation string
+    """
+    variables = "".join(
+        f", $item{i}: ID!, $field{i}: ID!, $value{i}: ProjectV2FieldValue!" for i in range(count)
+    )
+    mutations = "".join(f"""
+  update{i}: updateProjectV2ItemFieldValue(
+    input: {{projectId: $projectId, itemId: $item{i}, fieldId: $field{i}, value: $value{i}}}
+  ) {{
+    projectV2Item {{
+      id
+    }}
+  }}""" for i in range(count))
+    return f"mutation($projectId: ID!{variables}) {{{mutations}\n}}"
+
+
+def build_field_value(
+    field_info: dict, value: str | float, field_type: str = "auto"
+) -> dict | None:
+    """
+    Convert a value to the ProjectV2FieldValue input for a project field.
+
+    Args:
+        field_info: Field from get_project_fields (id, dataType, options)
+        value: Value to set (option name for select fields)
+        field_type: Type hint: "select", "number", "date", "text", or "auto" to detect
+
+    Returns:
+        The field value input, or None if the option or field type is unknown
+    """
+    data_type = field_info.get("dataType", "")
+    if data_type == "SINGLE_SELECT" or field_type == "select":
+        for opt in field_info.get("options", []):
+            if opt.get("name", "").upper() == str(value).upper():
+                return {"singleSelectOptionId": opt.get("id")}
+        return None
+    if data_type == "NUMBER" or field_type == "number":
+        return {"number": float(value)}
+    if data_type == "DATE" or field_type == "date":
+        return {"date": str(value)}
+    if data_type == "TEXT" or field_type == "text":
+        return {"text": str(value)}
+    return None
+
+
+def is_auth_error(error: Exception) -> bool:
+    """Whether GitHub rejected the request's access token (expired or revoked)."""
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response is not None
+        and error.response.status_code == 401
+    )
+
 
 class GitHubProjectsService:
     """Service for interacting with GitHub Projects V2 API."""
 
     def __init__(self):
         self._client = httpx.AsyncClient(timeout=30.0)
+        # Bytes downloaded for the most recent GraphQL response, for payload accounting
+        self.last_response_bytes = 0
+        # Cleared if the API rejects the Projects items ``query:`` filter
+        self._status_filter_supported = True
 
     async def close(self):
         """Close HTTP client."""
@@ -635,6 +798,46 @@ class GitHubProjectsService:
         Returns:
             GraphQL response data
         """
+        result = await self._post_graphql(access_token, query, variables, extra_headers)
+
+        if "errors" in result:
+            error_msg = "; ".join(e.get("message", str(e)) for e in result["errors"])
+            raise ValueError(f"GraphQL error: {error_msg}")
+
+        return result.get("data", {})
+
+    async def _graphql_batch(
+        self, access_token: str, query: str, variables: dict
+    ) -> tuple[dict, dict[str, str]]:
+        """
+        Execute an aliased GraphQL mutation whose aliases may fail independently.
+
+        Args:
+            access_token: GitHub OAuth access token
+            query: GraphQL mutation with top-level aliases
+            variables: Mutation variables
+
+        Returns:
+            Tuple of (response data, error messages by failed alias)
+
+        Raises:
+            ValueError: If an error is not tied to an alias (the request failed as a whole)
+        """
+        result = await self._post_graphql(access_token, query, variables)
+
+        errors: dict[str, str] = {}
+        for error in result.get("errors") or []:
+            path = error.get("path") or []
+            if not path:
+                raise ValueError(f"GraphQL error: {error.get('message', str(error))}")
+            errors.setdefault(str(path[0]), error.get("message", str(error)))
+
+        return result.get("data") or {}, errors
+
+    async def _post_graphql(
+        self, access_token: str, query: str, variables: dict, extra_headers: dict | None = None
+    ) -> dict:
+        """Send a GraphQL request and return the raw response body (data and errors)."""
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Accept": "application/vnd.github+json",
@@ -649,13 +852,8 @@ class GitHubProjectsService:
             headers=headers,
         )
         response.raise_for_status()
-        result = response.json()
-
-        if "errors" in result:
-            error_msg = "; ".join(e.get("message", str(e)) for e in result["errors"])
-            raise ValueError(f"GraphQL error: {error_msg}")
-
-        return result.get("data", {})
+        self.last_response_bytes = response.num_bytes_downloaded
+        return response.json()
 
     async def list_user_projects(
         self, access_token: str, username: str, limit: int = 20
@@ -768,8 +966,8 @@ class GitHubProjectsService:
         return projects
 
     async def get_project_items(
-        self, access_token: str, project_id: str, limit: int = 100
-    ) -> list[Task]:
+        self, access_token: str, project_id: str, limit: int = 100, profile: str = "board"
+    ) -> ProjectItemList:
         """
         Get items (tasks) from a project with pagination support.
 
@@ -777,20 +975,120 @@ class GitHubProjectsService:
             access_token: GitHub OAuth access token
             project_id: GitHub Project V2 node ID
             limit: Maximum number of items per page (default 100)
+            profile: Query profile ("summary" skips bodies; see PROJECT_ITEMS_PROFILES)
 
         Returns:
-            List of Task objects
+            ProjectItemList of records, indexed for lookups (convert with
+            ``to_task()`` for API responses)
         """
+        query = PROJECT_ITEMS_QUERIES.get(profile)
+        if query is None:
+            raise ValueError(f"Unknown project items profile: {profile}")
+
+        all_tasks, response_bytes = await self._fetch_project_items(
+            access_token, project_id, query, {}, limit
+        )
+
+        logger.info(
+            "Fetched %d total tasks from project %s (%s profile, %d response bytes)",
+            len(all_tasks),
+            project_id,
+            profile,
+            response_bytes,
+        )
+        return ProjectItemList(all_tasks)
+
+    async def get_project_items_by_status(
+        self,
+        access_token: str,
+        project_id: str,
+        statuses: list[str],
+        profile: str = "summary",
+        limit: int = 100,
+    ) -> ProjectItemList:
+        """
+        Get only the project items in the given status columns.
+
+        Filters on GitHub with the Projects ``query:`` argument, so the
+        payload scales with the matching items instead of the board size.
+        Falls back to fetching all items and filtering locally if the API
+        rejects the filter. Results are cached briefly under their own key.
+
+        Args:
+            access_token: GitHub OAuth access token
+            project_id: GitHub Project V2 node ID
+            statuses: Status column names to include (case-insensitive)
+            profile: Query profile (default "summary")
+            limit: Maximum number of items per page
+
+        Returns:
+            List of ProjectItem records whose status is one of ``statuses``
+        """
+        query = FILTERED_PROJECT_ITEMS_QUERIES.get(profile)
+        if query is None:
+            raise ValueError(f"Unknown project items profile: {profile}")
+
+        cache_key = get_project_items_by_status_cache_key(project_id, statuses, profile)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        items = None
+        if self._status_filter_supported:
+            try:
+                items, response_bytes = await self._fetch_project_items(
+                    access_token,
+                    project_id,
+                    query,
+                    {"filter": build_status_filter(statuses)},
+                    limit,
+                )
+                logger.debug(
+                    "Fetched %d items in %s from project %s (%d response bytes)",
+                    len(items),
+                    statuses,
+                    project_id,
+                    response_bytes,
+                )
+            except ValueError as e:
+                if is_unsupported_filter_error(e):
+                    logger.warning(
+                        "Project item filtering not available, filtering locally instead: %s", e
+                    )
+                    self._status_filter_supported = False
+                else:
+                    logger.warning("Filtered item fetch failed, filtering locally: %s", e)
+
+        if items is None:
+            items = await self.get_project_items(access_token, project_id, limit, profile)
+
+        # Always apply the exact match locally; the server filter is only a pre-filter
+        items = ProjectItemList(ProjectItemList.of(items).with_status(*statuses))
+
+        cache.set(cache_key, items, ttl_seconds=STATUS_FILTER_CACHE_TTL_SECONDS)
+        return items
+
+    async def _fetch_project_items(
+        self,
+        access_token: str,
+        project_id: str,
+        query: str,
+        variables: dict,
+        limit: int,
+    ) -> tuple[list[ProjectItem], int]:
+        """Page through a project items query; returns (items, response bytes)."""
         all_tasks = []
         has_next_page = True
         after = None
+        response_bytes = 0
 
         while has_next_page:
             data = await self._graphql(
                 access_token,
-                GET_PROJECT_ITEMS_QUERY,
-                {"projectId": project_id, "first": limit, "after": after},
+                query,
+                {"projectId": project_id, "first": limit, "after": after, **variables},
             )
+            response_bytes += self.last_response_bytes
 
             node = data.get("node")
             if not node:
@@ -799,37 +1097,15 @@ class GitHubProjectsService:
             items_data = node.get("items", {})
             items = items_data.get("nodes", [])
             page_info = items_data.get("pageInfo", {})
+            fetched_at = datetime.utcnow()
 
             for item in items:
                 if not item:
                     continue
 
-                content = item.get("content", {})
-                if not content:
-                    continue
-
-                status_value = item.get("fieldValueByName", {})
-
-                # Extract repository info if available
-                repo_info = content.get("repository", {})
-                repo_owner = repo_info.get("owner", {}).get("login") if repo_info else None
-                repo_name = repo_info.get("name") if repo_info else None
-
-                all_tasks.append(
-                    Task(
-                        project_id=project_id,
-                        github_item_id=item["id"],
-                        github_content_id=content.get("id"),
-                        github_issue_id=content.get("id") if content.get("number") else None,
-                        issue_number=content.get("number"),
-                        repository_owner=repo_owner,
-                        repository_name=repo_name,
-                        title=content.get("title", "Untitled"),
-                        description=content.get("body"),
-                        status=status_value.get("name", "Todo") if status_value else "Todo",
-                        status_option_id=status_value.get("optionId", "") if status_value else "",
-                    )
-                )
+                record = ProjectItem.from_node(project_id, item, fetched_at)
+                if record:
+                    all_tasks.append(record)
 
             has_next_page = page_info.get("hasNextPage", False)
             after = page_info.get("endCursor")
@@ -838,8 +1114,7 @@ class GitHubProjectsService:
             if not after:
                 break
 
-        logger.info("Fetched %d total tasks from project %s", len(all_tasks), project_id)
-        return all_tasks
+        return all_tasks, response_bytes
 
     async def create_draft_item(
         self, access_token: str, project_id: str, title: str, description: str | None = None
@@ -975,6 +1250,93 @@ class GitHubProjectsService:
         logger.info("Added issue %s to project, item_id: %s", issue_node_id, item_id)
         return item_id
 
+    async def add_issues_to_project(
+        self,
+        access_token: str,
+        project_id: str,
+        issue_node_ids: list[str],
+    ) -> list[str | None]:
+        """
+        Add several issues to a project with aliased mutations.
+
+        Up to BULK_MUTATION_BATCH_SIZE issues are added per request; one
+        issue failing does not fail the others.
+
+        Args:
+            access_token: GitHub OAuth access token
+            project_id: GitHub Project V2 node ID
+            issue_node_ids: GitHub Issue node IDs
+
+        Returns:
+            Project item ID for each issue, in order (None where adding failed)
+        """
+        item_ids: list[str | None] = []
+        for start in range(0, len(issue_node_ids), BULK_MUTATION_BATCH_SIZE):
+            batch = issue_node_ids[start : start + BULK_MUTATION_BATCH_SIZE]
+            variables = {"projectId": project_id}
+            variables.update({f"content{i}": node_id for i, node_id in enumerate(batch)})
+
+            data, errors = await self._graphql_batch(
+                access_token, build_add_items_mutation(len(batch)), variables
+            )
+            for i, node_id in enumerate(batch):
+                item_id = ((data.get(f"add{i}") or {}).get("item") or {}).get("id")
+                if not item_id:
+                    logger.warning(
+                        "Failed to add issue %s to project: %s",
+                        node_id,
+                        errors.get(f"add{i}", "no item returned"),
+                    )
+                item_ids.append(item_id or None)
+
+        logger.info(
+            "Added %d/%d issues to project %s",
+            sum(1 for item_id in item_ids if item_id),
+            len(issue_node_ids),
+            project_id,
+        )
+        return item_ids
+
+    async def set_item_field_values(
+        self,
+        access_token: str,
+        project_id: str,
+        updates: list[tuple[str, str, dict]],
+    ) -> list[bool]:
+        """
+        Set several project item field values with aliased mutations.
+
+        Args:
+            access_token: GitHub OAuth access token
+            project_id: GitHub Project V2 node ID
+            updates: (item ID, field ID, value from build_field_value) tuples
+
+        Returns:
+            Whether each update succeeded, in order
+        """
+        results: list[bool] = []
+        for start in range(0, len(updates), BULK_MUTATION_BATCH_SIZE):
+            batch = updates[start : start + BULK_MUTATION_BATCH_SIZE]
+            variables = {"projectId": project_id}
+            for i, (item_id, field_id, value) in enumerate(batch):
+                variables.update({f"item{i}": item_id, f"field{i}": field_id, f"value{i}": value})
+
+            data, errors = await self._graphql_batch(
+                access_token, build_update_fields_mutation(len(batch)), variables
+            )
+            for i, (item_id, field_id, _) in enumerate(batch):
+                success = bool(data.get(f"update{i}")) and f"update{i}" not in errors
+                if not success:
+                    logger.warning(
+                        "Failed to set field %s on item %s: %s",
+                        field_id,
+                        item_id,
+                        errors.get(f"update{i}", "no item returned"),
+                    )
+                results.append(success)
+
+        return results
+
     async def assign_issue(
         self,
         access_token: str,
@@ -1119,6 +1481,11 @@ class GitHubProjectsService:
         """
         Format issue details (title, body, comments) as a prompt for the custom agent.
 
+        The result is kept within ISSUE_CONTEXT_MAX_TOKENS: long bodies and
+        comments are cut, and when a thread is still too long the first
+        comment and the most recent ones are kept and the rest are noted
+        as omitted.
+
         Args:
             issue_data: Dict with title, body, and comments from get_issue_with_comments
 
@@ -1135,19 +1502,36 @@ class GitHubProjectsService:
         # Add description/body
         body = issue_data.get("body", "")
         if body:
+            body = truncate_to_tokens(body, ISSUE_BODY_MAX_TOKENS)
             parts.append(f"## Issue Description\n{body}")
 
         # Add comments/discussions
         comments = issue_data.get("comments", [])
+        omitted = 0
         if comments:
             parts.append("## Comments and Discussion")
+            formatted = []
             for idx, comment in enumerate(comments, 1):
                 author = comment.get("author", "unknown")
                 comment_body = comment.get("body", "")
                 created_at = comment.get("created_at", "")
-                parts.append(f"### Comment {idx} by @{author} ({created_at})\n{comment_body}")
-
-        return "\n\n".join(parts)
+                formatted.append(f"### Comment {idx} by @{author} ({created_at})\n{comment_body}")
+
+            remaining = ISSUE_CONTEXT_MAX_TOKENS - sum(estimate_tokens(part) for part in parts)
+            kept, omitted = fit_comments(formatted, remaining, ISSUE_COMMENT_MAX_TOKENS)
+            if omitted:
+                note = f"_{omitted} earlier comment(s) omitted to fit the prompt budget._"
+                kept.insert(1 if kept else 0, note)
+            parts.extend(kept)
+
+        prompt = "\n\n".join(parts)
+        logger.debug(
+            "Issue context prompt: ~%d tokens, %d of %d comments",
+            estimate_tokens(prompt),
+            len(comments) - omitted,
+            len(comments),
+        )
+        return prompt
 
     async def assign_copilot_to_issue(
         self,
@@ -1446,6 +1830,7 @@ class GitHubProjectsService:
         project_id: str,
         item_id: str,
         status_name: str,
+        fields: dict[str, dict] | None = None,
     ) -> bool:
         """
         Update an item's status by status name (helper method).
@@ -1455,18 +1840,22 @@ class GitHubProjectsService:
             project_id: GitHub Project V2 node ID
             item_id: Project item node ID
             status_name: Status name (e.g., "Ready", "In Progress")
+            fields: Project fields from get_project_fields, to skip looking up the Status field
 
         Returns:
             True if update succeeded
         """
-        # Get project field info
-        data = await self._graphql(
-            access_token,
-            GET_PROJECT_FIELD_QUERY,
-            {"projectId": project_id},
-        )
+        if fields and "Status" in fields:
+            field_data = fields["Status"]
+        else:
+            # Get project field info
+            data = await self._graphql(
+                access_token,
+                GET_PROJECT_FIELD_QUERY,
+                {"projectId": project_id},
+            )
+            field_data = data.get("node", {}).get("field", {})
 
-        field_data = data.get("node", {}).get("field", {})
         field_id = field_data.get("id")
         options = field_data.get("options", [])
 
@@ -1553,6 +1942,7 @@ class GitHubProjectsService:
         field_name: str,
         value: str | float,
         field_type: str = "auto",
+        fields: dict[str, dict] | None = None,
     ) -> bool:
         """
         Update a project item's field value.
@@ -1564,13 +1954,15 @@ class GitHubProjectsService:
             field_name: Name of the field to update
             value: Value to set (string for select/text, float for number, date string for date)
             field_type: Type hint: "select", "number", "date", "text", or "auto" to detect
+            fields: Project fields from get_project_fields (fetched when not given)
 
         Returns:
             True if update succeeded
         """
         try:
             # Get project fields
-            fields = await self.get_project_fields(access_token, project_id)
+            if fields is None:
+                fields = await self.get_project_fields(access_token, project_id)
             field_info = fields.get(field_name)
 
             if not field_info:
@@ -1658,42 +2050,41 @@ class GitHubProjectsService:
         project_id: str,
         item_id: str,
         metadata: dict,
+        fields: dict[str, dict] | None = None,
     ) -> dict[str, bool]:
         """
         Set multiple metadata fields on a project item.
 
+        The project's fields are looked up once and the fields are updated
+        concurrently.
+
         Args:
             access_token: GitHub OAuth access token
             project_id: GitHub Project V2 node ID
             item_id: Project item node ID
             metadata: Dict with keys like priority, size, estimate_hours, start_date, target_date
+            fields: Project fields from get_project_fields (fetched when not given)
 
         Returns:
             Dict mapping field names to success status
         """
-        results = {}
+        if fields is None:
+            fields = await self.get_project_fields(access_token, project_id)
 
-        # Standard field mappings (project field name -> metadata key)
-        field_mappings = {
-            "Priority": ("priority", "select"),
-            "Size": ("size", "select"),
-            "Estimate": ("estimate_hours", "number"),
-            "Start date": ("start_date", "date"),
-            "Target date": ("target_date", "date"),
+        updates = {
+            field_name: self.update_project_item_field(
+                access_token=access_token,
+                project_id=project_id,
+                item_id=item_id,
+                field_name=field_name,
+                value=metadata[meta_key],
+                field_type=field_type,
+                fields=fields,
+            )
+            for field_name, (meta_key, field_type) in METADATA_FIELD_MAPPINGS.items()
+            if metadata.get(meta_key)
         }
-
-        for field_name, (meta_key, field_type) in field_mappings.items():
-            value = metadata.get(meta_key)
-            if value:
-                success = await self.update_project_item_field(
-                    access_token=access_token,
-                    project_id=project_id,
-                    item_id=item_id,
-                    field_name=field_name,
-                    value=value,
-                    field_type=field_type,
-                )
-                results[field_name] = success
+        results = dict(zip(updates, await asyncio.gather(*updates.values()), strict=True))
 
         logger.info("Set metadata fields: %s", results)
         return results
@@ -2161,7 +2552,7 @@ class GitHubProjectsService:
         self,
         access_token: str,
         project_id: str,
-        cached_tasks: list[Task],
+        cached_tasks: list[ProjectItem],
         ready_status: str = "Ready",
         in_progress_status: str = "In Progress",
     ) -> dict:
@@ -2181,7 +2572,8 @@ class GitHubProjectsService:
             - 'current_tasks': updated task list
             - 'workflow_triggers': tasks that need workflow processing
         """
-        current_tasks = await self.get_project_items(access_token, project_id)
+        # Diffing only looks at status and title, so skip bodies
+        current_tasks = await self.get_project_items(access_token, project_id, profile="summary")
         changes = self._detect_changes(cached_tasks, current_tasks)
 
         # T041: Detect tasks that need workflow processing
@@ -2224,7 +2616,9 @@ class GitHubProjectsService:
             "workflow_triggers": workflow_triggers,
         }
 
-    def _detect_changes(self, old_tasks: list[Task], new_tasks: list[Task]) -> list[dict]:
+    def _detect_changes(
+        self, old_tasks: list[ProjectItem], new_tasks: list[ProjectItem]
+    ) -> list[dict]:
         """
         Compare two task lists and detect changes.
 
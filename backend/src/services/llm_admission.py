@@ -0,0 +1,211 @@
+"""Admission control for AI completions shared by all chat sessions."""
+
+import asyncio
+import bisect
+import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# Priorities, most urgent first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# Window of the tokens-per-minute budget
+TOKEN_WINDOW_SECONDS = 60.0
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is unbounded
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class LatencyHistogram:
+    """Counts of observed durations per latency bucket."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self._bounds = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration."""
+        self._counts[bisect.bisect_left(self._bounds, seconds)] += 1
+        self._count += 1
+        self._sum += seconds
+
+    def snapshot(self) -> dict:
+        """Get count, mean and per-bucket counts (keyed by upper bound in ms)."""
+        labels = [f"le_{bound * 1000:g}ms" for bound in self._bounds] + ["inf"]
+        return {
+            "count": self._count,
+            "mean_ms": round(self._sum / self._count * 1000, 1) if self._count else 0.0,
+            "buckets": dict(zip(labels, self._counts, strict=True)),
+        }
+
+
+@dataclass(eq=False)
+class _Request:
+    session_key: str
+    priority: int
+    tokens: int
+    enqueued_at: float
+    admitted: asyncio.Future = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+
+
+class AdmissionController:
+    """
+    Decides when each AI completion may start.
+
+    A completion starts only while fewer than ``max_concurrency`` run and
+    its estimated tokens fit the tokens-per-minute budget (a request larger
+    than the whole budget starts once the window is empty). Waiting
+    requests are served by priority, then round-robin across sessions, then
+    in arrival order within a session, so one busy session cannot starve
+    the others. Admission is strictly in that order: a request that does
+    not fit the budget holds back the ones behind it.
+    """
+
+    def __init__(self, max_concurrency: int, tokens_per_minute: int = 0):
+        """
+        Create the controller.
+
+        Args:
+            max_concurrency: Completions allowed to run at once
+            tokens_per_minute: Token budget per minute (0 = unlimited)
+        """
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self._running = 0
+        # priority -> session -> waiting requests; sessions rotate to the end when served
+        self._queues: dict[int, OrderedDict[str, deque[_Request]]] = {}
+        self._window: deque[tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self._retry: asyncio.TimerHandle | None = None
+        self.queue_wait = LatencyHistogram()
+        self.completion_latency = LatencyHistogram()
+
+    @asynccontextmanager
+    async def admit(
+        self, session_key: str = "", priority: int = PRIORITY_INTERACTIVE, tokens: int = 0
+    ) -> AsyncIterator[None]:
+        """
+        Wait for admission and hold a slot for the duration of the block.
+
+        Args:
+            session_key: Session the completion is for (fairness unit)
+            priority: PRIORITY_INTERACTIVE or PRIORITY_BACKGROUND
+            tokens: Estimated prompt plus completion tokens
+        """
+        request = _Request(session_key, priority, tokens, time.monotonic())
+        self._queues.setdefault(priority, OrderedDict()).setdefault(session_key, deque()).append(
+            request
+        )
+        self._dispatch()
+
+        try:
+            await request.admitted
+        except asyncio.CancelledError:
+            if request.admitted.done() and not request.admitted.cancelled():
+                self._release()
+            else:
+                self._discard(request)
+            raise
+
+        started = time.monotonic()
+        self.queue_wait.observe(started - request.enqueued_at)
+        try:
+            yield
+        finally:
+            self.completion_latency.observe(time.monotonic() - started)
+            self._release()
+
+    def stats(self) -> dict:
+        """Get current load and latency histograms."""
+        self._expire_window(time.monotonic())
+        return {
+            "running": self._running,
+            "max_concurrency": self.max_concurrency,
+            "queued": {
+                "interactive" if priority == PRIORITY_INTERACTIVE else "background": sum(
+                    len(requests) for requests in sessions.values()
+                )
+                for priority, sessions in self._queues.items()
+            },
+            "tokens_last_minute": self._window_tokens,
+            "tokens_per_minute": self.tokens_per_minute,
+            "queue_wait": self.queue_wait.snapshot(),
+            "completion": self.completion_latency.snapshot(),
+        }
+
+    def _release(self) -> None:
+        self._running -= 1
+        self._dispatch()
+
+    def _next(self) -> _Request | None:
+        """The request that should start next (not removed from its queue)."""
+        for priority in sorted(self._queues):
+            sessions = self._queues[priority]
+            if sessions:
+                return next(iter(sessions.values()))[0]
+        return None
+
+    def _dispatch(self) -> None:
+        """Admit waiting requests while slots and budget allow."""
+        if self._retry is not None:
+            self._retry.cancel()
+            self._retry = None
+
+        while self._running < self.max_concurrency:
+            request = self._next()
+            if request is None:
+                return
+
+            now = time.monotonic()
+            if self.tokens_per_minute:
+                self._expire_window(now)
+                if self._window and self._window_tokens + request.tokens > self.tokens_per_minute:
+                    # Retry when the oldest usage leaves the window
+                    delay = self._window[0][0] + TOKEN_WINDOW_SECONDS - now
+                    self._retry = asyncio.get_running_loop().call_later(
+                        max(delay, 0.0), self._dispatch
+                    )
+                    logger.debug("AI token budget exhausted, next admission in %.1fs", delay)
+                    return
+                self._window.append((now, request.tokens))
+                self._window_tokens += request.tokens
+
+            self._pop(request)
+            self._running += 1
+            request.admitted.set_result(None)
+
+    def _pop(self, request: _Request) -> None:
+        """Remove the head request of its session and rotate the session to the back."""
+        sessions = self._queues[request.priority]
+        requests = sessions.pop(request.session_key)
+        requests.popleft()
+        if requests:
+            sessions[request.session_key] = requests
+        if not sessions:
+            del self._queues[request.priority]
+
+    def _discard(self, request: _Request) -> None:
+        """Forget a request that was cancelled while waiting."""
+        sessions = self._queues.get(request.priority, {})
+        requests = sessions.get(request.session_key)
+        if requests is not None and request in requests:
+            requests.remove(request)
+            if not requests:
+                del sessions[request.session_key]
+            if not sessions:
+                self._queues.pop(request.priority, None)
+        self._dispatch()
+
+    def _expire_window(self, now: float) -> None:
+        while self._window and self._window[0][0] <= now - TOKEN_WINDOW_SECONDS:
+            self._window_tokens -= self._window.popleft()[1]
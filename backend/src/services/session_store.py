@@ -0,0 +1,287 @@
+"""Expiring user session storage with a per-user index and pluggable persistence."""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterator, MutableMapping
+from datetime import UTC, datetime
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from src.config import get_settings
+from src.models.user import UserSession
+
+logger = logging.getLogger(__name__)
+
+# Seconds between sweeps of expired sessions
+SESSION_SWEEP_INTERVAL_SECONDS = 300.0
+
+# Lines appended to a session file before it is compacted (if mostly stale)
+SESSION_FILE_COMPACT_AFTER = 1000
+
+
+def _updated_at(session: UserSession) -> datetime:
+    """A session's last update as an aware UTC time (older code stored naive UTC)."""
+    updated_at = session.updated_at
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=UTC)
+    return updated_at
+
+
+class SessionBackend:
+    """
+    Storage the session store writes through to.
+
+    This base backend stores nothing, so sessions live in memory only.
+    Subclasses persist sessions so that restarts do not log users out.
+    """
+
+    def load(self) -> list[UserSession]:
+        """Get all stored sessions (expired ones included)."""
+        return []
+
+    def save(self, session: UserSession) -> None:
+        """Store a new or updated session."""
+
+    def delete(self, session_id: str) -> None:
+        """Remove a session."""
+
+    def clear(self) -> None:
+        """Remove all sessions."""
+
+
+class FileSessionBackend(SessionBackend):
+    """
+    Sessions persisted to an encrypted JSON-lines log.
+
+    Every save or delete appends one line, encrypted with a key derived
+    from ``secret_key`` because sessions hold GitHub access tokens. The
+    file is created readable by its owner only and is compacted on load
+    and whenever stale lines outnumber live sessions. Lines that cannot be
+    decrypted (e.g. after the secret changed) are skipped.
+    """
+
+    def __init__(self, path: str, secret_key: str):
+        self.path = path
+        key = base64.urlsafe_b64encode(hashlib.sha256(secret_key.encode()).digest())
+        self._fernet = Fernet(key)
+        # session_id -> encrypted line of its latest save
+        self._live: dict[str, str] = {}
+        self._appended = 0
+
+    def load(self) -> list[UserSession]:
+        self._live.clear()
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    for line in f:
+                        self._replay(line.strip())
+            except OSError as e:
+                logger.warning("Failed to load sessions from %s: %s", self.path, e)
+        self._rewrite()
+
+        sessions = []
+        for line in self._live.values():
+            record = json.loads(self._fernet.decrypt(line.encode()))
+            sessions.append(UserSession.model_validate(record["session"]))
+        return sessions
+
+    def save(self, session: UserSession) -> None:
+        record = {"op": "put", "session": session.model_dump(mode="json")}
+        line = self._encrypt(record)
+        self._live[str(session.session_id)] = line
+        self._append(line)
+
+    def delete(self, session_id: str) -> None:
+        if self._live.pop(session_id, None) is not None:
+            self._append(self._encrypt({"op": "del", "id": session_id}))
+
+    def clear(self) -> None:
+        self._live.clear()
+        self._rewrite()
+
+    def _encrypt(self, record: dict) -> str:
+        return self._fernet.encrypt(json.dumps(record).encode()).decode()
+
+    def _replay(self, line: str) -> None:
+        if not line:
+            return
+        try:
+            record = json.loads(self._fernet.decrypt(line.encode()))
+            if record["op"] == "put":
+                self._live[record["session"]["session_id"]] = line
+            else:
+                self._live.pop(record["id"], None)
+        except (InvalidToken, ValueError, KeyError, TypeError):
+            logger.debug("Skipping unreadable session record in %s", self.path)
+
+    def _open(self, path: str, mode: int):
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | mode, 0o600)
+        return os.fdopen(fd, "w", encoding="utf-8")
+
+    def _append(self, line: str) -> None:
+        if self._appended >= SESSION_FILE_COMPACT_AFTER and self._appended > 2 * len(self._live):
+            self._rewrite()
+            return
+        try:
+            with self._open(self.path, os.O_APPEND) as f:
+                f.write(line + "\n")
+            self._appended += 1
+        except OSError as e:
+            logger.warning("Failed to persist session to %s: %s", self.path, e)
+
+    def _rewrite(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._open(tmp_path, os.O_TRUNC) as f:
+                for line in self._live.values():
+                    f.write(line + "\n")
+            os.replace(tmp_path, self.path)
+            self._appended = 0
+        except OSError as e:
+            logger.warning("Failed to compact sessions at %s: %s", self.path, e)
+
+
+class SessionStore(MutableMapping[str, UserSession]):
+    """
+    Sessions by ID that expire ``session_expire_hours`` after their last update.
+
+    Behaves like a dict keyed by session ID. Expired sessions are treated
+    as absent and removed when looked up or swept. A secondary index maps
+    GitHub user IDs to their sessions so that per-user state can be shared
+    across a user's sessions. Writes go through to a ``SessionBackend``.
+    """
+
+    def __init__(self, ttl_seconds: float | None = None, backend: SessionBackend | None = None):
+        """
+        Create the store.
+
+        Args:
+            ttl_seconds: Session lifetime (None = ``session_expire_hours`` setting)
+            backend: Persistence backend (None = memory only)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.backend = backend or SessionBackend()
+        self._sessions: dict[str, UserSession] = {}
+        self._by_user: dict[str, set[str]] = {}
+
+    def __getitem__(self, session_id: str) -> UserSession:
+        session = self._sessions[session_id]
+        if self._is_expired(session, datetime.now(UTC)):
+            del self[session_id]
+            raise KeyError(session_id)
+        return session
+
+    def __setitem__(self, session_id: str, session: UserSession) -> None:
+        previous = self._sessions.get(session_id)
+        if previous is not None and previous.github_user_id != session.github_user_id:
+            self._unindex(session_id, previous.github_user_id)
+        self._sessions[session_id] = session
+        self._by_user.setdefault(session.github_user_id, set()).add(session_id)
+        self.backend.save(session)
+
+    def __delitem__(self, session_id: str) -> None:
+        session = self._sessions.pop(session_id)
+        self._unindex(session_id, session.github_user_id)
+        self.backend.delete(session_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._sessions))
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def clear(self) -> None:
+        """Remove all sessions (persisted ones as well)."""
+        self._sessions.clear()
+        self._by_user.clear()
+        self.backend.clear()
+
+    def sessions_for_user(self, github_user_id: str) -> list[UserSession]:
+        """
+        Get the live sessions of a GitHub user.
+
+        Args:
+            github_user_id: GitHub user ID
+
+        Returns:
+            Sessions of that user, most recently updated first
+        """
+        sessions = [
+            session
+            for session_id in list(self._by_user.get(github_user_id, ()))
+            if (session := self.get(session_id)) is not None
+        ]
+        return sorted(sessions, key=_updated_at, reverse=True)
+
+    def use_backend(self, backend: SessionBackend) -> int:
+        """
+        Switch to a persistence backend and restore its unexpired sessions.
+
+        Args:
+            backend: Backend to load from and write through to
+
+        Returns:
+            Number of sessions restored
+        """
+        self.backend = backend
+        now = datetime.now(UTC)
+        restored = 0
+        for session in backend.load():
+            session_id = str(session.session_id)
+            if self._is_expired(session, now):
+                backend.delete(session_id)
+            elif session_id not in self._sessions:
+                self._sessions[session_id] = session
+                self._by_user.setdefault(session.github_user_id, set()).add(session_id)
+                restored += 1
+        return restored
+
+    def sweep(self) -> int:
+        """
+        Remove expired sessions.
+
+        Returns:
+            Number of sessions removed
+        """
+        now = datetime.now(UTC)
+        expired = [k for k, s in self._sessions.items() if self._is_expired(s, now)]
+        for session_id in expired:
+            del self[session_id]
+        if expired:
+            logger.info("Session sweep removed %d expired sessions", len(expired))
+        return len(expired)
+
+    async def run_sweeper(self, interval: float = SESSION_SWEEP_INTERVAL_SECONDS) -> None:
+        """Sweep every ``interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error("Session sweep failed: %s", e)
+
+    def stats(self) -> dict[str, int]:
+        """Get session and user counts."""
+        return {"sessions": len(self._sessions), "users": len(self._by_user)}
+
+    def _ttl(self) -> float:
+        if self.ttl_seconds is not None:
+            return self.ttl_seconds
+        return get_settings().session_expire_hours * 3600
+
+    def _is_expired(self, session: UserSession, now: datetime) -> bool:
+        return (now - _updated_at(session)).total_seconds() > self._ttl()
+
+    def _unindex(self, session_id: str, github_user_id: str) -> None:
+        session_ids = self._by_user.get(github_user_id)
+        if session_ids is not None:
+            session_ids.discard(session_id)
+            if not session_ids:
+                del self._by_user[github_user_id]
@@ -0,0 +1,110 @@
+"""Deterministic parsing of chat commands that move a task to another status."""
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from src.services.task_matching import TaskMatchIndex, normalize_title
+
+# Other names users give the default board columns
+STATUS_ALIASES = {
+    "todo": ["to do", "backlog", "not started"],
+    "in progress": ["doing", "started", "working", "in-progress"],
+    "done": ["complete", "completed", "finished", "closed"],
+}
+
+# Below this the command is left to the model
+MIN_LOCAL_CONFIDENCE = 0.8
+
+# Confidence per way the status and task were recognized
+_STATUS_CONFIDENCE = {"name": 1.0, "alias": 0.9}
+_TASK_CONFIDENCE = {"exact": 0.95, "contained": 0.85}
+
+_VERB_RE = re.compile(
+    r"^(?:please\s+)?(?:(?:can|could) you\s+)?"
+    r"(?P<verb>move|set|change|put|drag|shift|switch|mark)\s+(?P<rest>.+)$"
+)
+_TRAILING_RE = re.compile(r"(?:\s+(?:column|status|lane))?(?:\s+please)?[\s.!]*$")
+_CONNECTOR_RE = re.compile(r"\s+(?:to|into|as|in)(?:\s+the)?$")
+_TASK_PREFIX_RE = re.compile(
+    r"^(?:the\s+)?(?:status\s+of\s+(?:the\s+)?)?(?:(?:task|issue|card)\s+)?"
+)
+_QUOTES = "\"'`“”‘’"
+
+
+@dataclass(frozen=True)
+class StatusCommand:
+    """A status change recognized without the model."""
+
+    task: dict[str, Any]
+    target_status: str
+    confidence: float
+
+
+def status_phrases(available_statuses: list[str]) -> list[tuple[str, str, str]]:
+    """
+    Get the phrases that name each status, longest first.
+
+    Args:
+        available_statuses: Status names of the project
+
+    Returns:
+        (phrase, status, kind) tuples; kind is "name" or "alias"
+    """
+    phrases: dict[str, tuple[str, str]] = {}
+    for status in available_statuses:
+        phrases.setdefault(normalize_title(status), (status, "name"))
+    for status in available_statuses:
+        for alias in STATUS_ALIASES.get(normalize_title(status), []):
+            phrases.setdefault(alias, (status, "alias"))
+    return sorted(
+        ((phrase, status, kind) for phrase, (status, kind) in phrases.items()),
+        key=lambda entry: -len(entry[0]),
+    )
+
+
+def parse_status_command(
+    user_input: str, index: TaskMatchIndex, available_statuses: list[str]
+) -> StatusCommand | None:
+    """
+    Recognize commands like "move login bug to In Progress".
+
+    The command must start with a move/set/mark verb and end with a status
+    name (or a known alias) of the project, and the words in between must
+    name exactly one task. Anything less certain returns None so the caller
+    can ask the model instead.
+
+    Args:
+        user_input: User's message
+        index: Title index of the project's tasks
+        available_statuses: Status names of the project
+
+    Returns:
+        StatusCommand if recognized with at least MIN_LOCAL_CONFIDENCE, None otherwise
+    """
+    verb_match = _VERB_RE.match(normalize_title(user_input))
+    if not verb_match:
+        return None
+    rest = _TRAILING_RE.sub("", verb_match["rest"])
+
+    for phrase, status, kind in status_phrases(available_statuses):
+        if not rest.endswith(" " + phrase):
+            continue
+        head = rest[: -len(phrase) - 1]
+        connector = _CONNECTOR_RE.search(head)
+        if connector:
+            head = head[: connector.start()]
+        elif verb_match["verb"] != "mark":
+            continue
+
+        reference = _TASK_PREFIX_RE.sub("", head).strip(_QUOTES + " ")
+        match = index.match(reference)
+        if match is None or match[0] not in _TASK_CONFIDENCE:
+            return None
+
+        confidence = _STATUS_CONFIDENCE[kind] * _TASK_CONFIDENCE[match[0]]
+        if confidence < MIN_LOCAL_CONFIDENCE:
+            return None
+        return StatusCommand(task=match[1], target_status=status, confidence=confidence)
+
+    return None
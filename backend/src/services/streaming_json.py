@@ -0,0 +1,171 @@
+"""Incremental parsing of top-level JSON object fields from streamed model output."""
+
+from dataclasses import dataclass
+
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+@dataclass(frozen=True)
+class FieldEvent:
+    """A piece of a top-level field, available before the object is complete."""
+
+    # "delta": more text of a string field; "item": a complete string of an array field
+    kind: str
+    field: str
+    value: str
+    # Position of an "item" within its array
+    index: int = 0
+
+
+class JSONFieldStream:
+    """
+    Extracts top-level string fields and string-array items from a JSON object
+    as its text arrives in chunks.
+
+    Only what a progressive UI needs is tracked: text of top-level string
+    values (as deltas) and complete strings of top-level arrays (as items).
+    Nested objects are skipped; the complete text should still be parsed
+    normally at the end. Text before the first ``{`` (e.g. a markdown code
+    fence) is ignored.
+    """
+
+    def __init__(self):
+        self._started = False
+        self._in_string = False
+        self._escape: str | None = None
+        self._high_surrogate: int | None = None
+        # Top-level key being read or whose value is being read
+        self._key: str | None = None
+        self._reading_key = False
+        self._key_chars: list[str] = []
+        self._item_chars: list[str] = []
+        self._item_index = 0
+        # Container kinds from the outermost object inward ("{" or "[")
+        self._stack: list[str] = []
+
+    def feed(self, chunk: str) -> list[FieldEvent]:
+        """
+        Consume the next chunk of text.
+
+        Args:
+            chunk: Next piece of the model output
+
+        Returns:
+            Field events completed or extended by this chunk, in order
+        """
+        events: list[FieldEvent] = []
+        delta: list[str] = []
+
+        for char in chunk:
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._stack.append("{")
+                continue
+
+            if self._in_string:
+                decoded = self._decode(char)
+                if decoded is None:
+                    continue
+                if decoded is _END_OF_STRING:
+                    self._end_string(events, delta)
+                    continue
+                self._append(decoded, delta)
+                continue
+
+            if char == '"':
+                self._start_string()
+            elif char in "{[":
+                self._stack.append(char)
+                if len(self._stack) == 2 and char == "[":
+                    self._item_index = 0
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+            elif char == "," and len(self._stack) == 1:
+                self._key = None
+
+        self._flush_delta(events, delta)
+        return events
+
+    def _start_string(self) -> None:
+        self._in_string = True
+        depth = len(self._stack)
+        if depth == 1 and self._key is None:
+            self._reading_key = True
+            self._key_chars = []
+        elif depth == 2 and self._stack[-1] == "[":
+            self._item_chars = []
+
+    def _append(self, text: str, delta: list[str]) -> None:
+        depth = len(self._stack)
+        if self._reading_key:
+            self._key_chars.append(text)
+        elif depth == 1 and self._key is not None:
+            delta.append(text)
+        elif depth == 2 and self._stack[-1] == "[":
+            self._item_chars.append(text)
+
+    def _end_string(self, events: list[FieldEvent], delta: list[str]) -> None:
+        self._in_string = False
+        depth = len(self._stack)
+        if self._reading_key:
+            self._reading_key = False
+            self._key = "".join(self._key_chars)
+        elif depth == 1 and self._key is not None:
+            self._flush_delta(events, delta)
+        elif depth == 2 and self._stack[-1] == "[" and self._key is not None:
+            events.append(
+                FieldEvent("item", self._key, "".join(self._item_chars), self._item_index)
+            )
+            self._item_index += 1
+
+    def _flush_delta(self, events: list[FieldEvent], delta: list[str]) -> None:
+        if delta and self._key is not None:
+            events.append(FieldEvent("delta", self._key, "".join(delta)))
+        delta.clear()
+
+    def _decode(self, char: str) -> "str | object | None":
+        """Decode one string character; None while an escape is incomplete."""
+        if self._escape is not None:
+            self._escape += char
+            if self._escape.startswith("u"):
+                if len(self._escape) < 5:
+                    return None
+                code, self._escape = self._escape[1:], None
+                try:
+                    return self._code_point(int(code, 16))
+                except ValueError:
+                    return ""
+            escape, self._escape = self._escape, None
+            return _SIMPLE_ESCAPES.get(escape, escape)
+        if char == "\\":
+            self._escape = ""
+            return None
+        if char == '"':
+            return _END_OF_STRING
+        return char
+
+    def _code_point(self, code: int) -> str | None:
+        """Decode a ``\\u`` escape, combining UTF-16 surrogate pairs."""
+        if 0xD800 <= code < 0xDC00:
+            self._high_surrogate = code
+            return None
+        high, self._high_surrogate = self._high_surrogate, None
+        if 0xDC00 <= code < 0xE000:
+            if high is None:
+                return "\ufffd"
+            return chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00))
+        return chr(code) if high is None else "\ufffd" + chr(code)
+
+
+_END_OF_STRING = object()
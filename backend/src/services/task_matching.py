@@ -0,0 +1,264 @@
+"""Inverted index for matching free-text task references against task titles."""
+
+import math
+import re
+from collections import OrderedDict
+from itertools import groupby
+from typing import Any
+
+# Indexes kept for recently seen task lists (one per fetched snapshot)
+MAX_CACHED_MATCH_INDEXES = 32
+
+# Reference words scored per lookup (subsets grow as 2^n; the rarest words are kept)
+MAX_SCORED_TOKENS = 8
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase a title and collapse whitespace."""
+    return " ".join(title.lower().split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class TaskMatchIndex:
+    """
+    TF-IDF token index over the titles of one task list.
+
+    Each word maps to a bitset (an int) of the titles containing it. A
+    lookup enumerates the subsets of the reference's words from the highest
+    combined weight down and intersects their bitsets, so it never visits
+    titles that cannot rank, and never re-tokenizes titles. Matching keeps
+    the precedence of the original linear matcher: an exact title, then a
+    unique title/reference containment, then the best token score.
+    References with no indexed word at all (e.g. "auth" for "Authentication
+    flow") fall back to a substring scan of the titles.
+    """
+
+    def __init__(self, tasks: list[dict[str, Any]]):
+        """
+        Build the index.
+
+        Args:
+            tasks: Task dicts with at least a 'title' key
+        """
+        self.tasks = tasks
+        self._titles: list[str] = []
+        self._token_counts: list[int] = []
+        self._exact: dict[str, int] = {}
+        masks: dict[str, int] = {}
+        count_masks: dict[int, int] = {}
+
+        for position, task in enumerate(tasks):
+            title = normalize_title(task["title"])
+            tokens = set(tokenize(title))
+            bit = 1 << position
+            self._titles.append(title)
+            self._token_counts.append(len(tokens))
+            # First task wins, like a linear scan
+            self._exact.setdefault(title, position)
+            count_masks[len(tokens)] = count_masks.get(len(tokens), 0) | bit
+            for token in tokens:
+                masks[token] = masks.get(token, 0) | bit
+
+        count = len(tasks)
+        self._masks = masks
+        # Titles grouped by word count, fewest words first (best coverage first)
+        self._count_masks = sorted(count_masks.items())
+        # Smoothed IDF so tokens present in every title still count a little
+        self._idf = {
+            token: math.log((count + 1) / (mask.bit_count() + 0.5)) for token, mask in masks.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def search(self, reference: str, limit: int = 5) -> list[tuple[float, dict[str, Any]]]:
+        """
+        Rank tasks by the IDF weight of the reference words in their titles.
+
+        Ties are broken by the share of the title matched, then by board order,
+        so results are deterministic.
+
+        Args:
+            reference: Free-text task reference
+            limit: Maximum number of candidates
+
+        Returns:
+            (score, task) pairs, best first; empty if no word matches
+        """
+        ranked = self._rank(self._subsets(set(tokenize(reference))), limit)
+        return [(score, self.tasks[position]) for score, _, position in ranked]
+
+    def best_match(self, reference: str) -> dict[str, Any] | None:
+        """
+        Find the single best task for a reference.
+
+        Args:
+            reference: Free-text task reference
+
+        Returns:
+            Matching task dict or None
+        """
+        match = self.match(reference)
+        return match[1] if match else None
+
+    def match(self, reference: str) -> tuple[str, dict[str, Any]] | None:
+        """
+        Find the best task for a reference and how it was found.
+
+        Args:
+            reference: Free-text task reference
+
+        Returns:
+            (kind, task) where kind is "exact" (same normalized title),
+            "contained" (the only title containing or contained in the
+            reference) or "ranked" (best token score); None if nothing matches
+        """
+        if not reference or not self.tasks:
+            return None
+
+        normalized = normalize_title(reference)
+        position = self._exact.get(normalized)
+        if position is not None:
+            return "exact", self.tasks[position]
+
+        reference_tokens = set(tokenize(normalized))
+        subsets = self._subsets(reference_tokens)
+        if subsets:
+            contained = self._contained(normalized, len(reference_tokens), subsets)
+        else:
+            # Only partial words, which the index cannot see
+            contained = self._scan_contained(normalized)
+        if len(contained) == 1:
+            return "contained", self.tasks[contained.pop()]
+
+        ranked = self._rank(subsets, 1)
+        return ("ranked", self.tasks[ranked[0][2]]) if ranked else None
+
+    def _subsets(self, reference_tokens: set[str]) -> list[tuple[float, int, int]]:
+        """
+        Get (score, size, mask) for each non-empty subset of known reference words.
+
+        ``mask`` holds the titles containing exactly that subset of the words.
+        Only the most specific MAX_SCORED_TOKENS words are considered.
+        """
+        tokens = sorted(
+            (token for token in reference_tokens if token in self._masks),
+            key=lambda token: -self._idf[token],
+        )[:MAX_SCORED_TOKENS]
+
+        subsets = []
+        for bits in range(1, 1 << len(tokens)):
+            mask, score, size = -1, 0.0, 0
+            for i, token in enumerate(tokens):
+                if bits >> i & 1:
+                    mask &= self._masks[token]
+                    score += self._idf[token]
+                    size += 1
+                else:
+                    mask &= ~self._masks[token]
+                if not mask:
+                    break
+            if mask:
+                subsets.append((score, size, mask))
+        subsets.sort(key=lambda subset: (-subset[0], -subset[1]))
+        return subsets
+
+    def _positions(self, mask: int, limit: int) -> list[int]:
+        """Up to ``limit`` titles of ``mask`` by word count, then board order."""
+        positions: list[int] = []
+        for _, count_mask in self._count_masks:
+            group = mask & count_mask
+            while group and len(positions) < limit:
+                low = group & -group
+                positions.append(low.bit_length() - 1)
+                group ^= low
+            if len(positions) >= limit:
+                break
+        return positions
+
+    def _rank(
+        self, subsets: list[tuple[float, int, int]], limit: int
+    ) -> list[tuple[float, int, int]]:
+        """(score, matched words, position) of the best ``limit`` titles."""
+        ranked: list[tuple[float, int, int]] = []
+        token_counts = self._token_counts
+        # Subsets with equal scores are merged so coverage decides between them
+        for score, group in groupby(subsets, key=lambda subset: subset[0]):
+            candidates = [
+                (score, size, position)
+                for _, size, mask in group
+                for position in self._positions(mask, limit)
+            ]
+            candidates.sort(key=lambda c: (-c[1] / token_counts[c[2]], c[2]))
+            ranked.extend(candidates)
+            if len(ranked) >= limit:
+                break
+        return ranked[:limit]
+
+    def _contained(
+        self, normalized: str, reference_size: int, subsets: list[tuple[float, int, int]]
+    ) -> set[int]:
+        """Titles containing the reference or contained in it (stops at two)."""
+        contained: set[int] = set()
+        for _, size, mask in subsets:
+            # Reference inside a title: the title has every reference word
+            if size == reference_size:
+                for position in self._positions(mask, len(self.tasks)):
+                    if normalized in self._titles[position]:
+                        contained.add(position)
+                        if len(contained) > 1:
+                            return contained
+            # Title inside the reference: every title word is a reference word
+            for count, count_mask in self._count_masks:
+                if count == size:
+                    for position in self._positions(mask & count_mask, len(self.tasks)):
+                        if self._titles[position] in normalized:
+                            contained.add(position)
+                            if len(contained) > 1:
+                                return contained
+        return contained
+
+    def _scan_contained(self, normalized: str) -> set[int]:
+        """Substring scan for containment the word index cannot see (stops at two)."""
+        contained: set[int] = set()
+        for position, title in enumerate(self._titles):
+            if normalized in title or title in normalized:
+                contained.add(position)
+                if len(contained) > 1:
+                    break
+        return contained
+
+
+class TaskMatchIndexCache:
+    """
+    Reuses the index of a task list for as long as the same list is passed in.
+
+    Lookups are O(1): entries are keyed on the list object and its length,
+    not its titles. Callers pass lists that are rebuilt rather than edited
+    when tasks change (e.g. ``ProjectItemList.task_refs`` of each fetch).
+    """
+
+    def __init__(self, max_size: int = MAX_CACHED_MATCH_INDEXES):
+        self._max_size = max_size
+        # (id(list), len) -> (list, index); holding the list keeps its id from being reused
+        self._indexes: OrderedDict[tuple[int, int], tuple[list, TaskMatchIndex]] = OrderedDict()
+
+    def get(self, tasks: list[dict[str, Any]]) -> TaskMatchIndex:
+        """Get the index for ``tasks``, building it on first use."""
+        key = (id(tasks), len(tasks))
+        entry = self._indexes.get(key)
+        if entry is not None and entry[0] is tasks:
+            self._indexes.move_to_end(key)
+            return entry[1]
+
+        index = TaskMatchIndex(tasks)
+        self._indexes[key] = (tasks, index)
+        if len(self._indexes) > self._max_size:
+            self._indexes.popitem(last=False)
+        return index
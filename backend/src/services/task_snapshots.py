@@ -0,0 +1,361 @@
+"""Versioned project task snapshots with field-level deltas for real-time clients."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic_core import to_json
+
+from src.models.task import ProjectItem
+from src.services.cache import cache, get_project_items_cache_key
+from src.services.github_projects import github_projects_service, is_auth_error
+from src.services.websocket import build_snapshot_frame, encode_columnar, encode_message
+
+logger = logging.getLogger(__name__)
+
+# Deltas kept per snapshot so reconnecting clients can catch up without a full snapshot
+MAX_SNAPSHOT_HISTORY = 50
+
+# Fields regenerated on every fetch; they identify the record, not its content
+VOLATILE_TASK_FIELDS = frozenset({"task_id", "created_at", "updated_at"})
+
+# Unwatched snapshots not fetched for this long are dropped when another is created
+SNAPSHOT_IDLE_SECONDS = 300.0
+
+
+def diff_task_records(
+    old: dict[str, dict[str, Any]], new: dict[str, dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[str], list[dict[str, Any]]]:
+    """
+    Compare two task record maps keyed by GitHub item ID.
+
+    Like ``GitHubProjectsService._detect_changes`` but at field level, so
+    only the fields that changed need to be sent to clients.
+
+    Args:
+        old: Previous records (github_item_id -> JSON-mode task dict)
+        new: Current records
+
+    Returns:
+        Tuple of (added records, removed item IDs, patches). Each patch holds
+        ``github_item_id`` plus only the fields whose values changed.
+    """
+    added = [record for item_id, record in new.items() if item_id not in old]
+    removed = [item_id for item_id in old if item_id not in new]
+
+    patched = []
+    for item_id in old.keys() & new.keys():
+        old_record, new_record = old[item_id], new[item_id]
+        changes = {
+            key: value
+            for key, value in new_record.items()
+            if key not in VOLATILE_TASK_FIELDS and old_record.get(key) != value
+        }
+        if changes:
+            patched.append({"github_item_id": item_id, **changes})
+
+    return added, removed, patched
+
+
+@dataclass
+class ProjectSnapshot:
+    """Latest known task state of a project, as seen by one GitHub user."""
+
+    project_id: str
+    # Millisecond timestamp base so versions keep increasing across restarts
+    version: int = field(default_factory=lambda: int(time.time() * 1000))
+    fetched_at: float = 0.0
+    # github_item_id -> JSON-mode task dict, in project order
+    records: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Task list encoded as a JSON array (encoded once per version)
+    tasks_json: str = "[]"
+    # (base version, delta frame) for the most recent changes
+    history: deque[tuple[int, str]] = field(
+        default_factory=lambda: deque(maxlen=MAX_SNAPSHOT_HISTORY)
+    )
+    initialized: bool = False
+    _columns_json: str | None = field(default=None, init=False, repr=False)
+
+    @property
+    def count(self) -> int:
+        return len(self.records)
+
+    def apply(self, tasks: list[ProjectItem]) -> bool:
+        """
+        Replace the snapshot contents with freshly fetched tasks.
+
+        Records of items that still exist keep their previous timestamps,
+        so a refetch alone never looks like a change.
+
+        Returns:
+            True if the content changed and a new version was recorded
+        """
+        records: dict[str, dict[str, Any]] = {}
+        for task in tasks:
+            record = task.to_task().model_dump(mode="json")
+            previous = self.records.get(task.github_item_id)
+            if previous:
+                for key in VOLATILE_TASK_FIELDS:
+                    record[key] = previous[key]
+            records[task.github_item_id] = record
+
+        if not self.initialized:
+            self._set_records(records)
+            self.initialized = True
+            return True
+
+        added, removed, patched = diff_task_records(self.records, records)
+        if not (added or removed or patched):
+            return False
+
+        base_version = self.version
+        self._set_records(records)
+        self.version = base_version + 1
+        self.history.append(
+            (
+                base_version,
+                encode_message(
+                    {
+                        "type": "tasks_delta",
+                        "project_id": self.project_id,
+                        "base_version": base_version,
+                        "version": self.version,
+                        "tasks_added": added,
+                        "tasks_removed": removed,
+                        "tasks_patched": patched,
+                    }
+                ),
+            )
+        )
+        return True
+
+    def deltas_since(self, version: int) -> list[str] | None:
+        """
+        Get the delta frames that bring a client from ``version`` to current.
+
+        Returns:
+            Ordered delta frames (empty if already current), or None if the
+            version is unknown or too old and a full snapshot is required
+        """
+        if version == self.version:
+            return []
+        frames = []
+        found = False
+        for base_version, frame in self.history:
+            if base_version == version:
+                found = True
+            if found:
+                frames.append(frame)
+        return frames if found else None
+
+    def snapshot_frame(self, message_type: str, columnar: bool = False) -> str:
+        """Build a full snapshot frame ("initial_data" or "refresh")."""
+        if columnar:
+            if self._columns_json is None:
+                self._columns_json = encode_columnar(list(self.records.values()))
+            tasks_json = self._columns_json
+        else:
+            tasks_json = self.tasks_json
+        return build_snapshot_frame(
+            message_type,
+            self.project_id,
+            tasks_json,
+            self.count,
+            version=self.version,
+            columnar=columnar,
+        )
+
+    def _set_records(self, records: dict[str, dict[str, Any]]) -> None:
+        self.records = records
+        self.tasks_json = to_json(list(records.values())).decode()
+        # Columnar encoding is built on first use for each version
+        self._columns_json = None
+
+
+class _SnapshotFeed:
+    """Watchers of one snapshot and the task that refreshes it for them."""
+
+    def __init__(self):
+        # Access tokens of current watchers; the newest accepted one is used to refresh
+        self.tokens: list[str] = []
+        # Tokens GitHub rejected, skipped until their watchers leave
+        self.rejected: set[str] = set()
+        self.changed = asyncio.Condition()
+        self.wakeup = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+
+class TaskSnapshotStore:
+    """
+    Shares one GitHub fetch per project and user across real-time subscribers.
+
+    Snapshots are keyed by (project_id, github_user_id) and never shared
+    across users, so each client only sees data its own token can read.
+    While a snapshot has watchers, a single background task refreshes it
+    and watchers are woken only when its version changes. A snapshot is
+    dropped when its last watcher leaves, or once idle for
+    SNAPSHOT_IDLE_SECONDS if it was only fetched and never watched.
+    """
+
+    def __init__(self):
+        self._snapshots: dict[tuple[str, str], ProjectSnapshot] = {}
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+        self._feeds: dict[tuple[str, str], _SnapshotFeed] = {}
+
+    async def get(
+        self, access_token: str, github_user_id: str, project_id: str, max_age: float
+    ) -> ProjectSnapshot:
+        """
+        Get a project's snapshot, refreshing it from GitHub if older than ``max_age``.
+
+        Args:
+            access_token: GitHub OAuth access token
+            github_user_id: Owner of the snapshot
+            project_id: GitHub Project node ID
+            max_age: Maximum snapshot age in seconds before refetching
+
+        Returns:
+            The (possibly updated) snapshot
+        """
+        key = (project_id, github_user_id)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            now = asyncio.get_running_loop().time()
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                self._drop_idle(now)
+                snapshot = self._snapshots[key] = ProjectSnapshot(project_id=project_id)
+
+            if snapshot.initialized and now - snapshot.fetched_at < max_age:
+                return snapshot
+
+            tasks = await github_projects_service.get_project_items(access_token, project_id)
+
+            # Update cache
+            cache.set(get_project_items_cache_key(project_id), tasks)
+
+            changed = snapshot.apply(tasks)
+            snapshot.fetched_at = now
+
+        if changed:
+            logger.debug("Project %s snapshot now at version %d", project_id, snapshot.version)
+            feed = self._feeds.get(key)
+            if feed:
+                async with feed.changed:
+                    feed.changed.notify_all()
+        return snapshot
+
+    async def watch(
+        self, access_token: str, github_user_id: str, project_id: str, interval: float
+    ) -> AsyncIterator[ProjectSnapshot]:
+        """
+        Yield the project's snapshot now and again each time its version changes.
+
+        The snapshot is refreshed every ``interval`` seconds by one task
+        shared by all watchers of the same project and user. The refresh
+        task stops when the last watcher goes away.
+
+        Args:
+            access_token: GitHub OAuth access token of the watcher
+            github_user_id: Owner of the snapshot
+            project_id: GitHub Project node ID
+            interval: Seconds between refreshes
+        """
+        key = (project_id, github_user_id)
+        feed = self._feeds.setdefault(key, _SnapshotFeed())
+        feed.tokens.append(access_token)
+        if feed.task is None:
+            feed.task = asyncio.create_task(self._refresh_loop(key, feed, interval))
+
+        def current() -> ProjectSnapshot | None:
+            snapshot = self._snapshots.get(key)
+            return snapshot if snapshot and snapshot.initialized else None
+
+        try:
+            try:
+                await self.get(access_token, github_user_id, project_id, max_age=interval)
+            except Exception as e:
+                logger.error("Failed to fetch snapshot for project %s: %s", project_id, e)
+
+            seen_version = None
+            while True:
+                async with feed.changed:
+                    await feed.changed.wait_for(
+                        lambda seen=seen_version: current() is not None
+                        and current().version != seen
+                    )
+                snapshot = current()
+                seen_version = snapshot.version
+                yield snapshot
+        finally:
+            feed.tokens.remove(access_token)
+            if access_token not in feed.tokens:
+                feed.rejected.discard(access_token)
+            if not feed.tokens:
+                feed.task.cancel()
+                self._feeds.pop(key, None)
+                self._drop(key)
+
+    async def _refresh_loop(
+        self, key: tuple[str, str], feed: _SnapshotFeed, interval: float
+    ) -> None:
+        project_id, github_user_id = key
+        while True:
+            try:
+                await asyncio.wait_for(feed.wakeup.wait(), timeout=interval)
+            except TimeoutError:
+                pass
+            feed.wakeup.clear()
+            # Try watchers' tokens newest first, so one expired token does not stall the others
+            for token in reversed(list(feed.tokens)):
+                if token in feed.rejected:
+                    continue
+                try:
+                    await self.get(token, github_user_id, project_id, max_age=0)
+                except Exception as e:
+                    if is_auth_error(e):
+                        logger.warning("Skipping rejected token for project %s", project_id)
+                        feed.rejected.add(token)
+                        continue
+                    logger.error("Failed to refresh snapshot for project %s: %s", project_id, e)
+                break
+
+    def request_refresh(self, project_id: str) -> None:
+        """Refresh a watched project's snapshots now instead of at the next interval."""
+        for (feed_project_id, _), feed in self._feeds.items():
+            if feed_project_id == project_id:
+                feed.wakeup.set()
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        """Forget a snapshot and its lock (a fetch holding the lock keeps its own copy)."""
+        self._snapshots.pop(key, None)
+        self._locks.pop(key, None)
+
+    def _drop_idle(self, now: float) -> None:
+        """Drop unwatched snapshots that were not fetched for SNAPSHOT_IDLE_SECONDS."""
+        idle = [
+            key
+            for key, snapshot in self._snapshots.items()
+            if key not in self._feeds
+            and not self._locks[key].locked()
+            and now - snapshot.fetched_at > SNAPSHOT_IDLE_SECONDS
+        ]
+        for key in idle:
+            self._drop(key)
+
+    def clear(self) -> None:
+        """Drop all snapshots and stop refreshing them."""
+        for feed in self._feeds.values():
+            if feed.task:
+                feed.task.cancel()
+        self._feeds.clear()
+        self._snapshots.clear()
+        self._locks.clear()
+
+
+# Global snapshot store instance
+task_snapshot_store = TaskSnapshotStore()
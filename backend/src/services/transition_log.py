@@ -0,0 +1,333 @@
+"""Append-only workflow transition audit log, bounded in memory with optional segments."""
+
+import bisect
+import glob
+import json
+import logging
+import os
+from collections import deque
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+
+from pydantic_core import to_json
+
+from src.models.chat import WorkflowTransition
+
+logger = logging.getLogger(__name__)
+
+# Transitions kept in memory; older ones are only found in segments (if enabled)
+TRANSITION_LOG_CAPACITY = 10_000
+
+# Records per on-disk segment before a new one is started
+TRANSITION_SEGMENT_RECORDS = 5_000
+
+# Sealed segments whose newest transition is older than this are deleted on compaction
+TRANSITION_RETENTION = timedelta(days=90)
+
+SEGMENT_PREFIX = "transitions-"
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    """Compare like transition timestamps, which are naive UTC."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+class TransitionLog:
+    """
+    Workflow transitions in append order, indexed by issue and project.
+
+    The newest ``capacity`` transitions live in a ring buffer addressed by
+    sequence number, with per-issue and per-project lists of sequence
+    numbers, so filtered queries only touch matching entries and time
+    ranges are found by binary search.
+
+    With persistence enabled, every transition is also appended to a
+    JSON-lines segment file. A new segment is started every
+    ``segment_records`` transitions; starting one compacts the log by
+    deleting segments older than the retention period. Queries reaching
+    past the in-memory window read the segments.
+    """
+
+    def __init__(
+        self,
+        capacity: int = TRANSITION_LOG_CAPACITY,
+        segment_records: int = TRANSITION_SEGMENT_RECORDS,
+        retention: timedelta = TRANSITION_RETENTION,
+    ):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.segment_records = segment_records
+        self.retention = retention
+        self._ring: list[WorkflowTransition | None] = [None] * capacity
+        # Sequence number the next transition gets; the oldest kept is next_seq - len(self)
+        self._next_seq = 0
+        self._size = 0
+        self._by_issue: dict[str, deque[int]] = {}
+        self._by_project: dict[str, deque[int]] = {}
+        self._segment_dir: str | None = None
+        self._segment_path: str | None = None
+        self._segment_count = 0
+        # Sequence number of the oldest transition on disk; older memory means nothing to read
+        self._first_persisted_seq = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, transition: WorkflowTransition) -> None:
+        """Record a transition, evicting the oldest from memory if full."""
+        seq = self._insert(transition)
+        if self._segment_dir:
+            self._write(seq, transition)
+
+    def query(
+        self,
+        issue_id: str | None = None,
+        project_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 50,
+    ) -> list[WorkflowTransition]:
+        """
+        Get the most recent transitions matching the filters.
+
+        Segments are only read when ``since`` is older than everything in memory.
+
+        Args:
+            issue_id: Only transitions of this issue
+            project_id: Only transitions in this project
+            since: Only transitions at or after this time
+            until: Only transitions at or before this time
+            limit: Maximum transitions to return
+
+        Returns:
+            Up to ``limit`` matching transitions, oldest first
+        """
+        since, until = _naive_utc(since), _naive_utc(until)
+        first_seq = self._next_seq - self._size
+
+        if issue_id:
+            seqs = self._by_issue.get(issue_id, ())
+        elif project_id:
+            seqs = self._by_project.get(project_id, ())
+        else:
+            seqs = range(first_seq, self._next_seq)
+            # Appends are chronological, so the window can be cut by binary search
+            if until is not None:
+                seqs = seqs[: bisect.bisect_right(seqs, until, key=self._timestamp)]
+            if since is not None:
+                seqs = seqs[bisect.bisect_left(seqs, since, key=self._timestamp) :]
+
+        matches: list[WorkflowTransition] = []
+        for seq in reversed(seqs):
+            if len(matches) == limit:
+                break
+            transition = self._ring[seq % self.capacity]
+            if until is not None and transition.timestamp > until:
+                continue
+            if since is not None and transition.timestamp < since:
+                break
+            if project_id and transition.project_id != project_id:
+                continue
+            matches.append(transition)
+        matches.reverse()
+
+        reaches_past_memory = (
+            self._segment_dir is not None
+            and since is not None
+            and first_seq > self._first_persisted_seq
+            and (not self._size or since < self._timestamp(first_seq))
+        )
+        if len(matches) < limit and reaches_past_memory:
+            older = [
+                t
+                for t in self._read_segments(before_seq=first_seq)
+                if (not issue_id or t.issue_id == issue_id)
+                and (not project_id or t.project_id == project_id)
+                and (since is None or t.timestamp >= since)
+                and (until is None or t.timestamp <= until)
+            ]
+            matches = older[-(limit - len(matches)) :] + matches
+
+        return matches
+
+    def clear(self) -> None:
+        """Forget all transitions kept in memory (segments are not touched)."""
+        self._ring = [None] * self.capacity
+        self._size = 0
+        self._by_issue.clear()
+        self._by_project.clear()
+
+    def enable_persistence(self, directory: str) -> int:
+        """
+        Append transitions to segments in ``directory`` and load the newest ones.
+
+        Args:
+            directory: Directory holding the JSON-lines segments
+
+        Returns:
+            Number of transitions loaded into memory
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._segment_dir = directory
+        self.compact()
+
+        records = deque(self._read_records(), maxlen=self.capacity)
+        self.clear()
+        if records:
+            self._next_seq = records[-1][0] + 1 - len(records)
+        for _, transition in records:
+            self._insert(transition)
+
+        segments = self._segments()
+        if segments:
+            self._first_persisted_seq = self._first_seq(segments[0])
+            self._segment_path = segments[-1]
+            self._segment_count = self._count_lines(segments[-1])
+        else:
+            self._first_persisted_seq = self._next_seq
+        logger.info("Restored %d workflow transitions from %s", len(records), directory)
+        return len(records)
+
+    def compact(self) -> int:
+        """
+        Delete sealed segments that only hold transitions past retention.
+
+        Returns:
+            Number of segments deleted
+        """
+        if not self._segment_dir:
+            return 0
+        cutoff = datetime.utcnow() - self.retention
+        deleted = 0
+        segments = self._segments()
+        for path in segments:
+            # The current segment is still being written to
+            if path == self._segment_path:
+                break
+            newest = self._last_timestamp(path)
+            if newest is not None and newest >= cutoff:
+                break
+            try:
+                os.remove(path)
+                deleted += 1
+            except OSError as e:
+                logger.warning("Failed to delete transition segment %s: %s", path, e)
+                break
+        if deleted:
+            self._first_persisted_seq = (
+                self._first_seq(segments[deleted]) if deleted < len(segments) else self._next_seq
+            )
+            logger.info("Compacted transition log: deleted %d segments", deleted)
+        return deleted
+
+    def stats(self) -> dict[str, int]:
+        """Get entry, index and segment counts."""
+        return {
+            "transitions": self._size,
+            "issues": len(self._by_issue),
+            "projects": len(self._by_project),
+            "segments": len(self._segments()) if self._segment_dir else 0,
+        }
+
+    # ──────────────────────────────────────────────────────────────────
+    # Internal helpers
+    # ──────────────────────────────────────────────────────────────────
+
+    def _insert(self, transition: WorkflowTransition) -> int:
+        """Put a transition in the ring buffer and indexes; returns its sequence number."""
+        seq = self._next_seq
+        if self._size == self.capacity:
+            self._evict(seq - self.capacity)
+        else:
+            self._size += 1
+        self._ring[seq % self.capacity] = transition
+        self._next_seq += 1
+        self._by_issue.setdefault(transition.issue_id, deque()).append(seq)
+        self._by_project.setdefault(transition.project_id, deque()).append(seq)
+        return seq
+
+    def _timestamp(self, seq: int) -> datetime:
+        return self._ring[seq % self.capacity].timestamp
+
+    def _evict(self, seq: int) -> None:
+        """Drop the oldest transition from the indexes (its slot is then reused)."""
+        transition = self._ring[seq % self.capacity]
+        for index, key in (
+            (self._by_issue, transition.issue_id),
+            (self._by_project, transition.project_id),
+        ):
+            seqs = index[key]
+            seqs.popleft()
+            if not seqs:
+                del index[key]
+
+    def _segments(self) -> list[str]:
+        # Zero-padded first sequence numbers sort chronologically
+        return sorted(glob.glob(os.path.join(self._segment_dir, f"{SEGMENT_PREFIX}*.jsonl")))
+
+    def _write(self, seq: int, transition: WorkflowTransition) -> None:
+        if self._segment_path is None or self._segment_count >= self.segment_records:
+            self._segment_path = os.path.join(
+                self._segment_dir, f"{SEGMENT_PREFIX}{seq:012d}.jsonl"
+            )
+            self._segment_count = 0
+            self.compact()
+        try:
+            with open(self._segment_path, "ab") as f:
+                f.write(to_json({"seq": seq, "transition": transition}) + b"\n")
+            self._segment_count += 1
+        except OSError as e:
+            logger.warning("Failed to persist transition to %s: %s", self._segment_path, e)
+
+    def _read_records(
+        self, before_seq: int | None = None
+    ) -> Iterator[tuple[int, WorkflowTransition]]:
+        for path in self._segments():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                            seq = int(record["seq"])
+                            transition = WorkflowTransition.model_validate(record["transition"])
+                        except (ValueError, KeyError, TypeError):
+                            continue
+                        if before_seq is not None and seq >= before_seq:
+                            return
+                        yield seq, transition
+            except OSError as e:
+                logger.warning("Failed to read transition segment %s: %s", path, e)
+
+    def _read_segments(self, before_seq: int | None = None) -> Iterator[WorkflowTransition]:
+        for _, transition in self._read_records(before_seq):
+            yield transition
+
+    def _first_seq(self, path: str) -> int:
+        name = os.path.basename(path)
+        return int(name[len(SEGMENT_PREFIX) : -len(".jsonl")])
+
+    def _last_timestamp(self, path: str) -> datetime | None:
+        last = None
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    last = line
+            if last is not None:
+                return datetime.fromisoformat(json.loads(last)["transition"]["timestamp"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _count_lines(self, path: str) -> int:
+        try:
+            with open(path, "rb") as f:
+                return sum(1 for _ in f)
+        except OSError:
+            return 0
+
+
+# Global transition log instance
+transition_log = TransitionLog()
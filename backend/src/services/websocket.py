@@ -1,20 +1,150 @@
 """WebSocket connection manager for real-time updates."""
 
+import asyncio
 import logging
+from collections import deque
+from typing import Any
 
 from fastapi import WebSocket
+from pydantic_core import to_json
 
 logger = logging.getLogger(__name__)
 
+# Maximum messages buffered per connection before the slow-consumer policy applies
+DEFAULT_MAX_QUEUE_SIZE = 100
+
+# Message types that carry a full task snapshot; only the latest one is worth sending
+SNAPSHOT_MESSAGE_TYPES = frozenset({"initial_data", "refresh"})
+
+# Message types made obsolete by a newer snapshot queued behind them
+SUPERSEDED_BY_SNAPSHOT = SNAPSHOT_MESSAGE_TYPES | {"tasks_delta"}
+
+
+def encode_message(message: dict[str, Any]) -> str:
+    """Encode a message to a JSON text frame (handles UUIDs, datetimes and models)."""
+    return to_json(message).decode()
+
+
+def encode_columnar(records: list[dict[str, Any]]) -> str:
+    """
+    Encode records as one array of values per field.
+
+    ``[{"a": 1, "b": 2}, {"a": 3, "b": 4}]`` becomes
+    ``{"a": [1, 3], "b": [2, 4]}``, so each field name is sent once
+    instead of once per record. All records must share the same fields.
+    """
+    if not records:
+        return "{}"
+    columns = {key: [record[key] for record in records] for key in records[0]}
+    return to_json(columns).decode()
+
+
+def build_snapshot_frame(
+    message_type: str,
+    project_id: str,
+    tasks_json: str,
+    count: int,
+    version: int | None = None,
+    columnar: bool = False,
+) -> str:
+    """
+    Build a task snapshot frame around an already-encoded task list.
+
+    Args:
+        message_type: "initial_data" or "refresh"
+        project_id: GitHub Project ID
+        tasks_json: JSON array of tasks (or columns if ``columnar``), encoded once per snapshot
+        count: Number of tasks
+        version: Snapshot version, if the snapshot is versioned
+        columnar: Whether ``tasks_json`` comes from ``encode_columnar``
+
+    Returns:
+        JSON text frame equivalent to encoding the full message dict. Columnar
+        frames carry ``"format": "columnar"`` and the tasks under ``"columns"``.
+    """
+    version_field = f'"version":{version},' if version is not None else ""
+    tasks_field = (
+        f'"format":"columnar","columns":{tasks_json}' if columnar else f'"tasks":{tasks_json}'
+    )
+    return (
+        f'{{"type":{encode_message(message_type)},"project_id":{encode_message(project_id)},'
+        f'{version_field}{tasks_field},"count":{count}}}'
+    )
+
+
+class _ConnectionSender:
+    """Bounded outgoing queue and writer task for a single WebSocket."""
+
+    def __init__(self, websocket: WebSocket, project_id: str, max_queue_size: int):
+        self.websocket = websocket
+        self.project_id = project_id
+        self.max_queue_size = max_queue_size
+        # (message type, encoded JSON frame)
+        self.queue: deque[tuple[str | None, str]] = deque()
+        self.dropped = 0
+        self._ready = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    def enqueue(self, message_type: str | None, frame: str) -> int:
+        """
+        Queue an encoded frame without waiting for the socket.
+
+        Snapshot frames replace any snapshot or delta still waiting in the queue.
+        When the queue is full the oldest frame is dropped.
+
+        Returns:
+            Number of frames dropped to make room
+        """
+        dropped = 0
+
+        if message_type in SNAPSHOT_MESSAGE_TYPES and self.queue:
+            kept = [item for item in self.queue if item[0] not in SUPERSEDED_BY_SNAPSHOT]
+            dropped += len(self.queue) - len(kept)
+            self.queue = deque(kept)
+
+        while len(self.queue) >= self.max_queue_size:
+            self.queue.popleft()
+            dropped += 1
+
+        self.queue.append((message_type, frame))
+        self.dropped += dropped
+        self._ready.set()
+        return dropped
+
+    async def run(self, on_error) -> None:
+        """Drain the queue to the socket until cancelled or a send fails."""
+        try:
+            while True:
+                await self._ready.wait()
+                while self.queue:
+                    _, frame = self.queue.popleft()
+                    await self.websocket.send_text(frame)
+                self._ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Failed to send to WebSocket: %s", e)
+            on_error(self.websocket)
+
 
 class ConnectionManager:
-    """Manages WebSocket connections for real-time project updates."""
+    """Manages WebSocket connections for real-time project updates.
+
+    Every connection gets its own bounded outgoing queue drained by a
+    dedicated writer task, so a slow client never delays other subscribers
+    or the request handler that triggered the broadcast. Messages are
+    encoded to JSON once and the same text frame is queued for every
+    subscriber.
+    """
 
-    def __init__(self):
+    def __init__(self, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
+        self.max_queue_size = max_queue_size
         # Map project_id -> set of connected websockets
         self._connections: dict[str, set[WebSocket]] = {}
-        # Map websocket -> project_id for cleanup
-        self._socket_projects: dict[WebSocket, str] = {}
+        # Map websocket -> per-connection sender (queue + writer task)
+        self._senders: dict[WebSocket, _ConnectionSender] = {}
+        # Map project_id -> messages dropped for slow consumers
+        self._dropped: dict[str, int] = {}
 
     async def connect(self, websocket: WebSocket, project_id: str) -> None:
         """
@@ -29,8 +159,11 @@ class ConnectionManager:
         if project_id not in self._connections:
             self._connections[project_id] = set()
 
+        sender = _ConnectionSender(websocket, project_id, self.max_queue_size)
+        sender.task = asyncio.create_task(sender.run(self.disconnect))
+
         self._connections[project_id].add(websocket)
-        self._socket_projects[websocket] = project_id
+        self._senders[websocket] = sender
 
         logger.info(
             "WebSocket connected for project %s (total: %d)",
@@ -45,18 +178,49 @@ class ConnectionManager:
         Args:
             websocket: The WebSocket connection to remove
         """
-        project_id = self._socket_projects.pop(websocket, None)
-        if project_id and project_id in self._connections:
+        sender = self._senders.pop(websocket, None)
+        if not sender:
+            return
+
+        if sender.task and sender.task is not asyncio.current_task():
+            sender.task.cancel()
+
+        project_id = sender.project_id
+        if project_id in self._connections:
             self._connections[project_id].discard(websocket)
             if not self._connections[project_id]:
                 del self._connections[project_id]
 
-            logger.info("WebSocket disconnected from project %s", project_id)
+        logger.info("WebSocket disconnected from project %s", project_id)
+
+    def send_to_connection(
+        self, websocket: WebSocket, message: dict, frame: str | None = None
+    ) -> None:
+        """
+        Queue a message for a single connection.
+
+        Messages to one socket are delivered in the order they were queued,
+        together with any broadcasts for its project.
+
+        Args:
+            websocket: Target WebSocket connection
+            message: Message to send (will be JSON encoded)
+            frame: Pre-encoded JSON text for ``message`` (skips encoding)
+        """
+        sender = self._senders.get(websocket)
+        if not sender:
+            logger.debug("Dropping message for unknown WebSocket")
+            return
+        if frame is None:
+            frame = encode_message(message)
+        self._record_drops(sender.project_id, sender.enqueue(message.get("type"), frame))
 
     async def broadcast_to_project(self, project_id: str, message: dict) -> None:
         """
         Broadcast a message to all connections for a project.
 
+        Returns as soon as the message is queued for every connection.
+
         Args:
             project_id: GitHub Project ID
             message: Message to broadcast (will be JSON encoded)
@@ -73,24 +237,27 @@ class ConnectionManager:
             len(connections),
         )
 
-        disconnected = []
-        for websocket in connections:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.warning("Failed to send to WebSocket: %s", e)
-                disconnected.append(websocket)
+        # Encode once and share the frame across all subscribers
+        message_type = message.get("type")
+        frame = encode_message(message)
 
-        # Clean up disconnected sockets
-        for ws in disconnected:
-            self.disconnect(ws)
+        dropped = 0
+        for websocket in list(connections):
+            sender = self._senders.get(websocket)
+            if sender:
+                dropped += sender.enqueue(message_type, frame)
 
-        logger.debug(
-            "Broadcast complete to project %s: %d/%d successful",
-            project_id,
-            len(connections) - len(disconnected),
-            len(connections),
-        )
+        self._record_drops(project_id, dropped)
+
+    def _record_drops(self, project_id: str, dropped: int) -> None:
+        if dropped:
+            self._dropped[project_id] = self._dropped.get(project_id, 0) + dropped
+            logger.warning(
+                "Dropped %d queued messages for slow consumers on project %s (total: %d)",
+                dropped,
+                project_id,
+                self._dropped[project_id],
+            )
 
     def get_connection_count(self, project_id: str) -> int:
         """Get number of active connections for a project."""
@@ -100,6 +267,25 @@ class ConnectionManager:
         """Get total number of active connections."""
         return sum(len(conns) for conns in self._connections.values())
 
+    def get_project_stats(self, project_id: str) -> dict[str, int]:
+        """
+        Get outgoing queue statistics for a project.
+
+        Returns:
+            Dict with connection count, total and max queue depth, and drop count
+        """
+        depths = [
+            len(self._senders[ws].queue)
+            for ws in self._connections.get(project_id, set())
+            if ws in self._senders
+        ]
+        return {
+            "connections": len(depths),
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "dropped_messages": self._dropped.get(project_id, 0),
+        }
+
 
 # Global connection manager instance
 connection_manager = ConnectionManager()
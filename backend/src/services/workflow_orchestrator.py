@@ -13,12 +13,27 @@ TRANSITIONS:
   4. Auto-transition → Update to Ready status (BACKLOG → READY)
   5. Status detection → Move to In Progress, assign Copilot (READY → IN_PROGRESS)
   6. Completion detection → Move to In Review, assign owner (IN_PROGRESS → IN_REVIEW)
+
+On confirmation, steps 2-5 run as a dependency graph (see execute_full_workflow):
+
+  create_issue ─┬─→ add_to_project ─┬─→ set_metadata
+                │                   └─→ transition_to_ready ─→ handle_ready
+                └─→ issue_context ─────────────────────────────→ handle_ready
+  load_fields ─→ set_metadata, transition_to_ready, handle_ready
+
+Confirming several recommendations at once (see execute_bulk_workflow) creates
+the issues concurrently within a rate budget and batches the project writes.
 """
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from src.models.chat import (
     IssueMetadata,
@@ -28,6 +43,8 @@ from src.models.chat import (
     WorkflowResult,
     WorkflowTransition,
 )
+from src.services.github_projects import METADATA_FIELD_MAPPINGS, build_field_value
+from src.services.transition_log import transition_log
 
 if TYPE_CHECKING:
     from src.services.ai_agent import AIAgentService
@@ -67,8 +84,83 @@ class WorkflowContext:
     config: WorkflowConfiguration | None = None
 
 
-# In-memory storage for workflow transitions (audit log)
-_transitions: list[WorkflowTransition] = []
+@dataclass
+class WorkflowStep:
+    """A step of a workflow graph that starts once the steps it runs ``after`` finished."""
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    after: tuple[str, ...] = ()
+
+
+async def run_workflow_steps(steps: list[WorkflowStep], timings: dict[str, float]) -> None:
+    """
+    Run workflow steps, each as soon as its dependencies have finished.
+
+    Steps must be listed after the steps they depend on. If a step raises,
+    the steps still running or waiting are cancelled and the error is
+    re-raised.
+
+    Args:
+        steps: Steps in dependency order
+        timings: Filled with each finished step's duration in milliseconds
+    """
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def run(step: WorkflowStep) -> None:
+        await asyncio.gather(*(tasks[name] for name in step.after))
+        started = time.perf_counter()
+        await step.run()
+        timings[step.name] = round((time.perf_counter() - started) * 1000, 1)
+
+    for step in steps:
+        tasks[step.name] = asyncio.create_task(run(step), name=f"workflow:{step.name}")
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+
+# Bulk confirmation: GitHub writes running at once, and the minimum spacing between
+# issue creations (GitHub asks for about a second between content-creating requests)
+BULK_WRITE_CONCURRENCY = 4
+BULK_CREATE_INTERVAL_SECONDS = 1.0
+
+
+class RateBudget:
+    """Lets at most ``concurrency`` calls run at once, started at least ``interval`` apart."""
+
+    def __init__(self, concurrency: int, interval: float = 0.0):
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._interval = interval
+        self._next_start = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free slot and the next start time, then run the block."""
+        async with self._semaphore:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
+def metadata_to_dict(metadata: IssueMetadata) -> dict:
+    """Convert issue metadata to the dict taken by the GitHub service's metadata setters."""
+    return {
+        "priority": metadata.priority.value if metadata.priority else None,
+        "size": metadata.size.value if metadata.size else None,
+        "estimate_hours": metadata.estimate_hours,
+        "start_date": metadata.start_date,
+        "target_date": metadata.target_date,
+    }
+
 
 # In-memory storage for workflow configurations (per project)
 _workflow_configs: dict[str, WorkflowConfiguration] = {}
@@ -84,12 +176,17 @@ def set_workflow_config(project_id: str, config: WorkflowConfiguration) -> None:
     _workflow_configs[project_id] = config
 
 
-def get_transitions(issue_id: str | None = None, limit: int = 50) -> list[WorkflowTransition]:
-    """Get workflow transitions, optionally filtered by issue_id."""
-    if issue_id:
-        filtered = [t for t in _transitions if t.issue_id == issue_id]
-        return filtered[-limit:]
-    return _transitions[-limit:]
+def get_transitions(
+    issue_id: str | None = None,
+    limit: int = 50,
+    project_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> list[WorkflowTransition]:
+    """Get the latest workflow transitions, optionally filtered by issue, project and time."""
+    return transition_log.query(
+        issue_id=issue_id, project_id=project_id, since=since, until=until, limit=limit
+    )
 
 
 class WorkflowOrchestrator:
@@ -193,7 +290,7 @@ class WorkflowOrchestrator:
             success=success,
             error_message=error_message,
         )
-        _transitions.append(transition)
+        transition_log.append(transition)
         logger.info(
             "Transition logged: %s → %s (success=%s)",
             from_status or "None",
@@ -246,7 +343,10 @@ class WorkflowOrchestrator:
     # STEP 2: Add to Project with Backlog Status (T023)
     # ──────────────────────────────────────────────────────────────────
     async def add_to_project_with_backlog(
-        self, ctx: WorkflowContext, recommendation: IssueRecommendation | None = None
+        self,
+        ctx: WorkflowContext,
+        recommendation: IssueRecommendation | None = None,
+        fields: dict[str, dict] | None = None,
     ) -> str:
         """
         Add created issue to GitHub Project with Backlog status.
@@ -254,6 +354,7 @@ class WorkflowOrchestrator:
         Args:
             ctx: Workflow context with issue_id populated
             recommendation: Optional recommendation with metadata to set
+            fields: Project fields from get_project_fields (looked up when not given)
 
         Returns:
             Project item ID
@@ -278,7 +379,7 @@ class WorkflowOrchestrator:
 
         # Set metadata fields if recommendation has metadata
         if recommendation and hasattr(recommendation, "metadata") and recommendation.metadata:
-            await self._set_issue_metadata(ctx, recommendation.metadata)
+            await self._set_issue_metadata(ctx, recommendation.metadata, fields)
 
         # Log the transition
         self.log_transition(
@@ -292,33 +393,31 @@ class WorkflowOrchestrator:
         logger.info("Added to project, item_id: %s", item_id)
         return item_id
 
-    async def _set_issue_metadata(self, ctx: WorkflowContext, metadata: "IssueMetadata") -> None:
+    async def _set_issue_metadata(
+        self,
+        ctx: WorkflowContext,
+        metadata: "IssueMetadata",
+        fields: dict[str, dict] | None = None,
+    ) -> None:
         """
         Set metadata fields on a project item.
 
         Args:
             ctx: Workflow context with project_item_id populated
             metadata: IssueMetadata with priority, size, dates, etc.
+            fields: Project fields from get_project_fields (looked up when not given)
         """
         if not ctx.project_item_id:
             logger.warning("No project_item_id - cannot set metadata")
             return
 
         try:
-            # Convert metadata to dict for the service
-            metadata_dict = {
-                "priority": metadata.priority.value if metadata.priority else None,
-                "size": metadata.size.value if metadata.size else None,
-                "estimate_hours": metadata.estimate_hours,
-                "start_date": metadata.start_date,
-                "target_date": metadata.target_date,
-            }
-
             results = await self.github.set_issue_metadata(
                 access_token=ctx.access_token,
                 project_id=ctx.project_id,
                 item_id=ctx.project_item_id,
-                metadata=metadata_dict,
+                metadata=metadata_to_dict(metadata),
+                fields=fields,
             )
 
             logger.info("Metadata set results: %s", results)
@@ -330,12 +429,15 @@ class WorkflowOrchestrator:
     # ──────────────────────────────────────────────────────────────────
     # STEP 3: Transition to Ready (T031)
     # ──────────────────────────────────────────────────────────────────
-    async def transition_to_ready(self, ctx: WorkflowContext) -> bool:
+    async def transition_to_ready(
+        self, ctx: WorkflowContext, fields: dict[str, dict] | None = None
+    ) -> bool:
         """
         Automatically transition issue from Backlog to Ready.
 
         Args:
             ctx: Workflow context with project_item_id populated
+            fields: Project fields from get_project_fields (looked up when not given)
 
         Returns:
             True if transition succeeded
@@ -357,6 +459,7 @@ class WorkflowOrchestrator:
             project_id=ctx.project_id,
             item_id=ctx.project_item_id,
             status_name=config.status_ready,
+            fields=fields,
         )
 
         if success:
@@ -383,7 +486,12 @@ class WorkflowOrchestrator:
     # ──────────────────────────────────────────────────────────────────
     # STEP 4: Handle Ready Status (T038, T042)
     # ──────────────────────────────────────────────────────────────────
-    async def handle_ready_status(self, ctx: WorkflowContext) -> bool:
+    async def handle_ready_status(
+        self,
+        ctx: WorkflowContext,
+        custom_instructions: str | None = None,
+        fields: dict[str, dict] | None = None,
+    ) -> bool:
         """
         When Ready status detected: assign GitHub Copilot (with optional custom agent)
         and transition to In Progress.
@@ -394,6 +502,8 @@ class WorkflowOrchestrator:
 
         Args:
             ctx: Workflow context
+            custom_instructions: Prepared by get_custom_agent_instructions (fetched when None)
+            fields: Project fields from get_project_fields (looked up when not given)
 
         Returns:
             True if transition succeeded (assignment failures are logged but don't fail the transition)
@@ -409,23 +519,8 @@ class WorkflowOrchestrator:
 
         # Prepare custom agent configuration
         custom_agent = config.custom_agent if hasattr(config, "custom_agent") else ""
-        custom_instructions = ""
-
-        # If a custom agent is configured, fetch issue details for the prompt
-        if custom_agent and ctx.issue_number:
-            logger.info("Fetching issue details for custom agent '%s'", custom_agent)
-            issue_data = await self.github.get_issue_with_comments(
-                access_token=ctx.access_token,
-                owner=ctx.repository_owner,
-                repo=ctx.repository_name,
-                issue_number=ctx.issue_number,
-            )
-            custom_instructions = self.github.format_issue_context_as_prompt(issue_data)
-            logger.info(
-                "Prepared custom instructions for agent '%s' (length: %d chars)",
-                custom_agent,
-                len(custom_instructions),
-            )
+        if custom_instructions is None:
+            custom_instructions = await self.get_custom_agent_instructions(ctx)
 
         # Try to assign GitHub Copilot Agent (with custom agent if configured)
         copilot_assigned = await self.github.assign_copilot_to_issue(
@@ -486,6 +581,7 @@ class WorkflowOrchestrator:
             project_id=ctx.project_id,
             item_id=ctx.project_item_id,
             status_name=config.status_in_progress,
+            fields=fields,
         )
 
         if not status_success:
@@ -518,6 +614,36 @@ class WorkflowOrchestrator:
 
         return True
 
+    async def get_custom_agent_instructions(self, ctx: WorkflowContext) -> str:
+        """
+        Build the custom agent's instructions from the issue and its comments.
+
+        Args:
+            ctx: Workflow context with issue_number populated
+
+        Returns:
+            Issue context as a prompt, or "" when no custom agent is configured
+        """
+        config = ctx.config or get_workflow_config(ctx.project_id)
+        custom_agent = config.custom_agent if config and hasattr(config, "custom_agent") else ""
+        if not custom_agent or not ctx.issue_number:
+            return ""
+
+        logger.info("Fetching issue details for custom agent '%s'", custom_agent)
+        issue_data = await self.github.get_issue_with_comments(
+            access_token=ctx.access_token,
+            owner=ctx.repository_owner,
+            repo=ctx.repository_name,
+            issue_number=ctx.issue_number,
+        )
+        custom_instructions = self.github.format_issue_context_as_prompt(issue_data)
+        logger.info(
+            "Prepared custom instructions for agent '%s' (length: %d chars)",
+            custom_agent,
+            len(custom_instructions),
+        )
+        return custom_instructions
+
     # ──────────────────────────────────────────────────────────────────
     # STEP 5: Handle In Progress Status - Check for PR Completion
     # ──────────────────────────────────────────────────────────────────
@@ -757,8 +883,15 @@ class WorkflowOrchestrator:
 
         This orchestrates:
         1. Create GitHub Issue from recommendation
-        2. Add issue to project with Backlog status
+        2. Add issue to project with Backlog status (and set its metadata)
         3. Transition to Ready status
+        4. Assign GitHub Copilot and transition to In Progress
+
+        Steps run as a dependency graph: the project's fields are loaded
+        while the issue is created, the custom agent's issue context is
+        fetched while the issue is added to the project, and metadata is
+        set while the status moves on. Each step's duration is reported in
+        ``WorkflowResult.step_timings_ms``.
 
         Args:
             ctx: Workflow context
@@ -767,51 +900,294 @@ class WorkflowOrchestrator:
         Returns:
             WorkflowResult with success status and details
         """
-        try:
-            # Step 1: Create issue
-            await self.create_issue_from_recommendation(ctx, recommendation)
+        fields: dict[str, dict] = {}
+        custom_instructions = ""
+        timings: dict[str, float] = {}
 
-            # Step 2: Add to project with metadata
-            await self.add_to_project_with_backlog(ctx, recommendation)
+        async def load_fields() -> None:
+            fields.update(await self.github.get_project_fields(ctx.access_token, ctx.project_id))
 
-            # Step 3: Transition to Ready
-            await self.transition_to_ready(ctx)
+        async def issue_context() -> None:
+            nonlocal custom_instructions
+            custom_instructions = await self.get_custom_agent_instructions(ctx)
 
-            # Step 4: Assign GitHub Copilot and transition to In Progress
-            await self.handle_ready_status(ctx)
+        async def set_metadata() -> None:
+            if recommendation.metadata:
+                await self._set_issue_metadata(ctx, recommendation.metadata, fields or None)
 
-            return WorkflowResult(
-                success=True,
-                issue_id=ctx.issue_id,
-                issue_number=ctx.issue_number,
-                issue_url=ctx.issue_url,
-                project_item_id=ctx.project_item_id,
-                current_status=ctx.current_state.value if ctx.current_state else "In Progress",
-                message=f"Issue #{ctx.issue_number} created, added to project, and assigned to {ctx.config.copilot_assignee if ctx.config else 'Copilot'}",
-            )
+        steps = [
+            WorkflowStep(
+                "create_issue", lambda: self.create_issue_from_recommendation(ctx, recommendation)
+            ),
+            WorkflowStep("load_fields", load_fields),
+            WorkflowStep(
+                "add_to_project",
+                lambda: self.add_to_project_with_backlog(ctx),
+                after=("create_issue",),
+            ),
+            WorkflowStep("issue_context", issue_context, after=("create_issue",)),
+            WorkflowStep("set_metadata", set_metadata, after=("add_to_project", "load_fields")),
+            WorkflowStep(
+                "transition_to_ready",
+                lambda: self.transition_to_ready(ctx, fields),
+                after=("add_to_project", "load_fields"),
+            ),
+            WorkflowStep(
+                "handle_ready",
+                lambda: self.handle_ready_status(ctx, custom_instructions, fields),
+                after=("transition_to_ready", "issue_context"),
+            ),
+        ]
 
+        try:
+            await run_workflow_steps(steps, timings)
+            return self._workflow_result(ctx, self._completed_message(ctx), timings)
         except Exception as e:
-            logger.error("Workflow failed: %s", e)
-            ctx.current_state = WorkflowState.ERROR
+            return self._workflow_failed(ctx, e, timings)
 
-            self.log_transition(
-                ctx=ctx,
-                from_status=ctx.current_state.value if ctx.current_state else None,
-                to_status="error",
-                triggered_by=TriggeredBy.AUTOMATIC,
-                success=False,
-                error_message=str(e),
+    # ──────────────────────────────────────────────────────────────────
+    # BULK WORKFLOW: Confirm several recommendations at once
+    # ──────────────────────────────────────────────────────────────────
+    async def execute_bulk_workflow(
+        self,
+        ctx: WorkflowContext,
+        recommendations: list[IssueRecommendation],
+        on_progress: Callable[[str, str, WorkflowResult], Awaitable[None]] | None = None,
+        budget: RateBudget | None = None,
+    ) -> list[WorkflowResult]:
+        """
+        Execute the confirmation workflow for several recommendations at once.
+
+        Issues are created concurrently within ``budget`` while the project's
+        fields load. The issues are then added to the project, and given
+        their metadata and Ready status, with batched aliased mutations
+        instead of one request chain per issue. Finally Copilot is assigned
+        to each issue concurrently. A recommendation failing does not stop
+        the others.
+
+        Args:
+            ctx: Workflow context shared by the recommendations (before any issue exists)
+            recommendations: The confirmed recommendations
+            on_progress: Awaited with the recommendation ID, stage ("issue_created",
+                "added_to_project", "ready", "completed" or "failed") and result so far
+            budget: Limits issue creation (defaults to BULK_WRITE_CONCURRENCY issues
+                at once, started BULK_CREATE_INTERVAL_SECONDS apart)
+
+        Returns:
+            WorkflowResult per recommendation, in order
+        """
+        budget = budget or RateBudget(BULK_WRITE_CONCURRENCY, BULK_CREATE_INTERVAL_SECONDS)
+        contexts = [
+            replace(ctx, recommendation_id=str(r.recommendation_id)) for r in recommendations
+        ]
+        results: list[WorkflowResult | None] = [None] * len(contexts)
+        failed: set[int] = set()
+        fields_task = asyncio.create_task(
+            self.github.get_project_fields(ctx.access_token, ctx.project_id)
+        )
+
+        async def report(i: int, stage: str, result: WorkflowResult) -> None:
+            results[i] = result
+            if on_progress:
+                await on_progress(str(contexts[i].recommendation_id), stage, result)
+
+        async def fail(i: int, error: Exception) -> None:
+            failed.add(i)
+            await report(i, "failed", self._workflow_failed(contexts[i], error))
+
+        async def run_stage(stage: Callable[[list[int]], Awaitable[None]]) -> None:
+            pending = [i for i in range(len(contexts)) if i not in failed]
+            if not pending:
+                return
+            try:
+                await stage(pending)
+            except Exception as e:
+                for i in pending:
+                    if i not in failed:
+                        await fail(i, e)
+
+        async def create_issue(i: int) -> None:
+            try:
+                async with budget.slot():
+                    await self.create_issue_from_recommendation(contexts[i], recommendations[i])
+            except Exception as e:
+                await fail(i, e)
+                return
+            message = f"Issue #{contexts[i].issue_number} created"
+            await report(i, "issue_created", self._workflow_result(contexts[i], message))
+
+        try:
+            await asyncio.gather(*(create_issue(i) for i in range(len(contexts))))
+        finally:
+            fields = await fields_task
+
+        async def add_to_project(pending: list[int]) -> None:
+            item_ids = await self.github.add_issues_to_project(
+                ctx.access_token, ctx.project_id, [contexts[i].issue_id for i in pending]
             )
+            for i, item_id in zip(pending, item_ids, strict=True):
+                item_ctx = contexts[i]
+                if not item_id:
+                    await fail(i, ValueError(f"Could not add issue #{item_ctx.issue_number}"))
+                    continue
+                item_ctx.project_item_id = item_id
+                item_ctx.current_state = WorkflowState.BACKLOG
+                self.log_transition(
+                    ctx=item_ctx,
+                    from_status=None,
+                    to_status="Backlog",
+                    triggered_by=TriggeredBy.AUTOMATIC,
+                    success=True,
+                )
+                message = f"Issue #{item_ctx.issue_number} added to project"
+                await report(i, "added_to_project", self._workflow_result(item_ctx, message))
 
-            return WorkflowResult(
-                success=False,
-                issue_id=ctx.issue_id,
-                issue_number=ctx.issue_number,
-                issue_url=ctx.issue_url,
-                project_item_id=ctx.project_item_id,
-                current_status="error",
-                message=f"Workflow failed: {e}",
+        async def set_fields(pending: list[int]) -> None:
+            await self._set_bulk_fields(
+                [(contexts[i], recommendations[i]) for i in pending], fields
+            )
+            for i in pending:
+                message = f"Issue #{contexts[i].issue_number} is {contexts[i].current_state.value}"
+                await report(i, "ready", self._workflow_result(contexts[i], message))
+
+        await run_stage(add_to_project)
+        await run_stage(set_fields)
+
+        # Assigning Copilot is an update, not content creation, so only concurrency is limited
+        handoff_budget = RateBudget(BULK_WRITE_CONCURRENCY)
+
+        async def hand_off(i: int) -> None:
+            try:
+                async with handoff_budget.slot():
+                    await self.handle_ready_status(contexts[i], None, fields or None)
+            except Exception as e:
+                await fail(i, e)
+                return
+            message = self._completed_message(contexts[i])
+            await report(i, "completed", self._workflow_result(contexts[i], message))
+
+        await run_stage(lambda pending: asyncio.gather(*(hand_off(i) for i in pending)))
+        return results
+
+    async def _set_bulk_fields(
+        self,
+        items: list[tuple[WorkflowContext, IssueRecommendation]],
+        fields: dict[str, dict],
+    ) -> None:
+        """
+        Set metadata and Ready status on newly added project items with batched mutations.
+
+        Args:
+            items: Workflow contexts (with project_item_id populated) and their recommendations
+            fields: Project fields from get_project_fields
+        """
+        updates: list[tuple[str, str, dict]] = []
+        # Context of each update, and whether it is the status update
+        owners: list[tuple[WorkflowContext, bool]] = []
+
+        for item_ctx, recommendation in items:
+            if recommendation.metadata:
+                metadata = metadata_to_dict(recommendation.metadata)
+                for field_name, (key, field_type) in METADATA_FIELD_MAPPINGS.items():
+                    field = fields.get(field_name)
+                    if not field or not metadata.get(key):
+                        continue
+                    value = build_field_value(field, metadata[key], field_type)
+                    if value:
+                        updates.append((item_ctx.project_item_id, field["id"], value))
+                        owners.append((item_ctx, False))
+
+            config = item_ctx.config or get_workflow_config(item_ctx.project_id)
+            if not config:
+                logger.warning("No workflow config for project %s", item_ctx.project_id)
+                continue
+            status_field = fields.get("Status")
+            ready = (
+                build_field_value(status_field, config.status_ready, "select")
+                if status_field
+                else None
             )
+            if ready:
+                updates.append((item_ctx.project_item_id, status_field["id"], ready))
+                owners.append((item_ctx, True))
+            else:
+                logger.error(
+                    "Could not find status option '%s' in project %s",
+                    config.status_ready,
+                    item_ctx.project_id,
+                )
+                self._log_ready_transition(item_ctx, config, success=False)
+
+        if not updates:
+            return
+        ctx = items[0][0]
+        outcomes = await self.github.set_item_field_values(
+            ctx.access_token, ctx.project_id, updates
+        )
+        for (item_ctx, is_status), success in zip(owners, outcomes, strict=True):
+            if not is_status:
+                continue
+            config = item_ctx.config or get_workflow_config(item_ctx.project_id)
+            if success:
+                item_ctx.current_state = WorkflowState.READY
+            self._log_ready_transition(item_ctx, config, success=success)
+
+    def _log_ready_transition(
+        self, ctx: WorkflowContext, config: WorkflowConfiguration, success: bool
+    ) -> None:
+        self.log_transition(
+            ctx=ctx,
+            from_status=config.status_backlog,
+            to_status=config.status_ready,
+            triggered_by=TriggeredBy.AUTOMATIC,
+            success=success,
+            error_message=None if success else "Failed to update status",
+        )
+
+    def _completed_message(self, ctx: WorkflowContext) -> str:
+        return f"Issue #{ctx.issue_number} created, added to project, and assigned to {ctx.config.copilot_assignee if ctx.config else 'Copilot'}"
+
+    def _workflow_result(
+        self, ctx: WorkflowContext, message: str, timings: dict[str, float] | None = None
+    ) -> WorkflowResult:
+        """Build a successful result from the workflow context."""
+        return WorkflowResult(
+            success=True,
+            issue_id=ctx.issue_id,
+            issue_number=ctx.issue_number,
+            issue_url=ctx.issue_url,
+            project_item_id=ctx.project_item_id,
+            current_status=ctx.current_state.value if ctx.current_state else "In Progress",
+            message=message,
+            step_timings_ms=timings or {},
+        )
+
+    def _workflow_failed(
+        self, ctx: WorkflowContext, error: Exception, timings: dict[str, float] | None = None
+    ) -> WorkflowResult:
+        """Log a failed workflow and build its result."""
+        logger.error("Workflow failed: %s", error)
+        ctx.current_state = WorkflowState.ERROR
+
+        self.log_transition(
+            ctx=ctx,
+            from_status=ctx.current_state.value if ctx.current_state else None,
+            to_status="error",
+            triggered_by=TriggeredBy.AUTOMATIC,
+            success=False,
+            error_message=str(error),
+        )
+
+        return WorkflowResult(
+            success=False,
+            issue_id=ctx.issue_id,
+            issue_number=ctx.issue_number,
+            issue_url=ctx.issue_url,
+            project_item_id=ctx.project_item_id,
+            current_status="error",
+            message=f"Workflow failed: {error}",
+            step_timings_ms=timings or {},
+        )
 
 
 # Global orchestrator instance (lazy initialization)
@@ -1,6 +1,9 @@
 """Unit tests for the AI agent service (Azure OpenAI integration)."""
 
+import asyncio
 import sys
+import threading
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -10,6 +13,7 @@ mock_openai = MagicMock()
 mock_openai.AzureOpenAI = MagicMock()
 sys.modules["openai"] = mock_openai
 
+from src.models.chat import IssueRecommendation
 from src.services.ai_agent import (
     AIAgentService,
     GeneratedTask,
@@ -122,6 +126,252 @@ class TestGenerateTaskFromDescription:
             await mock_service.generate_task_from_description("Create task", "Project")
 
 
+class TestCompletionExecution:
+    """Tests for running blocking completions off the event loop."""
+
+    @staticmethod
+    def make_service(**kwargs):
+        with patch("src.services.ai_agent.get_settings") as mock_settings:
+            mock_settings.return_value = Mock(
+                azure_openai_endpoint="https://test.openai.azure.com",
+                azure_openai_key="test-key",
+                azure_openai_deployment="gpt-4",
+            )
+            return AIAgentService(**kwargs)
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_serving_during_slow_completion(self):
+        """Other coroutines should keep running while a completion blocks."""
+        service = self.make_service()
+
+        def slow_completion(*_args):
+            time.sleep(0.3)
+            return '{"title": "Slow Task", "description": "Done"}'
+
+        service._call_completion = Mock(side_effect=slow_completion)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        try:
+            result = await service.generate_task_from_description("Create task", "Project")
+        finally:
+            ticking.cancel()
+
+        assert result.title == "Slow Task"
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_completions(self):
+        """Should never run more completions at once than allowed."""
+        service = self.make_service(max_concurrent_completions=2)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def completion(*_args):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return '{"title": "Task", "description": "Done"}'
+
+        service._call_completion = Mock(side_effect=completion)
+
+        await asyncio.gather(
+            *(service.generate_task_from_description("Create task", "Project") for _ in range(6))
+        )
+
+        assert peak == 2
+        assert service._call_completion.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_generation_queues_behind_interactive_completions(self):
+        """Non-streamed generation should wait while short chat completions are queued."""
+        service = self.make_service(max_concurrent_completions=1)
+        release = threading.Event()
+        order = []
+
+        def completion(messages, *_args):
+            if not order:
+                order.append("first")
+                release.wait(1)
+                return '{"title": "Task", "description": "Done"}'
+            if "Three" in messages[-1]["content"]:
+                order.append("intent")
+                return '{"intent": "other", "confidence": 0.1}'
+            order.append("task")
+            return '{"title": "Task", "description": "Done"}'
+
+        service._call_completion = Mock(side_effect=completion)
+
+        first = asyncio.create_task(service.generate_task_from_description("One", "Project"))
+        await asyncio.sleep(0.05)
+        task = asyncio.create_task(service.generate_task_from_description("Two", "Project"))
+        await asyncio.sleep(0)
+        intent = asyncio.create_task(service.detect_feature_request_intent("Three"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, task, intent)
+
+        assert order == ["first", "intent", "task"]
+
+    @pytest.mark.asyncio
+    async def test_times_out_slow_completion(self):
+        """Should give up on a completion that exceeds the timeout."""
+        service = self.make_service(completion_timeout=0.05)
+        service._call_completion = Mock(side_effect=lambda *_: time.sleep(0.3) or "{}")
+
+        with pytest.raises(ValueError, match="timed out"):
+            await service.generate_task_from_description("Create task", "Project")
+
+
+class TestRouteChatMessage:
+    """Tests for single-call chat routing."""
+
+    SESSION_ID = "6f1c2d3e-4a5b-4c6d-8e7f-901234567890"
+
+    @pytest.fixture
+    def mock_service(self):
+        """Create a service with mocked client."""
+        with patch("src.services.ai_agent.get_settings") as mock_settings:
+            mock_settings.return_value = Mock(
+                azure_openai_endpoint="https://test.openai.azure.com",
+                azure_openai_key="test-key",
+                azure_openai_deployment="gpt-4",
+            )
+            return AIAgentService()
+
+    async def route(self, service, response: str):
+        service._call_completion = Mock(return_value=response)
+        return await service.route_chat_message(
+            user_input="Move login to done",
+            project_name="Project",
+            session_id=self.SESSION_ID,
+            available_tasks=["Login"],
+            available_statuses=["Todo", "Done"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_routes_status_change(self, mock_service):
+        """Should return the status change from the same completion."""
+        route = await self.route(
+            mock_service,
+            '{"intent": "status_change", "confidence": 0.9, "feature_request": null, '
+            '"status_change": {"task_reference": "login", "target_status": "Done"}, "task": null}',
+        )
+
+        assert route.intent == "status_change"
+        assert route.status_change == StatusChangeIntent("login", "Done", 0.9)
+        assert mock_service._call_completion.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_routes_task(self, mock_service):
+        """Should return a validated generated task."""
+        route = await self.route(
+            mock_service,
+            '{"intent": "task", "confidence": 0.8, '
+            '"task": {"title": "Write docs", "description": "Details"}}',
+        )
+
+        assert route.task == GeneratedTask(title="Write docs", description="Details")
+
+    @pytest.mark.asyncio
+    async def test_routes_feature_request(self, mock_service):
+        """Should build an issue recommendation from the routed payload."""
+        route = await self.route(
+            mock_service,
+            '{"intent": "feature_request", "confidence": 0.9, "feature_request": '
+            '{"title": "CSV export", "user_story": "As a user...", '
+            '"ui_ux_description": "Button", "functional_requirements": ["System MUST export"], '
+            '"metadata": {"priority": "P2", "size": "M"}}}',
+        )
+
+        assert route.recommendation.title == "CSV export"
+        assert str(route.recommendation.session_id) == self.SESSION_ID
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_unusable(self, mock_service):
+        """Should signal a fallback for low confidence, missing payloads and errors."""
+        assert await self.route(mock_service, '{"intent": "task", "confidence": 0.2}') is None
+        assert await self.route(mock_service, '{"intent": "task", "confidence": 0.9}') is None
+        assert await self.route(mock_service, "not json") is None
+
+        mock_service._call_completion = Mock(side_effect=Exception("boom"))
+        assert (
+            await mock_service.route_chat_message("Hi", "Project", self.SESSION_ID, [], ["Todo"])
+            is None
+        )
+
+
+class TestStreamIssueRecommendation:
+    """Tests for streamed issue recommendations."""
+
+    RESPONSE = (
+        '{"title": "CSV export", "user_story": "As a user, I want CSV", '
+        '"ui_ux_description": "Button", '
+        '"functional_requirements": ["System MUST export", "System MUST name files"], '
+        '"metadata": {"priority": "P2", "size": "S"}}'
+    )
+
+    @pytest.fixture
+    def mock_service(self):
+        """Create a service with mocked client."""
+        with patch("src.services.ai_agent.get_settings") as mock_settings:
+            mock_settings.return_value = Mock(
+                azure_openai_endpoint="https://test.openai.azure.com",
+                azure_openai_key="test-key",
+                azure_openai_deployment="gpt-4",
+            )
+            return AIAgentService()
+
+    @pytest.mark.asyncio
+    async def test_yields_fields_then_recommendation(self, mock_service):
+        """Should yield field events as chunks arrive and the parsed result last."""
+        chunks = [self.RESPONSE[i : i + 7] for i in range(0, len(self.RESPONSE), 7)]
+        mock_service._call_completion_stream = Mock(return_value=iter(chunks))
+
+        items = [
+            item
+            async for item in mock_service.stream_issue_recommendation(
+                "CSV export", "Project", "6f1c2d3e-4a5b-4c6d-8e7f-901234567890"
+            )
+        ]
+
+        *events, recommendation = items
+        assert isinstance(recommendation, IssueRecommendation)
+        assert recommendation.title == "CSV export"
+        assert "".join(e.value for e in events if e.field == "title") == "CSV export"
+        assert [e.value for e in events if e.kind == "item"] == [
+            "System MUST export",
+            "System MUST name files",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_raises_helpful_error(self, mock_service):
+        """Should map SDK failures like the non-streaming call."""
+
+        def failing_stream(*_args):
+            yield '{"title": "CSV'
+            raise Exception("401 Access denied")
+
+        mock_service._call_completion_stream = Mock(side_effect=failing_stream)
+
+        with pytest.raises(ValueError, match="authentication failed"):
+            async for _ in mock_service.stream_issue_recommendation(
+                "CSV export", "Project", "6f1c2d3e-4a5b-4c6d-8e7f-901234567890"
+            ):
+                pass
+
+
 class TestParseStatusChangeRequest:
     """Tests for status change intent detection."""
 
@@ -194,6 +444,122 @@ class TestParseStatusChangeRequest:
         assert result is None
 
 
+class TestCompletionCaching:
+    """Tests for reusing completions of repeated requests."""
+
+    @pytest.fixture
+    def mock_service(self):
+        """Create a service with mocked client."""
+        with patch("src.services.ai_agent.get_settings") as mock_settings:
+            mock_settings.return_value = Mock(
+                azure_openai_endpoint="https://test.openai.azure.com",
+                azure_openai_key="test-key",
+                azure_openai_deployment="gpt-4",
+            )
+            return AIAgentService()
+
+    @pytest.mark.asyncio
+    async def test_repeated_status_change_is_served_from_cache(self, mock_service):
+        """Should call the model once for the same message and board."""
+        mock_service._call_completion = Mock(
+            return_value='{"intent": "status_change", "task_reference": "Login", "target_status": "Done", "confidence": 0.9}'
+        )
+
+        first = await mock_service.parse_status_change_request(
+            "Move login to done", ["Login"], ["Todo", "Done"]
+        )
+        second = await mock_service.parse_status_change_request(
+            "move login to Done", ["Login"], ["Todo", "Done"]
+        )
+
+        assert mock_service._call_completion.call_count == 1
+        assert second == first
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_changed_board_is_not_served_from_cache(self, mock_service):
+        """Should call the model again when the available tasks differ."""
+        mock_service._call_completion = Mock(
+            return_value='{"intent": "status_change", "task_reference": "Login", "target_status": "Done", "confidence": 0.9}'
+        )
+
+        await mock_service.parse_status_change_request("Move login to done", ["Login"], ["Done"])
+        await mock_service.parse_status_change_request(
+            "Move login to done", ["Login", "Signup"], ["Done"]
+        )
+
+        assert mock_service._call_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_feature_request_is_served_from_cache(self, mock_service):
+        """Should reuse feature detection for a near-identical message."""
+        mock_service._call_completion = Mock(
+            return_value='{"intent": "feature_request", "confidence": 0.9}'
+        )
+
+        assert await mock_service.detect_feature_request_intent(
+            "I need a CSV export for the reports page"
+        )
+        assert await mock_service.detect_feature_request_intent(
+            "I need a CSV export for the reports page!"
+        )
+
+        assert mock_service._call_completion.call_count == 1
+        stats = mock_service.get_completion_cache_stats()["detect_feature_request_intent"]
+        assert stats["similar_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, mock_service):
+        """Should retry the model after a failed completion."""
+        mock_service._call_completion = Mock(side_effect=Exception("API Error"))
+        with pytest.raises(ValueError):
+            await mock_service.generate_task_from_description("Add login", "Project")
+
+        mock_service._call_completion = Mock(
+            return_value='{"title": "Add login", "description": "Details"}'
+        )
+        result = await mock_service.generate_task_from_description("Add login", "Project")
+
+        assert result.title == "Add login"
+        assert mock_service._call_completion.call_count == 1
+
+
+class TestMatchStatusCommand:
+    """Tests for the local status change fast path."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service with mocked initialization."""
+        with patch("src.services.ai_agent.get_settings") as mock_settings:
+            mock_settings.return_value = Mock(
+                azure_openai_endpoint="https://test.openai.azure.com",
+                azure_openai_api_key="test-key",
+                azure_openai_deployment="gpt-4",
+            )
+            with patch("openai.AzureOpenAI"):
+                return AIAgentService()
+
+    def test_matches_command_without_model(self, service):
+        """Should return the exact task title and status without a completion."""
+        service._call_completion = Mock()
+        tasks = [{"task_id": "1", "title": "Fix login bug"}]
+
+        result = service.match_status_command(
+            "move fix login bug to in progress", tasks, ["Todo", "In Progress"]
+        )
+
+        assert result.task_reference == "Fix login bug"
+        assert result.target_status == "In Progress"
+        assert result.confidence >= 0.8
+        service._call_completion.assert_not_called()
+
+    def test_returns_none_for_free_text(self, service):
+        """Should leave messages that are not clear-cut commands to the model."""
+        tasks = [{"task_id": "1", "title": "Fix login bug"}]
+
+        assert service.match_status_command("the login is broken", tasks, ["Done"]) is None
+
+
 class TestIdentifyTargetTask:
     """Tests for task reference matching."""
 
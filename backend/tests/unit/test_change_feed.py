@@ -0,0 +1,181 @@
+"""Unit tests for the shared project change feed."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.services.cache import get_project_items_cache_key
+from src.services.change_feed import ProjectChangeFeed, _ProjectFeed
+
+
+def poll_result(*changes):
+    return {"changes": list(changes), "current_tasks": [], "workflow_triggers": []}
+
+
+def status_change(item_id: str, new_status: str) -> dict:
+    return {"type": "status_changed", "task_id": item_id, "new_status": new_status}
+
+
+def unauthorized() -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://api.github.com/graphql")
+    return httpx.HTTPStatusError(
+        "401", request=request, response=httpx.Response(401, request=request)
+    )
+
+
+async def take(events, count: int) -> list:
+    return [await asyncio.wait_for(anext(events), timeout=1) for _ in range(count)]
+
+
+class TestProjectChangeFeed:
+    """Tests for polling once and fanning out."""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_poll(self):
+        """Two subscribers of the same project should cause a single poll."""
+        feed = ProjectChangeFeed(poll_interval=60)
+        with patch(
+            "src.services.change_feed.github_projects_service.poll_project_changes",
+            new_callable=AsyncMock,
+            return_value=poll_result(status_change("PVTI_1", "Done")),
+        ) as mock_poll:
+            first = feed.subscribe("token", "user1", "PVT_1")
+            second = feed.subscribe("token", "user1", "PVT_1")
+            first_events, second_events = await asyncio.gather(take(first, 2), take(second, 2))
+            await first.aclose()
+            await second.aclose()
+
+        mock_poll.assert_awaited_once()
+        assert [e.event for e in first_events] == ["status_changed", "heartbeat"]
+        assert first_events == second_events
+        assert json.loads(first_events[0].data)["new_status"] == "Done"
+
+    @pytest.mark.asyncio
+    async def test_resume_from_last_event_id(self):
+        """A reconnecting subscriber should get only the events it missed."""
+        feed = ProjectChangeFeed(poll_interval=60)
+        with patch(
+            "src.services.change_feed.github_projects_service.poll_project_changes",
+            new_callable=AsyncMock,
+            return_value=poll_result(
+                status_change("PVTI_1", "In Progress"), status_change("PVTI_2", "Done")
+            ),
+        ):
+            live = feed.subscribe("token", "user1", "PVT_1")
+            first, second, _ = await take(live, 3)
+
+            resumed = feed.subscribe("token", "user1", "PVT_1", last_event_id=first.id)
+            (replayed,) = await take(resumed, 1)
+            await resumed.aclose()
+            await live.aclose()
+
+        assert replayed == second
+
+    @pytest.mark.asyncio
+    async def test_refresh_while_subscriber_is_suspended(self):
+        """Events polled while a subscriber is mid-delivery should follow, not break it."""
+        feed = ProjectChangeFeed(poll_interval=60)
+        polls = iter(range(1, 100))
+
+        async def poll(*_args):
+            n = next(polls)
+            return poll_result(
+                status_change(f"PVTI_{n}a", "Done"), status_change(f"PVTI_{n}b", "Done")
+            )
+
+        with patch(
+            "src.services.change_feed.github_projects_service.poll_project_changes",
+            new_callable=AsyncMock,
+            side_effect=poll,
+        ):
+            events = feed.subscribe("token", "user1", "PVT_1")
+            (first,) = await take(events, 1)
+
+            feed.request_refresh("PVT_1")
+            while feed._feeds[("PVT_1", "user1")].polls < 2:
+                await asyncio.sleep(0)
+            rest = await take(events, 5)
+            await events.aclose()
+
+        received = [json.loads(e.data)["task_id"] for e in [first, *rest] if e.event != "heartbeat"]
+        assert received == ["PVTI_1a", "PVTI_1b", "PVTI_2a", "PVTI_2b"]
+        assert [e.event for e in rest].count("heartbeat") == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_last_event_id_requests_resync(self):
+        """Should tell the client to resync when events are no longer buffered."""
+        feed = ProjectChangeFeed(poll_interval=60)
+        with patch(
+            "src.services.change_feed.github_projects_service.poll_project_changes",
+            new_callable=AsyncMock,
+            return_value=poll_result(),
+        ):
+            events = feed.subscribe("token", "user1", "PVT_1", last_event_id=1)
+            (event,) = await take(events, 1)
+            await events.aclose()
+
+        assert event.event == "resync"
+
+    @pytest.mark.asyncio
+    async def test_polling_stops_without_subscribers(self):
+        """The poll task should be cancelled when the last subscriber leaves."""
+        feed = ProjectChangeFeed(poll_interval=60)
+        with patch(
+            "src.services.change_feed.github_projects_service.poll_project_changes",
+            new_callable=AsyncMock,
+            return_value=poll_result(),
+        ):
+            events = feed.subscribe("token", "user1", "PVT_1")
+            await take(events, 1)
+            task = feed._feeds[("PVT_1", "user1")].task
+            await events.aclose()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert task.cancelled()
+        assert feed.get_subscriber_count("PVT_1") == 0
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_falls_back_to_other_subscribers(self):
+        """An expired token of the newest subscriber should not stop polling for the rest."""
+        feed = ProjectChangeFeed(poll_interval=60)
+
+        async def poll(token, *_args):
+            if token == "expired":
+                raise unauthorized()
+            return poll_result(status_change("PVTI_1", "Done"))
+
+        with patch(
+            "src.services.change_feed.github_projects_service.poll_project_changes",
+            new_callable=AsyncMock,
+            side_effect=poll,
+        ) as mock_poll:
+            first = feed.subscribe("valid", "user1", "PVT_1")
+            second = feed.subscribe("expired", "user1", "PVT_1")
+            first_events, _ = await asyncio.gather(take(first, 2), take(second, 2))
+            project_feed = feed._feeds[("PVT_1", "user1")]
+            await first.aclose()
+            await second.aclose()
+
+        assert [e.event for e in first_events] == ["status_changed", "heartbeat"]
+        assert [call.args[0] for call in mock_poll.call_args_list] == ["expired", "valid"]
+        assert project_feed.rejected == set()
+
+    def test_seeds_from_summary_cache(self):
+        """The first diff should start from the summary items the poll also fetches."""
+        cached = [object()]
+        with patch("src.services.change_feed.cache.get", return_value=cached) as mock_get:
+            project_feed = _ProjectFeed("PVT_1")
+
+        mock_get.assert_called_once_with(get_project_items_cache_key("PVT_1", profile="summary"))
+        assert project_feed.cached_tasks is cached
+
+    def test_request_refresh_wakes_task_snapshots(self):
+        """Webhook refreshes should reach WebSocket snapshot watchers too."""
+        feed = ProjectChangeFeed(poll_interval=60)
+        with patch("src.services.change_feed.task_snapshot_store.request_refresh") as mock_refresh:
+            feed.request_refresh("PVT_1")
+
+        mock_refresh.assert_called_once_with("PVT_1")
@@ -0,0 +1,112 @@
+"""Unit tests for the bounded chat store."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+from src.models.chat import AITaskProposal, ChatMessage, SenderType
+from src.services.chat_store import ChatStore
+
+SESSION_ID = uuid4()
+
+
+def message(text: str) -> ChatMessage:
+    return ChatMessage(session_id=SESSION_ID, sender_type=SenderType.USER, content=text)
+
+
+def contents(messages: list[ChatMessage]) -> list[str]:
+    return [m.content for m in messages]
+
+
+class TestChatStoreMessages:
+    """Tests for per-session message history."""
+
+    def test_keeps_only_latest_messages(self):
+        """Should drop the oldest messages once the ring buffer is full."""
+        store = ChatStore(history_limit=3)
+        for i in range(5):
+            store.add_message("s", message(f"m{i}"))
+
+        messages, cursor = store.get_messages("s")
+
+        assert contents(messages) == ["m2", "m3", "m4"]
+        assert cursor is None
+        assert store.stats()["evicted_messages"] == 2
+
+    def test_paginates_backwards_with_cursor(self):
+        """Should page from newest to oldest using next_cursor."""
+        store = ChatStore(history_limit=10)
+        for i in range(12):
+            store.add_message("s", message(f"m{i}"))
+
+        page1, cursor1 = store.get_messages("s", limit=4)
+        page2, cursor2 = store.get_messages("s", limit=4, before=cursor1)
+        page3, cursor3 = store.get_messages("s", limit=4, before=cursor2)
+
+        assert contents(page1) == ["m8", "m9", "m10", "m11"]
+        assert contents(page2) == ["m4", "m5", "m6", "m7"]
+        assert contents(page3) == ["m2", "m3"]
+        assert cursor3 is None
+
+    def test_cursor_of_evicted_messages_returns_nothing(self):
+        """Should return an empty page for a cursor older than the buffer."""
+        store = ChatStore(history_limit=2)
+        for i in range(3):
+            store.add_message("s", message(f"m{i}"))
+        _, cursor = store.get_messages("s", limit=1)
+        for i in range(3, 6):
+            store.add_message("s", message(f"m{i}"))
+
+        assert store.get_messages("s", limit=5, before=cursor) == ([], None)
+
+    def test_tracks_message_bytes(self):
+        """Should account for added and evicted message sizes."""
+        store = ChatStore(history_limit=1)
+        store.add_message("s", message("x" * 1000))
+        big = store.stats()["message_bytes"]
+        store.add_message("s", message("y"))
+
+        assert big > 1000
+        assert store.stats()["message_bytes"] < 1000
+        store.clear_messages("s")
+        assert store.stats()["message_bytes"] == 0
+
+
+class TestChatStoreSweep:
+    """Tests for removing expired entries."""
+
+    def test_sweeps_expired_proposals_after_retention(self):
+        """Should keep recently expired proposals and drop long-expired ones."""
+        store = ChatStore()
+        now = datetime.utcnow()
+        recent = AITaskProposal(
+            session_id=SESSION_ID,
+            original_input="x",
+            proposed_title="Recent",
+            proposed_description="d",
+            expires_at=now - timedelta(minutes=5),
+        )
+        old = AITaskProposal(
+            session_id=SESSION_ID,
+            original_input="x",
+            proposed_title="Old",
+            proposed_description="d",
+            expires_at=now - timedelta(hours=2),
+        )
+        store.proposals[str(recent.proposal_id)] = recent
+        store.proposals[str(old.proposal_id)] = old
+
+        assert store.sweep() == 1
+        assert list(store.proposals) == [str(recent.proposal_id)]
+
+    def test_sweeps_idle_sessions(self):
+        """Should drop messages of sessions idle longer than a session lives."""
+        store = ChatStore()
+        with patch("src.services.chat_store.time.monotonic", return_value=0.0):
+            store.add_message("idle", message("old"))
+        with patch("src.services.chat_store.time.monotonic", return_value=30 * 3600.0):
+            store.add_message("active", message("new"))
+            store.sweep()
+
+        assert store.get_messages("idle") == ([], None)
+        assert store.stats()["sessions"] == 1
@@ -0,0 +1,90 @@
+"""Unit tests for the AI completion cache."""
+
+from unittest.mock import patch
+
+from src.services.completion_cache import CompletionCache, CompletionCachePolicy, fingerprint
+
+POLICIES = {
+    "classify": CompletionCachePolicy(60, similarity_threshold=0.8),
+    "exact": CompletionCachePolicy(60),
+}
+
+
+class TestCompletionCache:
+    """Tests for exact and near-duplicate lookups."""
+
+    def test_exact_hit_ignores_case_and_whitespace(self):
+        """Should serve inputs that only differ in case and spacing."""
+        cache = CompletionCache(policies=POLICIES)
+        cache.set("exact", "Move  login to Done", "ctx", "result")
+
+        assert cache.get("exact", "move login to done ", "ctx") == (True, "result")
+
+    def test_caches_none_results(self):
+        """Should tell a cached None apart from a miss."""
+        cache = CompletionCache(policies=POLICIES)
+        cache.set("exact", "hello", "ctx", None)
+
+        assert cache.get("exact", "hello", "ctx") == (True, None)
+        assert cache.get("exact", "other", "ctx") == (False, None)
+
+    def test_context_is_part_of_the_key(self):
+        """Should miss when the prompt template or context changed."""
+        cache = CompletionCache(policies=POLICIES)
+        cache.set("exact", "hello", fingerprint("template v1"), "old")
+
+        assert cache.get("exact", "hello", fingerprint("template v2")) == (False, None)
+
+    def test_similarity_tier_only_for_enabled_methods(self):
+        """Should reuse near-duplicates only where the policy allows it."""
+        cache = CompletionCache(policies=POLICIES)
+        cache.set("classify", "please add a CSV export to reports", "ctx", True)
+        cache.set("exact", "please add a CSV export to reports", "ctx", "task")
+
+        assert cache.get("classify", "please add CSV export to reports", "ctx") == (True, True)
+        assert cache.get("exact", "please add CSV export to reports", "ctx") == (False, None)
+
+    def test_dissimilar_inputs_miss(self):
+        """Should not treat unrelated inputs as near-duplicates."""
+        cache = CompletionCache(policies=POLICIES)
+        cache.set("classify", "please add a CSV export to reports", "ctx", True)
+
+        assert cache.get("classify", "what is the weather today", "ctx") == (False, None)
+
+    def test_entries_expire(self):
+        """Should drop entries once their method's TTL has passed."""
+        cache = CompletionCache(policies=POLICIES)
+        with patch("src.services.completion_cache.time.monotonic", return_value=100.0):
+            cache.set("classify", "add dark mode", "ctx", True)
+        with patch("src.services.completion_cache.time.monotonic", return_value=161.0):
+            assert cache.get("classify", "add dark mode", "ctx") == (False, None)
+            assert cache.get("classify", "add dark mode please", "ctx") == (False, None)
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Should evict the entry used longest ago when full."""
+        cache = CompletionCache(max_entries=2, policies=POLICIES)
+        cache.set("exact", "a", "ctx", 1)
+        cache.set("exact", "b", "ctx", 2)
+        cache.get("exact", "a", "ctx")
+        cache.set("exact", "c", "ctx", 3)
+
+        assert cache.get("exact", "a", "ctx") == (True, 1)
+        assert cache.get("exact", "b", "ctx") == (False, None)
+
+    def test_stats_report_hit_rate(self):
+        """Should count exact hits, similar hits and misses per method."""
+        cache = CompletionCache(policies=POLICIES)
+        cache.set("classify", "please add a CSV export to reports", "ctx", True)
+        cache.get("classify", "please add a CSV export to reports", "ctx")
+        cache.get("classify", "please add CSV export to reports", "ctx")
+        cache.get("classify", "something else entirely", "ctx")
+        cache.get("classify", "another unrelated message", "ctx")
+
+        assert cache.stats()["classify"] == {
+            "exact_hits": 1,
+            "similar_hits": 1,
+            "misses": 2,
+            "hit_rate": 0.5,
+        }
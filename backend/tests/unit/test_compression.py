@@ -0,0 +1,80 @@
+"""Unit tests for event stream compression and compact frames."""
+
+import json
+import zlib
+
+import pytest
+
+from src.services.compression import compress_stream, negotiate_stream_encoding
+from src.services.websocket import build_snapshot_frame, encode_columnar
+
+
+async def events(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestNegotiateStreamEncoding:
+    """Tests for Accept-Encoding negotiation."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            (None, None),
+            ("identity", None),
+            ("gzip, deflate", "gzip"),
+            ("gzip;q=0, deflate", None),
+            ("*", "gzip"),
+        ],
+    )
+    def test_gzip_negotiation(self, header, expected, monkeypatch):
+        """Should choose gzip only when the client accepts it."""
+        monkeypatch.setattr("src.services.compression.brotli", None)
+
+        assert negotiate_stream_encoding(header) == expected
+
+
+class TestCompressStream:
+    """Tests for per-event flushing compression."""
+
+    @pytest.mark.asyncio
+    async def test_each_event_is_decodable_on_arrival(self):
+        """Every chunk should decompress to its event without waiting for the next."""
+        chunks = ["event: a\ndata: {}\n\n", "event: b\ndata: {}\n\n"]
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+
+        decoded = []
+        async for part in compress_stream(events(*chunks), "gzip"):
+            decoded.append(decompressor.decompress(part).decode())
+
+        assert decoded[: len(chunks)] == chunks
+        assert "".join(decoded) == "".join(chunks)
+
+
+class TestColumnarFrames:
+    """Tests for the columnar snapshot format."""
+
+    def test_encode_columnar_round_trip(self):
+        """Should send field names once and values as arrays."""
+        records = [{"id": "a", "status": "Todo"}, {"id": "b", "status": "Done"}]
+
+        columns = json.loads(encode_columnar(records))
+
+        assert columns == {"id": ["a", "b"], "status": ["Todo", "Done"]}
+        rebuilt = [
+            dict(zip(columns, values, strict=True))
+            for values in zip(*columns.values(), strict=True)
+        ]
+        assert rebuilt == records
+
+    def test_columnar_snapshot_frame(self):
+        """Should mark the frame as columnar and put tasks under columns."""
+        frame = json.loads(
+            build_snapshot_frame(
+                "refresh", "PVT_1", encode_columnar([{"id": "a"}]), 1, version=3, columnar=True
+            )
+        )
+
+        assert frame["format"] == "columnar"
+        assert frame["columns"] == {"id": ["a"]}
+        assert "tasks" not in frame
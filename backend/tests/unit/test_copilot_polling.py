@@ -5,11 +5,14 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.services.copilot_polling import (
+    _polling_state,
     _processed_issue_prs,
     check_in_progress_issues,
     check_issue_for_copilot_completion,
     get_polling_status,
+    poll_for_copilot_completion,
     process_in_progress_issue,
+    stop_polling,
 )
 
 
@@ -65,6 +68,66 @@ class TestGetPollingStatus:
         assert "processed_issues_count" in status
 
 
+class TestPollingOwnership:
+    """Tests for polling on behalf of a GitHub user."""
+
+    @pytest.mark.asyncio
+    @patch("src.services.copilot_polling.check_in_review_issues_for_copilot_review")
+    @patch("src.services.copilot_polling.check_in_progress_issues")
+    @patch("src.services.copilot_polling.github_auth_service")
+    async def test_polls_with_newest_session_token(
+        self, mock_auth, mock_check_in_progress, mock_check_review
+    ):
+        """Should poll with the owner's newest token and stop when no session is left."""
+        mock_auth.get_user_sessions.side_effect = [[MagicMock(access_token="newest")], []]
+        mock_check_in_progress.return_value = []
+        mock_check_review.return_value = []
+
+        await poll_for_copilot_completion(
+            access_token="stale",
+            project_id="PVT_1",
+            owner="owner",
+            repo="repo",
+            interval_seconds=0,
+            github_user_id="42",
+        )
+
+        assert mock_check_in_progress.call_args.kwargs["access_token"] == "newest"
+        assert get_polling_status()["is_running"] is False
+        assert get_polling_status()["github_user_id"] is None
+
+    @pytest.mark.asyncio
+    @patch("src.services.copilot_polling.check_in_review_issues_for_copilot_review")
+    @patch("src.services.copilot_polling.process_in_progress_issue")
+    @patch("src.services.copilot_polling.github_projects_service")
+    @patch("src.services.copilot_polling.github_auth_service")
+    async def test_stop_ends_in_flight_sweep(
+        self, mock_auth, mock_service, mock_process, mock_check_review, mock_task
+    ):
+        """Should not use the owner's token again once polling is stopped mid-sweep."""
+        mock_auth.get_user_sessions.return_value = [MagicMock(access_token="owner")]
+        mock_service.get_project_items_by_status = AsyncMock(return_value=[mock_task, mock_task])
+
+        async def process(**_kwargs):
+            stop_polling()
+            return {"status": "success"}
+
+        mock_process.side_effect = process
+
+        await poll_for_copilot_completion(
+            access_token="owner",
+            project_id="PVT_1",
+            owner="owner",
+            repo="repo",
+            interval_seconds=0,
+            github_user_id="42",
+        )
+
+        assert mock_process.await_count == 1
+        mock_check_review.assert_not_called()
+        assert _polling_state.access_token is None
+
+
 class TestCheckInProgressIssues:
     """Tests for checking in-progress issues."""
 
@@ -75,7 +138,9 @@ class TestCheckInProgressIssues:
         self, mock_process, mock_service, mock_task, mock_task_no_issue
     ):
         """Test that only in-progress issues with issue numbers are processed."""
-        mock_service.get_project_items = AsyncMock(return_value=[mock_task, mock_task_no_issue])
+        mock_service.get_project_items_by_status = AsyncMock(
+            return_value=[mock_task, mock_task_no_issue]
+        )
         mock_process.return_value = {"status": "success"}
 
         await check_in_progress_issues(
@@ -90,12 +155,30 @@ class TestCheckInProgressIssues:
         call_args = mock_process.call_args
         assert call_args.kwargs["issue_number"] == 42
 
+    @pytest.mark.asyncio
+    @patch("src.services.copilot_polling.github_projects_service")
+    async def test_fetches_only_in_progress_column(self, mock_service):
+        """Test that only the 'In Progress' column is requested from GitHub."""
+        mock_service.get_project_items_by_status = AsyncMock(return_value=[])
+
+        await check_in_progress_issues(
+            access_token="test-token",
+            project_id="PVT_123",
+            owner="owner",
+            repo="repo",
+        )
+
+        mock_service.get_project_items_by_status.assert_awaited_once_with(
+            "test-token", "PVT_123", ["In Progress"]
+        )
+        mock_service.get_project_items.assert_not_called()
+
     @pytest.mark.asyncio
     @patch("src.services.copilot_polling.github_projects_service")
     async def test_skips_non_in_progress_issues(self, mock_service, mock_task):
         """Test that issues not in 'In Progress' are skipped."""
         mock_task.status = "Done"
-        mock_service.get_project_items = AsyncMock(return_value=[mock_task])
+        mock_service.get_project_items_by_status = AsyncMock(return_value=[mock_task])
 
         results = await check_in_progress_issues(
             access_token="test-token",
@@ -110,7 +193,7 @@ class TestCheckInProgressIssues:
     @patch("src.services.copilot_polling.github_projects_service")
     async def test_uses_task_repo_info_over_fallback(self, mock_service, mock_task):
         """Test that task's repository info is preferred over fallback."""
-        mock_service.get_project_items = AsyncMock(return_value=[mock_task])
+        mock_service.get_project_items_by_status = AsyncMock(return_value=[mock_task])
 
         with patch("src.services.copilot_polling.process_in_progress_issue") as mock_process:
             mock_process.return_value = None
@@ -135,7 +218,7 @@ class TestCheckInProgressIssues:
         """Test that fallback repo info is used when task doesn't have it."""
         mock_task.repository_owner = None
         mock_task.repository_name = None
-        mock_service.get_project_items = AsyncMock(return_value=[mock_task])
+        mock_service.get_project_items_by_status = AsyncMock(return_value=[mock_task])
         mock_process.return_value = None
 
         await check_in_progress_issues(
@@ -154,7 +237,7 @@ class TestCheckInProgressIssues:
     async def test_handles_case_insensitive_status(self, mock_service, mock_task):
         """Test that status comparison is case-insensitive."""
         mock_task.status = "IN PROGRESS"  # Uppercase
-        mock_service.get_project_items = AsyncMock(return_value=[mock_task])
+        mock_service.get_project_items_by_status = AsyncMock(return_value=[mock_task])
 
         with patch("src.services.copilot_polling.process_in_progress_issue") as mock_process:
             mock_process.return_value = None
@@ -174,7 +257,7 @@ class TestCheckInProgressIssues:
     async def test_handles_none_status_gracefully(self, mock_service, mock_task):
         """Test that tasks with None status are skipped."""
         mock_task.status = None
-        mock_service.get_project_items = AsyncMock(return_value=[mock_task])
+        mock_service.get_project_items_by_status = AsyncMock(return_value=[mock_task])
 
         with patch("src.services.copilot_polling.process_in_progress_issue") as mock_process:
             await check_in_progress_issues(
@@ -213,7 +296,7 @@ class TestCheckInProgressIssues:
             }
         )
 
-        mock_service.get_project_items = AsyncMock(return_value=[task1, task2])
+        mock_service.get_project_items_by_status = AsyncMock(return_value=[task1, task2])
         mock_process.side_effect = [
             {"status": "success", "issue_number": 1},
             {"status": "success", "issue_number": 2},
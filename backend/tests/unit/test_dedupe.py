@@ -0,0 +1,125 @@
+"""Unit tests for the bounded dedupe set."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.services.dedupe import BoundedDedupeSet
+
+
+class TestBoundedDedupeSet:
+    """Tests for BoundedDedupeSet membership and eviction."""
+
+    def test_add_returns_true_for_new_key(self):
+        """Should report newly added keys."""
+        dedupe = BoundedDedupeSet(max_size=10)
+
+        assert dedupe.add("a") is True
+        assert "a" in dedupe
+
+    def test_add_returns_false_for_duplicate(self):
+        """Should report duplicates without re-adding."""
+        dedupe = BoundedDedupeSet(max_size=10)
+        dedupe.add("a")
+
+        assert dedupe.add("a") is False
+        assert len(dedupe) == 1
+
+    def test_evicts_oldest_when_full(self):
+        """Should evict the oldest key, never the most recent ones."""
+        dedupe = BoundedDedupeSet(max_size=3)
+        for key in ["a", "b", "c", "d"]:
+            dedupe.add(key)
+
+        assert "a" not in dedupe
+        assert list(dedupe) == ["b", "c", "d"]
+
+    def test_expired_entries_are_absent(self):
+        """Should treat entries older than the TTL as absent."""
+        dedupe = BoundedDedupeSet(max_size=10, ttl_seconds=60)
+
+        with patch("src.services.dedupe.time.time", return_value=1000.0):
+            dedupe.add("a")
+        with patch("src.services.dedupe.time.time", return_value=1061.0):
+            assert "a" not in dedupe
+            assert dedupe.add("a") is True
+
+    def test_discard_and_clear(self):
+        """Should support discard and clear like a set."""
+        dedupe = BoundedDedupeSet(max_size=10)
+        dedupe.add("a")
+        dedupe.add("b")
+
+        dedupe.discard("a")
+        assert "a" not in dedupe
+
+        dedupe.clear()
+        assert len(dedupe) == 0
+
+    def test_rejects_invalid_max_size(self):
+        """Should reject non-positive sizes."""
+        with pytest.raises(ValueError):
+            BoundedDedupeSet(max_size=0)
+
+
+class TestBoundedDedupeSetPersistence:
+    """Tests for JSON-lines persistence."""
+
+    def test_keys_survive_reload(self, tmp_path):
+        """Should restore keys recorded by a previous instance."""
+        path = str(tmp_path / "dedupe.jsonl")
+
+        first = BoundedDedupeSet(max_size=10)
+        first.enable_persistence(path)
+        first.add("delivery-1")
+        first.add("delivery-2")
+
+        second = BoundedDedupeSet(max_size=10)
+        restored = second.enable_persistence(path)
+
+        assert restored == 2
+        assert "delivery-1" in second
+        assert "delivery-2" in second
+
+    def test_discarded_keys_stay_discarded_after_reload(self, tmp_path):
+        """Should not restore a key that was discarded before the restart."""
+        path = str(tmp_path / "dedupe.jsonl")
+
+        first = BoundedDedupeSet(max_size=10)
+        first.enable_persistence(path)
+        first.add("delivery-1")
+        first.add("delivery-2")
+        first.discard("delivery-1")
+
+        second = BoundedDedupeSet(max_size=10)
+
+        assert second.enable_persistence(path) == 1
+        assert "delivery-1" not in second
+        assert "delivery-2" in second
+
+    def test_reload_skips_expired_and_corrupt_lines(self, tmp_path):
+        """Should ignore expired records and unparsable lines."""
+        path = tmp_path / "dedupe.jsonl"
+        path.write_text(
+            json.dumps({"key": "old", "ts": 0}) + "\n" + "not json\n",
+            encoding="utf-8",
+        )
+
+        dedupe = BoundedDedupeSet(max_size=10, ttl_seconds=60)
+        restored = dedupe.enable_persistence(str(path))
+
+        assert restored == 0
+        assert "old" not in dedupe
+
+    def test_log_is_compacted(self, tmp_path):
+        """Should keep the on-disk log bounded by max_size."""
+        path = tmp_path / "dedupe.jsonl"
+        dedupe = BoundedDedupeSet(max_size=3)
+        dedupe.enable_persistence(str(path))
+
+        for i in range(20):
+            dedupe.add(f"key-{i}")
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) <= 2 * dedupe.max_size
@@ -47,6 +47,21 @@ class TestGitHubAuthServiceOAuth:
 
         assert state in _oauth_states
 
+    @patch("src.services.github_auth.get_settings")
+    def test_generate_oauth_url_drops_abandoned_states(self, mock_settings):
+        """Should drop expired states of logins that were never completed."""
+        mock_settings.return_value = MagicMock(
+            github_client_id="test_client_id",
+            github_redirect_uri="http://localhost:8000/callback",
+        )
+        _oauth_states["abandoned"] = datetime.now(UTC) - timedelta(minutes=15)
+        _oauth_states["pending"] = datetime.now(UTC)
+
+        service = GitHubAuthService()
+        _, state = service.generate_oauth_url()
+
+        assert list(_oauth_states) == ["pending", state]
+
     @patch("src.services.github_auth.get_settings")
     def test_validate_state_returns_true_for_valid_state(self, mock_settings):
         """Should validate valid, non-expired state."""
@@ -6,7 +6,13 @@ import pytest
 
 from src.models.project import ProjectType
 from src.models.task import Task
-from src.services.github_projects import GitHubProjectsService
+from src.prompts.budget import estimate_tokens
+from src.services.github_projects import (
+    BULK_MUTATION_BATCH_SIZE,
+    ISSUE_CONTEXT_MAX_TOKENS,
+    GitHubProjectsService,
+    build_field_value,
+)
 
 # =============================================================================
 # Core GraphQL and HTTP Tests
@@ -398,6 +404,144 @@ class TestGetProjectItems:
             assert tasks[1].title == "Task 2"
             assert mock_graphql.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_summary_profile_skips_bodies(self, service):
+        """Summary fetches should not request bodies and mark them as not loaded."""
+        mock_response = {
+            "node": {
+                "items": {
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "nodes": [
+                        {
+                            "id": "ITEM_1",
+                            "fieldValueByName": {"name": "Todo", "optionId": "OPT_1"},
+                            "content": {"id": "ISSUE_1", "number": 1, "title": "Task 1"},
+                        }
+                    ],
+                }
+            }
+        }
+
+        with patch.object(service, "_graphql", new_callable=AsyncMock) as mock_graphql:
+            mock_graphql.return_value = mock_response
+
+            tasks = await service.get_project_items("test-token", "PVT_123", profile="summary")
+
+            query = mock_graphql.call_args[0][1]
+            assert "body" not in query
+            assert tasks[0].description is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_profile_raises(self, service):
+        """Should reject unknown profiles."""
+        with pytest.raises(ValueError, match="Unknown project items profile"):
+            await service.get_project_items("test-token", "PVT_123", profile="everything")
+
+    def test_profiles_add_fields(self):
+        """Richer profiles should request bodies and assignees."""
+        from src.services.github_projects import PROJECT_ITEMS_QUERIES
+
+        assert "body" not in PROJECT_ITEMS_QUERIES["summary"]
+        assert "body" in PROJECT_ITEMS_QUERIES["board"]
+        assert "assignees" not in PROJECT_ITEMS_QUERIES["board"]
+        assert "assignees" in PROJECT_ITEMS_QUERIES["full"]
+
+
+class TestGetProjectItemsByStatus:
+    """Tests for status-filtered item fetches."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a GitHubProjectsService instance."""
+        return GitHubProjectsService()
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start each test with an empty cache."""
+        from src.services.cache import cache
+
+        cache.clear()
+        yield
+        cache.clear()
+
+    @staticmethod
+    def page(*statuses):
+        return {
+            "node": {
+                "items": {
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "nodes": [
+                        {
+                            "id": f"ITEM_{i}",
+                            "fieldValueByName": {"name": status, "optionId": f"OPT_{i}"},
+                            "content": {"id": f"ISSUE_{i}", "number": i, "title": f"Issue {i}"},
+                        }
+                        for i, status in enumerate(statuses)
+                    ],
+                }
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_passes_status_filter_to_query(self, service):
+        """Should ask GitHub for only the requested columns."""
+        with patch.object(service, "_graphql", new_callable=AsyncMock) as mock_graphql:
+            mock_graphql.return_value = self.page("In Progress")
+
+            items = await service.get_project_items_by_status(
+                "test-token", "PVT_123", ["In Progress", "In Review"]
+            )
+
+        query, variables = mock_graphql.call_args.args[1:3]
+        assert "query: $filter" in query
+        assert variables["filter"] == 'status:"In Progress","In Review"'
+        assert [item.status for item in items] == ["In Progress"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_filter(self, service):
+        """Should filter a full fetch locally when the API rejects the filter."""
+        with patch.object(service, "_graphql", new_callable=AsyncMock) as mock_graphql:
+            mock_graphql.side_effect = [
+                ValueError("Argument 'query' doesn't exist"),
+                self.page("Todo", "In Review", "in review"),
+            ]
+
+            items = await service.get_project_items_by_status(
+                "test-token", "PVT_123", ["In Review"]
+            )
+
+        assert [item.status for item in items] == ["In Review", "in review"]
+        assert "query: $filter" not in mock_graphql.call_args.args[1]
+        assert service._status_filter_supported is False
+
+    @pytest.mark.asyncio
+    async def test_other_errors_fall_back_for_one_call(self, service):
+        """Should keep using the filter after errors unrelated to the query argument."""
+        with patch.object(service, "_graphql", new_callable=AsyncMock) as mock_graphql:
+            mock_graphql.side_effect = [
+                ValueError("GraphQL error: Something went wrong while executing your query"),
+                self.page("Todo", "In Review"),
+            ]
+
+            items = await service.get_project_items_by_status(
+                "test-token", "PVT_123", ["In Review"]
+            )
+
+        assert [item.status for item in items] == ["In Review"]
+        assert service._status_filter_supported is True
+
+    @pytest.mark.asyncio
+    async def test_caches_results_per_status_set(self, service):
+        """Should reuse a recent result for the same columns only."""
+        with patch.object(service, "_graphql", new_callable=AsyncMock) as mock_graphql:
+            mock_graphql.return_value = self.page("In Progress", "In Review")
+
+            await service.get_project_items_by_status("test-token", "PVT_123", ["In Progress"])
+            await service.get_project_items_by_status("test-token", "PVT_123", ["In Progress"])
+            await service.get_project_items_by_status("test-token", "PVT_123", ["In Review"])
+
+        assert mock_graphql.call_count == 2
+
 
 # =============================================================================
 # Item Creation and Update Tests
@@ -943,6 +1087,103 @@ class TestUpdateProjectItemField:
 
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_set_issue_metadata_looks_up_fields_once(self, service):
+        """Should fetch the project's fields once for all metadata fields."""
+        with patch.object(service, "get_project_fields", new_callable=AsyncMock) as mock_get_fields:
+            mock_get_fields.return_value = {
+                "Priority": {
+                    "id": "FIELD_1",
+                    "dataType": "SINGLE_SELECT",
+                    "options": [{"id": "OPT_1", "name": "P1"}],
+                },
+                "Estimate": {"id": "FIELD_2", "dataType": "NUMBER", "options": []},
+            }
+
+            with patch.object(service, "_graphql", new_callable=AsyncMock) as mock_graphql:
+                mock_graphql.return_value = {}
+
+                results = await service.set_issue_metadata(
+                    access_token="test-token",
+                    project_id="PVT_123",
+                    item_id="ITEM_1",
+                    metadata={"priority": "P1", "estimate_hours": 4},
+                )
+
+        assert results == {"Priority": True, "Estimate": True}
+        mock_get_fields.assert_awaited_once()
+
+
+class TestBatchMutations:
+    """Tests for aliased batch mutations used by bulk confirmation."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a GitHubProjectsService instance."""
+        return GitHubProjectsService()
+
+    def graphql_response(self, body: dict) -> Mock:
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.num_bytes_downloaded = 0
+        response.json.return_value = body
+        return response
+
+    @pytest.mark.asyncio
+    async def test_add_issues_reports_failed_aliases(self, service):
+        """Should add all issues in one request and return None only for failed ones."""
+        body = {
+            "data": {"add0": {"item": {"id": "ITEM_0"}}, "add1": None},
+            "errors": [{"message": "Content not found", "path": ["add1"]}],
+        }
+        with patch.object(service, "_client") as mock_client:
+            mock_client.post = AsyncMock(return_value=self.graphql_response(body))
+
+            item_ids = await service.add_issues_to_project("test-token", "PVT_1", ["I_0", "I_1"])
+
+        assert item_ids == ["ITEM_0", None]
+        request = mock_client.post.call_args.kwargs["json"]
+        assert "add1: addProjectV2ItemById" in request["query"]
+        assert request["variables"] == {"projectId": "PVT_1", "content0": "I_0", "content1": "I_1"}
+
+    @pytest.mark.asyncio
+    async def test_request_wide_error_raises(self, service):
+        """Should raise when an error is not tied to one alias."""
+        body = {"errors": [{"message": "Bad credentials"}]}
+        with patch.object(service, "_client") as mock_client:
+            mock_client.post = AsyncMock(return_value=self.graphql_response(body))
+
+            with pytest.raises(ValueError, match="Bad credentials"):
+                await service.add_issues_to_project("test-token", "PVT_1", ["I_0"])
+
+    @pytest.mark.asyncio
+    async def test_set_field_values_splits_into_batches(self, service):
+        """Should send at most BULK_MUTATION_BATCH_SIZE updates per request."""
+        updates = [
+            (f"ITEM_{i}", "FIELD_1", {"number": float(i)})
+            for i in range(BULK_MUTATION_BATCH_SIZE + 1)
+        ]
+
+        async def graphql_batch(_token, query, variables):
+            count = query.count("updateProjectV2ItemFieldValue(")
+            return {f"update{i}": {"projectV2Item": {"id": "x"}} for i in range(count)}, {}
+
+        with patch.object(service, "_graphql_batch", side_effect=graphql_batch) as mock_batch:
+            results = await service.set_item_field_values("test-token", "PVT_1", updates)
+
+        assert results == [True] * len(updates)
+        assert mock_batch.await_count == 2
+        assert mock_batch.call_args.args[2]["value0"] == {"number": float(BULK_MUTATION_BATCH_SIZE)}
+
+    def test_build_field_value(self):
+        """Should map values to ProjectV2FieldValue inputs by field type."""
+        select = {"id": "F_1", "dataType": "SINGLE_SELECT", "options": [{"id": "o1", "name": "P1"}]}
+
+        assert build_field_value(select, "p1") == {"singleSelectOptionId": "o1"}
+        assert build_field_value(select, "P9") is None
+        assert build_field_value({"dataType": "NUMBER"}, "4") == {"number": 4.0}
+        assert build_field_value({"dataType": "DATE"}, "2026-01-01") == {"date": "2026-01-01"}
+
 
 # =============================================================================
 # Pull Request Tests
@@ -1460,6 +1701,24 @@ class TestFormatIssueContextAsPrompt:
         assert "## Issue Description" in result
         assert "## Comments and Discussion" not in result
 
+    def test_format_keeps_long_thread_within_budget(self, service):
+        """Should keep the first and latest comments of a long thread."""
+        issue_data = {
+            "title": "Busy issue",
+            "body": "Body",
+            "comments": [
+                {"author": f"user{i}", "body": "x" * 4000, "created_at": ""} for i in range(1, 21)
+            ],
+        }
+
+        result = service.format_issue_context_as_prompt(issue_data)
+
+        assert estimate_tokens(result) <= ISSUE_CONTEXT_MAX_TOKENS
+        assert "Comment 1 by @user1" in result
+        assert "Comment 20 by @user20" in result
+        assert "Comment 2 by @user2 " not in result
+        assert "earlier comment(s) omitted" in result
+
 
 class TestAssignCopilotToIssue:
     """Tests for assigning Copilot with custom agents."""
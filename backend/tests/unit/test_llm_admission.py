@@ -0,0 +1,141 @@
+"""Unit tests for AI completion admission control."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.services.llm_admission import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    AdmissionController,
+    LatencyHistogram,
+)
+
+
+async def run_in_order(controller, requests):
+    """Queue ``requests`` behind a held slot and return the order they start in."""
+    started = []
+
+    async def completion(name, session, priority, tokens):
+        async with controller.admit(session, priority, tokens):
+            started.append(name)
+
+    async with controller.admit("holder"):
+        tasks = [asyncio.create_task(completion(*request)) for request in requests]
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return started
+
+
+class TestAdmissionController:
+    """Tests for admission order and limits."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """Should never run more completions than allowed."""
+        controller = AdmissionController(max_concurrency=2)
+        running = peak = 0
+
+        async def completion():
+            nonlocal running, peak
+            async with controller.admit():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(completion() for _ in range(6)))
+
+        assert peak == 2
+        assert controller.stats()["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_round_robin_across_sessions(self):
+        """Should not let one busy session starve another."""
+        controller = AdmissionController(max_concurrency=1)
+        requests = [
+            ("a1", "a", PRIORITY_INTERACTIVE, 0),
+            ("a2", "a", PRIORITY_INTERACTIVE, 0),
+            ("a3", "a", PRIORITY_INTERACTIVE, 0),
+            ("b1", "b", PRIORITY_INTERACTIVE, 0),
+        ]
+
+        assert await run_in_order(controller, requests) == ["a1", "b1", "a2", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_interactive_before_background(self):
+        """Should start interactive completions before queued background ones."""
+        controller = AdmissionController(max_concurrency=1)
+        requests = [
+            ("bg", "x", PRIORITY_BACKGROUND, 0),
+            ("chat", "y", PRIORITY_INTERACTIVE, 0),
+        ]
+
+        assert await run_in_order(controller, requests) == ["chat", "bg"]
+
+    @pytest.mark.asyncio
+    async def test_waits_for_token_budget(self):
+        """Should hold requests until their tokens fit the per-minute budget."""
+        controller = AdmissionController(max_concurrency=4, tokens_per_minute=1000)
+        clock = [100.0]
+
+        with patch("src.services.llm_admission.time.monotonic", side_effect=lambda: clock[0]):
+            async with controller.admit("a", tokens=800):
+                pass
+            waiting = asyncio.create_task(controller.admit("b", tokens=500).__aenter__())
+            await asyncio.sleep(0)
+            assert not waiting.done()
+            assert controller.stats()["queued"] == {"interactive": 1}
+
+            clock[0] = 161.0
+            controller._dispatch()
+            await asyncio.wait_for(waiting, timeout=1)
+
+            assert controller.stats()["tokens_last_minute"] == 500
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Should drop a request cancelled while queued."""
+        controller = AdmissionController(max_concurrency=1)
+
+        async def wait():
+            async with controller.admit("b"):
+                pass
+
+        async with controller.admit("a"):
+            waiting = asyncio.create_task(wait())
+            await asyncio.sleep(0)
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+
+        assert controller.stats()["queued"] == {}
+        assert controller.stats()["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_records_queue_wait_and_latency(self):
+        """Should observe a queue wait and a completion latency per request."""
+        controller = AdmissionController(max_concurrency=1)
+
+        async with controller.admit():
+            pass
+
+        stats = controller.stats()
+        assert stats["queue_wait"]["count"] == 1
+        assert stats["completion"]["count"] == 1
+
+
+class TestLatencyHistogram:
+    """Tests for latency bucket counts."""
+
+    def test_counts_per_bucket(self):
+        """Should count each duration in the first bucket that holds it."""
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(seconds)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["buckets"] == {"le_100ms": 2, "le_1000ms": 1, "inf": 1}
+        assert snapshot["count"] == 4
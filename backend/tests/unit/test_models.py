@@ -73,6 +73,30 @@ class TestUserSession:
 
         assert session1.session_id != session2.session_id
 
+    def test_data_scope_is_shared_by_tokens_with_same_scopes(self):
+        """Should give sessions of one user the same data scope regardless of scope order."""
+        session1 = UserSession(
+            github_user_id="12345678",
+            github_username="testuser",
+            access_token="gho_one",
+            token_scope="repo,read:user project",
+        )
+        session2 = UserSession(
+            github_user_id="12345678",
+            github_username="testuser",
+            access_token="gho_two",
+            token_scope="project,read:user,repo",
+        )
+        narrower = UserSession(
+            github_user_id="12345678",
+            github_username="testuser",
+            access_token="gho_three",
+            token_scope="read:user",
+        )
+
+        assert session1.data_scope == session2.data_scope == "12345678:project,read:user,repo"
+        assert narrower.data_scope != session1.data_scope
+
 
 class TestUserResponse:
     """Tests for UserResponse model."""
@@ -237,3 +261,128 @@ class TestIssueRecommendation:
         assert recommendation.metadata is not None
         assert recommendation.metadata.priority == IssuePriority.P2
         assert recommendation.metadata.size == IssueSize.M
+
+
+class TestProjectItem:
+    """Tests for the internal ProjectItem record."""
+
+    NODE = {
+        "id": "PVTI_1",
+        "fieldValueByName": {"name": "In Progress", "optionId": "OPT_2"},
+        "content": {
+            "id": "I_1",
+            "number": 7,
+            "title": "Fix login",
+            "body": "Details",
+            "repository": {"owner": {"login": "octo"}, "name": "repo"},
+        },
+    }
+
+    def test_from_node(self):
+        """Should read all fields from a GraphQL item node."""
+        from src.models.task import ProjectItem
+
+        item = ProjectItem.from_node("PVT_1", self.NODE, datetime(2026, 1, 1))
+
+        assert item.github_item_id == "PVTI_1"
+        assert item.github_issue_id == "I_1"
+        assert item.issue_number == 7
+        assert item.repository_owner == "octo"
+        assert item.repository_name == "repo"
+        assert item.status == "In Progress"
+        assert item.status_option_id == "OPT_2"
+
+    def test_from_node_skips_items_without_content(self):
+        """Should return None for items without content."""
+        from src.models.task import ProjectItem
+
+        assert (
+            ProjectItem.from_node("PVT_1", {"id": "PVTI_2", "content": None}, datetime.now())
+            is None
+        )
+
+    def test_task_id_is_deterministic(self):
+        """Refetching the same item should yield the same task ID."""
+        from src.models.task import ProjectItem
+
+        first = ProjectItem.from_node("PVT_1", self.NODE, datetime(2026, 1, 1))
+        second = ProjectItem.from_node("PVT_1", self.NODE, datetime(2026, 1, 2))
+
+        assert isinstance(first.task_id, UUID)
+        assert first.task_id == second.task_id
+
+    def test_to_task(self):
+        """Should convert to the public Task model with the same ID."""
+        from src.models.task import ProjectItem, Task
+
+        fetched_at = datetime(2026, 1, 1)
+        item = ProjectItem.from_node("PVT_1", self.NODE, fetched_at)
+
+        task = item.to_task()
+
+        assert isinstance(task, Task)
+        assert task.task_id == item.task_id
+        assert task.title == "Fix login"
+        assert task.created_at == task.updated_at == fetched_at
+
+
+class TestProjectItemList:
+    """Tests for indexed lookups on fetched project items."""
+
+    @staticmethod
+    def make_items():
+        from src.models.task import ProjectItem, ProjectItemList
+
+        return ProjectItemList(
+            [
+                ProjectItem("PVT_1", "PVTI_1", "Fix login", "Todo", "OPT_1", issue_number=7),
+                ProjectItem(
+                    "PVT_1",
+                    "PVTI_2",
+                    "Fix signup",
+                    "In Progress",
+                    "OPT_2",
+                    issue_number=7,
+                    repository_owner="Octo",
+                    repository_name="other",
+                ),
+                ProjectItem("PVT_1", "PVTI_3", "Draft", "in progress", "OPT_2"),
+            ]
+        )
+
+    def test_get_by_item_or_task_id(self):
+        """Should find items by GitHub item ID and by task ID."""
+        items = self.make_items()
+
+        assert items.get_by_id("PVTI_2") is items[1]
+        assert items.get_by_id(str(items[2].task_id)) is items[2]
+        assert items.get_by_id("missing") is None
+
+    def test_get_by_issue_prefers_repository(self):
+        """Should prefer the item in the given repository, else the first match."""
+        items = self.make_items()
+
+        assert items.get_by_issue(7, "octo", "OTHER") is items[1]
+        assert items.get_by_issue(7, "octo", "repo") is items[0]
+        assert items.get_by_issue(7) is items[0]
+        assert items.get_by_issue(8) is None
+
+    def test_with_status_is_case_insensitive(self):
+        """Should return items of the given columns in project order."""
+        items = self.make_items()
+
+        assert items.with_status("In Progress") == [items[1], items[2]]
+        assert items.with_status("todo", "IN PROGRESS") == list(items)
+
+    def test_of_reuses_indexed_lists(self):
+        """Should wrap plain lists and return indexed lists unchanged."""
+        from src.models.task import ProjectItemList
+
+        items = self.make_items()
+
+        assert ProjectItemList.of(items) is items
+        assert ProjectItemList.of(list(items)).task_refs == [
+            {"task_id": "PVTI_1", "title": "Fix login"},
+            {"task_id": "PVTI_2", "title": "Fix signup"},
+            {"task_id": "PVTI_3", "title": "Draft"},
+        ]
@@ -0,0 +1,128 @@
+"""Unit tests for project endpoints shared across a user's sessions."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.api.projects import (
+    get_project_repository,
+    get_project_stats,
+    get_project_tasks,
+    list_projects,
+)
+from src.exceptions import NotFoundError
+from src.models.project import GitHubProject, ProjectType, StatusColumn
+from src.models.user import UserSession
+from src.services.cache import cache
+
+
+def make_session(token: str, scope: str = "project,repo") -> UserSession:
+    return UserSession(
+        github_user_id="42",
+        github_username="octocat",
+        access_token=token,
+        token_scope=scope,
+    )
+
+
+PROJECT = GitHubProject(
+    project_id="PVT_1",
+    owner_id="U_1",
+    owner_login="octocat",
+    name="Board",
+    type=ProjectType.USER,
+    url="https://github.com/users/octocat/projects/1",
+    status_columns=[StatusColumn(field_id="F_1", name="Todo", option_id="o1")],
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestListProjects:
+    """Tests for fetching a user's projects once across sessions."""
+
+    @pytest.mark.asyncio
+    @patch("src.api.projects.github_projects_service")
+    async def test_sessions_of_one_user_share_a_fetch(self, mock_service):
+        """Should fetch once for concurrent and later sessions with the same scopes."""
+        fetched = asyncio.Event()
+
+        async def list_user_projects(*_args):
+            await fetched.wait()
+            return [PROJECT]
+
+        mock_service.list_user_projects = AsyncMock(side_effect=list_user_projects)
+
+        first = asyncio.create_task(list_projects(make_session("a")))
+        second = asyncio.create_task(list_projects(make_session("b")))
+        await asyncio.sleep(0)
+        fetched.set()
+        responses = await asyncio.gather(first, second)
+        third = await list_projects(make_session("c", scope="repo project"))
+
+        assert mock_service.list_user_projects.await_count == 1
+        assert [r.projects for r in responses] == [[PROJECT], [PROJECT]]
+        assert third.projects == [PROJECT]
+
+    @pytest.mark.asyncio
+    @patch("src.api.projects.github_projects_service")
+    async def test_different_scopes_fetch_separately(self, mock_service):
+        """Should not share projects between tokens with different scopes."""
+        mock_service.list_user_projects = AsyncMock(return_value=[PROJECT])
+
+        await list_projects(make_session("a", scope="project,repo"))
+        await list_projects(make_session("b", scope="read:project"))
+
+        assert mock_service.list_user_projects.await_count == 2
+
+
+class TestProjectAuthorization:
+    """Tests for access checks on per-project caches."""
+
+    @pytest.mark.asyncio
+    @patch("src.api.projects.github_projects_service")
+    async def test_cached_tasks_require_project_access(self, mock_service):
+        """Should not serve another user's cached project items."""
+        mock_service.list_user_projects = AsyncMock(return_value=[])
+        cache.set("project:items:PVT_1", ["secret"])
+
+        with pytest.raises(NotFoundError):
+            await get_project_tasks("PVT_1", make_session("a"))
+
+    @pytest.mark.asyncio
+    @patch("src.api.projects.github_projects_service")
+    async def test_repository_is_looked_up_once(self, mock_service):
+        """Should cache a project's repository for all sessions with access."""
+        mock_service.list_user_projects = AsyncMock(return_value=[PROJECT])
+        mock_service.get_project_repository = AsyncMock(return_value=("octocat", "app"))
+
+        first = await get_project_repository(make_session("a"), "PVT_1")
+        second = await get_project_repository(make_session("b", scope="read:project"), "PVT_1")
+
+        assert first == second == ("octocat", "app")
+        assert mock_service.get_project_repository.await_count == 1
+
+    @pytest.mark.asyncio
+    @patch("src.api.projects.github_projects_service")
+    async def test_stats_require_project_access(self, mock_service):
+        """Should report delivery stats only for projects the user can see."""
+        mock_service.list_user_projects = AsyncMock(side_effect=[[PROJECT], []])
+
+        stats = await get_project_stats("PVT_1", make_session("a"))
+        with pytest.raises(NotFoundError):
+            await get_project_stats("PVT_1", make_session("b", scope="read:project"))
+
+        assert stats == {
+            "connections": 0,
+            "queued_messages": 0,
+            "max_queue_depth": 0,
+            "dropped_messages": 0,
+            "sse_subscribers": 0,
+        }
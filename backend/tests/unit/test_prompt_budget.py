@@ -0,0 +1,84 @@
+"""Unit tests for prompt templates and token budgets."""
+
+from src.prompts.budget import (
+    TRUNCATION_MARKER,
+    estimate_tokens,
+    fit_comments,
+    truncate_to_tokens,
+)
+from src.prompts.issue_generation import create_issue_generation_prompt
+from src.prompts.templates import PromptTemplate
+
+
+class TestTruncateToTokens:
+    """Tests for cutting text to a budget."""
+
+    def test_keeps_text_within_budget(self):
+        """Should return short text unchanged."""
+        assert truncate_to_tokens("short text", 100) == "short text"
+
+    def test_cuts_long_text_at_word_boundary(self):
+        """Should cut at a word and mark the cut."""
+        result = truncate_to_tokens("word " * 1000, 50)
+
+        assert result.endswith(TRUNCATION_MARKER)
+        assert estimate_tokens(result) <= 50
+        assert result[: -len(TRUNCATION_MARKER)].endswith("word")
+
+
+class TestFitComments:
+    """Tests for fitting a comment thread into a budget."""
+
+    def test_keeps_everything_that_fits(self):
+        """Should keep all comments when the budget allows."""
+        assert fit_comments(["a", "b", "c"], 100, 50) == (["a", "b", "c"], 0)
+
+    def test_keeps_first_and_most_recent(self):
+        """Should drop the oldest comments after the first one."""
+        comments = [f"comment {i} " + "x" * 36 for i in range(10)]  # 12 tokens each
+
+        kept, omitted = fit_comments(comments, 40, 50)
+
+        assert kept == [comments[0], comments[8], comments[9]]
+        assert omitted == 7
+
+    def test_cuts_single_long_comment(self):
+        """Should truncate a comment over the per-comment budget."""
+        kept, omitted = fit_comments(["y" * 10_000], 1000, 100)
+
+        assert omitted == 0
+        assert kept[0].endswith(TRUNCATION_MARKER)
+
+
+class TestPromptTemplate:
+    """Tests for rendering precompiled templates."""
+
+    def test_system_message_is_static(self):
+        """Should send the same system prompt regardless of the fields."""
+        template = PromptTemplate("test", "You are a bot.", "Input: {user_input}")
+
+        first = template.render(user_input="one")
+        second = template.render(user_input="two")
+
+        assert first[0] == second[0] == {"role": "system", "content": "You are a bot."}
+        assert first[1]["content"] == "Input: one"
+
+    def test_applies_field_budgets(self):
+        """Should cut budgeted fields before rendering."""
+        template = PromptTemplate(
+            "test", "System", "Input: {user_input}", field_budgets={"user_input": 10}
+        )
+
+        messages = template.render(user_input="z" * 1000)
+
+        assert messages[1]["content"].endswith(TRUNCATION_MARKER)
+        assert estimate_tokens(messages[1]["content"]) <= 12
+
+    def test_issue_prompt_keeps_dynamic_content_out_of_system_message(self):
+        """Should keep the system prompt identical across projects and inputs."""
+        first = create_issue_generation_prompt("Add CSV export", "Project A")
+        second = create_issue_generation_prompt("Add dark mode", "Project B")
+
+        assert first[0] == second[0]
+        assert "Project A" in first[1]["content"]
+        assert "Add CSV export" in first[1]["content"]
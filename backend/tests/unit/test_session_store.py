@@ -0,0 +1,119 @@
+"""Unit tests for the expiring session store."""
+
+import os
+from datetime import UTC, datetime, timedelta
+
+from src.models.user import UserSession
+from src.services.session_store import FileSessionBackend, SessionStore
+
+
+def make_session(user_id: str = "1", age_hours: float = 0) -> UserSession:
+    return UserSession(
+        github_user_id=user_id,
+        github_username=f"user{user_id}",
+        access_token="gho_secret",
+        updated_at=datetime.now(UTC) - timedelta(hours=age_hours),
+    )
+
+
+def put(store: SessionStore, session: UserSession) -> str:
+    session_id = str(session.session_id)
+    store[session_id] = session
+    return session_id
+
+
+class TestSessionStore:
+    """Tests for lookup, expiry and the per-user index."""
+
+    def test_expired_session_is_absent(self):
+        """Should treat sessions past their lifetime as missing and drop them."""
+        store = SessionStore(ttl_seconds=3600)
+        session_id = put(store, make_session(age_hours=2))
+
+        assert store.get(session_id) is None
+        assert session_id not in store
+        assert len(store) == 0
+
+    def test_indexes_sessions_by_user(self):
+        """Should find all live sessions of a user, newest first."""
+        store = SessionStore(ttl_seconds=3600)
+        older = make_session("1", age_hours=0.5)
+        newer = make_session("1")
+        put(store, older)
+        put(store, newer)
+        put(store, make_session("2"))
+
+        assert store.sessions_for_user("1") == [newer, older]
+
+        store.pop(str(newer.session_id))
+        assert store.sessions_for_user("1") == [older]
+
+    def test_sorts_naive_and_aware_update_times(self):
+        """Should order sessions whose update times were stored naive (UTC) or aware."""
+        store = SessionStore(ttl_seconds=3600)
+        naive = make_session("1")
+        naive.updated_at = datetime.utcnow() - timedelta(minutes=30)
+        aware = make_session("1")
+        put(store, naive)
+        put(store, aware)
+
+        assert store.sessions_for_user("1") == [aware, naive]
+
+    def test_sweep_removes_expired_sessions(self):
+        """Should remove expired sessions and their index entries."""
+        store = SessionStore(ttl_seconds=3600)
+        put(store, make_session("1", age_hours=2))
+        live_id = put(store, make_session("2"))
+
+        assert store.sweep() == 1
+        assert list(store) == [live_id]
+        assert store.stats() == {"sessions": 1, "users": 1}
+
+
+class TestFileSessionBackend:
+    """Tests for persisting sessions across restarts."""
+
+    def test_restores_sessions_after_restart(self, tmp_path):
+        """Should restore saved sessions and not deleted ones."""
+        path = str(tmp_path / "sessions.jsonl")
+        store = SessionStore(ttl_seconds=3600)
+        store.use_backend(FileSessionBackend(path, "secret"))
+        kept_id = put(store, make_session("1"))
+        dropped_id = put(store, make_session("2"))
+        del store[dropped_id]
+
+        restarted = SessionStore(ttl_seconds=3600)
+        restored = restarted.use_backend(FileSessionBackend(path, "secret"))
+
+        assert restored == 1
+        assert restarted[kept_id].access_token == "gho_secret"
+        assert restarted.sessions_for_user("1")[0].session_id == store[kept_id].session_id
+
+    def test_file_is_encrypted_and_private(self, tmp_path):
+        """Should not write access tokens in plain text."""
+        path = str(tmp_path / "sessions.jsonl")
+        store = SessionStore(ttl_seconds=3600)
+        store.use_backend(FileSessionBackend(path, "secret"))
+        put(store, make_session())
+
+        with open(path, encoding="utf-8") as f:
+            assert "gho_secret" not in f.read()
+        assert os.stat(path).st_mode & 0o077 == 0
+
+    def test_skips_sessions_saved_with_another_key(self, tmp_path):
+        """Should restore nothing when the secret key changed."""
+        path = str(tmp_path / "sessions.jsonl")
+        store = SessionStore(ttl_seconds=3600)
+        store.use_backend(FileSessionBackend(path, "old"))
+        put(store, make_session())
+
+        assert SessionStore(ttl_seconds=3600).use_backend(FileSessionBackend(path, "new")) == 0
+
+    def test_does_not_restore_expired_sessions(self, tmp_path):
+        """Should drop sessions that expired while the server was down."""
+        path = str(tmp_path / "sessions.jsonl")
+        store = SessionStore(ttl_seconds=3600)
+        store.use_backend(FileSessionBackend(path, "secret"))
+        put(store, make_session(age_hours=2))
+
+        assert SessionStore(ttl_seconds=3600).use_backend(FileSessionBackend(path, "secret")) == 0
@@ -0,0 +1,65 @@
+"""Unit tests for local status command parsing."""
+
+import pytest
+
+from src.services.status_commands import parse_status_command, status_phrases
+from src.services.task_matching import TaskMatchIndex
+
+TASKS = [
+    {"task_id": "1", "title": "Fix login bug"},
+    {"task_id": "2", "title": "Fix signup bug"},
+    {"task_id": "3", "title": "Taskbar polish"},
+]
+STATUSES = ["Todo", "In Progress", "Done"]
+
+
+class TestParseStatusCommand:
+    """Tests for recognizing status change commands."""
+
+    @pytest.fixture
+    def index(self):
+        return TaskMatchIndex(TASKS)
+
+    @pytest.mark.parametrize(
+        "message,task_id,status",
+        [
+            ("move fix login bug to In Progress", "1", "In Progress"),
+            ("Please move the login bug into the done column.", "1", "Done"),
+            ("mark 'fix signup bug' as done", "2", "Done"),
+            ("mark fix signup bug done", "2", "Done"),
+            ("set the status of taskbar polish to todo", "3", "Todo"),
+            ("move fix signup bug to in-progress", "2", "In Progress"),
+        ],
+    )
+    def test_recognizes_commands(self, index, message, task_id, status):
+        """Should find the task and status of clear-cut commands."""
+        command = parse_status_command(message, index, STATUSES)
+
+        assert command.task["task_id"] == task_id
+        assert command.target_status == status
+
+    def test_alias_needs_a_confident_task_match(self, index):
+        """Should combine confidences, leaving alias + partial title to the model."""
+        assert parse_status_command("move fix login bug to finished", index, STATUSES)
+        assert parse_status_command("move login bug to finished", index, STATUSES) is None
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "I need a CSV export for reports",
+            "move fix bug to done",  # ambiguous task
+            "move fix login bug to staging",  # unknown status
+            "move fix login bug done",  # no connector
+            "what is the status of fix login bug",
+        ],
+    )
+    def test_leaves_unclear_messages_to_the_model(self, index, message):
+        """Should return None unless task and status are both certain."""
+        assert parse_status_command(message, index, STATUSES) is None
+
+    def test_project_status_names_win_over_aliases(self):
+        """Should map a phrase to the project's own status of that name."""
+        phrases = {phrase: status for phrase, status, _ in status_phrases(["Backlog", "Todo"])}
+
+        assert phrases["backlog"] == "Backlog"
+        assert phrases["not started"] == "Todo"
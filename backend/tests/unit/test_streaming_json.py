@@ -0,0 +1,62 @@
+"""Unit tests for incremental JSON field parsing."""
+
+import json
+
+from src.services.streaming_json import JSONFieldStream
+
+DOCUMENT = {
+    "title": 'Add "CSV" export',
+    "user_story": "As a user,\nI want exports ☃",
+    "functional_requirements": ["System MUST export", "System SHOULD compress, too"],
+    "metadata": {"priority": "P2", "title": "nested", "labels": ["feature"]},
+    "estimate": 4,
+    "ui_ux_description": "Button",
+}
+
+
+def collect(text: str, chunk_size: int) -> tuple[dict[str, str], dict[str, list[str]]]:
+    stream = JSONFieldStream()
+    fields: dict[str, str] = {}
+    items: dict[str, list[str]] = {}
+    for start in range(0, len(text), chunk_size):
+        for event in stream.feed(text[start : start + chunk_size]):
+            if event.kind == "delta":
+                fields[event.field] = fields.get(event.field, "") + event.value
+            else:
+                assert event.index == len(items.get(event.field, []))
+                items.setdefault(event.field, []).append(event.value)
+    return fields, items
+
+
+class TestJSONFieldStream:
+    """Tests for JSONFieldStream."""
+
+    def test_reassembles_fields_for_any_chunking(self):
+        """Deltas should add up to the full strings however the text is split."""
+        text = "```json\n" + json.dumps(DOCUMENT) + "\n```"
+
+        for chunk_size in (1, 2, 5, 17, len(text)):
+            fields, items = collect(text, chunk_size)
+
+            assert fields == {
+                "title": DOCUMENT["title"],
+                "user_story": DOCUMENT["user_story"],
+                "ui_ux_description": DOCUMENT["ui_ux_description"],
+            }
+            assert items == {"functional_requirements": DOCUMENT["functional_requirements"]}
+
+    def test_decodes_unicode_escapes_and_surrogate_pairs(self):
+        """Should decode \\u escapes split across chunks, including emoji."""
+        text = json.dumps({"title": "é 😀 done"}, ensure_ascii=True)
+
+        fields, _ = collect(text, 1)
+
+        assert fields == {"title": "é 😀 done"}
+
+    def test_emits_partial_text_before_the_string_ends(self):
+        """Should report text as soon as it arrives."""
+        stream = JSONFieldStream()
+
+        events = stream.feed('{"title": "Add CSV')
+
+        assert [(e.kind, e.field, e.value) for e in events] == [("delta", "title", "Add CSV")]
@@ -0,0 +1,87 @@
+"""Unit tests for the task title match index."""
+
+from src.services.task_matching import TaskMatchIndex, TaskMatchIndexCache
+
+TASKS = [
+    {"task_id": "1", "title": "Fix login bug"},
+    {"task_id": "2", "title": "Fix signup bug"},
+    {"task_id": "3", "title": "Login page redesign"},
+    {"task_id": "4", "title": "Fix  Login Bug"},
+]
+
+
+class TestTaskMatchIndex:
+    """Tests for ranked task matching."""
+
+    def test_exact_title_wins_over_earlier_partial_matches(self):
+        """Should prefer an exact (normalized) title, first one on the board."""
+        index = TaskMatchIndex(TASKS)
+
+        assert index.best_match("fix login bug")["task_id"] == "1"
+
+    def test_unique_containment(self):
+        """Should pick the only title containing the reference."""
+        index = TaskMatchIndex(TASKS)
+
+        assert index.best_match("page redesign")["task_id"] == "3"
+
+    def test_rare_words_outweigh_common_ones(self):
+        """Should score words that appear in fewer titles higher."""
+        index = TaskMatchIndex(TASKS)
+
+        assert index.best_match("signup fix")["task_id"] == "2"
+
+    def test_search_ranks_deterministically(self):
+        """Should break score ties by title coverage, then board order."""
+        index = TaskMatchIndex(TASKS)
+
+        ranked = [task["task_id"] for _, task in index.search("bug", limit=10)]
+
+        assert ranked == ["1", "2", "4"]
+
+    def test_partial_word_containment(self):
+        """Should still match references that are only part of a title word."""
+        index = TaskMatchIndex(TASKS + [{"task_id": "5", "title": "Authentication flow"}])
+
+        assert index.best_match("auth")["task_id"] == "5"
+
+    def test_no_shared_words(self):
+        """Should return no match when no word overlaps."""
+        index = TaskMatchIndex(TASKS)
+
+        assert index.best_match("dashboard") is None
+        assert index.search("dashboard") == []
+
+
+class TestTaskMatchIndexCache:
+    """Tests for per-list index reuse."""
+
+    def test_reuses_index_for_same_list(self):
+        """Should build one index per list object."""
+        cache = TaskMatchIndexCache()
+        tasks = list(TASKS)
+
+        assert cache.get(tasks) is cache.get(tasks)
+        assert cache.get(list(TASKS)) is not cache.get(tasks)
+
+    def test_rebuilds_when_list_grows(self):
+        """Should not reuse an index after tasks are appended to the list."""
+        cache = TaskMatchIndexCache()
+        tasks = list(TASKS)
+        first = cache.get(tasks)
+
+        tasks.append({"task_id": "5", "title": "Dashboard redesign"})
+
+        assert cache.get(tasks) is not first
+        assert cache.get(tasks).best_match("dashboard")["task_id"] == "5"
+
+    def test_evicts_oldest_lists(self):
+        """Should keep at most max_size indexes."""
+        cache = TaskMatchIndexCache(max_size=2)
+        lists = [[{"task_id": "1", "title": f"Task {n}"}] for n in range(3)]
+        first = cache.get(lists[0])
+
+        cache.get(lists[1])
+        cache.get(lists[2])
+
+        assert cache.get(lists[0]) is not first
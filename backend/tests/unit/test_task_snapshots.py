@@ -0,0 +1,266 @@
+"""Unit tests for versioned task snapshots."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.models.task import ProjectItem
+from src.services.task_snapshots import (
+    SNAPSHOT_IDLE_SECONDS,
+    ProjectSnapshot,
+    TaskSnapshotStore,
+    diff_task_records,
+)
+
+
+def make_task(item_id: str, title: str = "Task", status: str = "Todo") -> ProjectItem:
+    return ProjectItem(
+        project_id="PVT_1",
+        github_item_id=item_id,
+        title=title,
+        status=status,
+        status_option_id="opt",
+    )
+
+
+class TestDiffTaskRecords:
+    """Tests for field-level task diffs."""
+
+    def test_detects_added_removed_and_patched(self):
+        """Should report only changed fields for existing items."""
+        old = {
+            "A": {"github_item_id": "A", "title": "One", "status": "Todo"},
+            "B": {"github_item_id": "B", "title": "Two", "status": "Todo"},
+        }
+        new = {
+            "A": {"github_item_id": "A", "title": "One", "status": "Done"},
+            "C": {"github_item_id": "C", "title": "Three", "status": "Todo"},
+        }
+
+        added, removed, patched = diff_task_records(old, new)
+
+        assert added == [new["C"]]
+        assert removed == ["B"]
+        assert patched == [{"github_item_id": "A", "status": "Done"}]
+
+    def test_ignores_volatile_fields(self):
+        """Regenerated ids and timestamps should not count as changes."""
+        old = {"A": {"task_id": "1", "updated_at": "t1", "title": "One"}}
+        new = {"A": {"task_id": "2", "updated_at": "t2", "title": "One"}}
+
+        assert diff_task_records(old, new) == ([], [], [])
+
+
+class TestProjectSnapshot:
+    """Tests for snapshot versioning and resume."""
+
+    def test_unchanged_fetch_keeps_version(self):
+        """Should not bump the version when nothing changed."""
+        snapshot = ProjectSnapshot(project_id="PVT_1")
+        snapshot.apply([make_task("A")])
+        version = snapshot.version
+
+        assert snapshot.apply([make_task("A")]) is False
+        assert snapshot.version == version
+        assert snapshot.deltas_since(version) == []
+
+    def test_change_records_delta(self):
+        """Should record a delta frame with only the changed fields."""
+        snapshot = ProjectSnapshot(project_id="PVT_1")
+        snapshot.apply([make_task("A"), make_task("B")])
+        base = snapshot.version
+
+        snapshot.apply([make_task("A", status="Done"), make_task("C")])
+
+        assert snapshot.version == base + 1
+        (frame,) = snapshot.deltas_since(base)
+        delta = json.loads(frame)
+        assert delta["type"] == "tasks_delta"
+        assert delta["base_version"] == base
+        assert delta["version"] == base + 1
+        assert [t["github_item_id"] for t in delta["tasks_added"]] == ["C"]
+        assert delta["tasks_removed"] == ["B"]
+        assert delta["tasks_patched"] == [{"github_item_id": "A", "status": "Done"}]
+
+    def test_task_ids_stay_stable(self):
+        """Existing items should keep the task_id first sent to clients."""
+        snapshot = ProjectSnapshot(project_id="PVT_1")
+        snapshot.apply([make_task("A")])
+        task_id = snapshot.records["A"]["task_id"]
+
+        snapshot.apply([make_task("A", title="Renamed")])
+
+        assert snapshot.records["A"]["task_id"] == task_id
+        assert json.loads(snapshot.tasks_json)[0]["title"] == "Renamed"
+
+    def test_resume_from_multiple_versions_back(self):
+        """Should return every delta since the client's version in order."""
+        snapshot = ProjectSnapshot(project_id="PVT_1")
+        snapshot.apply([make_task("A")])
+        base = snapshot.version
+        snapshot.apply([make_task("A", status="In Progress")])
+        snapshot.apply([make_task("A", status="Done")])
+
+        frames = snapshot.deltas_since(base)
+
+        assert [json.loads(f)["version"] for f in frames] == [base + 1, base + 2]
+
+    def test_unknown_version_requires_full_snapshot(self):
+        """Should return None for versions outside the retained history."""
+        snapshot = ProjectSnapshot(project_id="PVT_1")
+        snapshot.apply([make_task("A")])
+
+        assert snapshot.deltas_since(snapshot.version - 5) is None
+
+        frame = json.loads(snapshot.snapshot_frame("refresh"))
+        assert frame["version"] == snapshot.version
+        assert frame["count"] == 1
+
+
+class TestTaskSnapshotStore:
+    """Tests for shared fetching."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_once_within_max_age(self):
+        """Concurrent subscribers should share one GitHub fetch."""
+        store = TaskSnapshotStore()
+        with patch(
+            "src.services.task_snapshots.github_projects_service.get_project_items",
+            new_callable=AsyncMock,
+            return_value=[make_task("A")],
+        ) as mock_fetch:
+            first = await store.get("token", "user1", "PVT_1", max_age=60)
+            second = await store.get("token", "user1", "PVT_1", max_age=60)
+
+        assert first is second
+        mock_fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_snapshots_are_per_user(self):
+        """Different users should never share a snapshot."""
+        store = TaskSnapshotStore()
+        with patch(
+            "src.services.task_snapshots.github_projects_service.get_project_items",
+            new_callable=AsyncMock,
+            return_value=[make_task("A")],
+        ) as mock_fetch:
+            first = await store.get("token1", "user1", "PVT_1", max_age=60)
+            second = await store.get("token2", "user2", "PVT_1", max_age=60)
+
+        assert first is not second
+        assert mock_fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_watch_yields_only_on_changes(self):
+        """Watchers should wake for new versions, not for unchanged refreshes."""
+        store = TaskSnapshotStore()
+        responses = [
+            [make_task("A")],
+            [make_task("A")],
+            [make_task("A", status="Done")],
+        ]
+        fetch = AsyncMock(
+            side_effect=lambda *_: responses.pop(0) if len(responses) > 1 else responses[0]
+        )
+        with patch("src.services.task_snapshots.github_projects_service.get_project_items", fetch):
+            watcher = store.watch("token", "user1", "PVT_1", interval=0.01)
+            first = await asyncio.wait_for(anext(watcher), timeout=1)
+            first_version = first.version
+            second = await asyncio.wait_for(anext(watcher), timeout=1)
+            await watcher.aclose()
+
+        assert second.version == first_version + 1
+        assert second.records["A"]["status"] == "Done"
+        assert fetch.await_count >= 3
+
+    @pytest.mark.asyncio
+    async def test_refresh_stops_when_last_watcher_leaves(self):
+        """The shared refresh task should be cancelled with no watchers left."""
+        store = TaskSnapshotStore()
+        with patch(
+            "src.services.task_snapshots.github_projects_service.get_project_items",
+            new_callable=AsyncMock,
+            return_value=[make_task("A")],
+        ):
+            first = store.watch("token", "user1", "PVT_1", interval=60)
+            second = store.watch("token", "user1", "PVT_1", interval=60)
+            await anext(first)
+            await anext(second)
+            feed = store._feeds[("PVT_1", "user1")]
+
+            await first.aclose()
+            assert not feed.task.cancelled()
+
+            await second.aclose()
+            await asyncio.sleep(0)
+
+        assert feed.task.cancelled()
+        assert ("PVT_1", "user1") not in store._feeds
+        assert ("PVT_1", "user1") not in store._snapshots
+        assert ("PVT_1", "user1") not in store._locks
+
+    @pytest.mark.asyncio
+    async def test_drops_idle_unwatched_snapshots(self):
+        """Snapshots fetched without watchers should not be kept forever."""
+        store = TaskSnapshotStore()
+        with patch(
+            "src.services.task_snapshots.github_projects_service.get_project_items",
+            new_callable=AsyncMock,
+            return_value=[make_task("A")],
+        ):
+            stale = await store.get("token", "user1", "PVT_1", max_age=60)
+            stale.fetched_at -= SNAPSHOT_IDLE_SECONDS + 1
+            await store.get("token", "user1", "PVT_2", max_age=60)
+
+        assert list(store._snapshots) == [("PVT_2", "user1")]
+
+    @pytest.mark.asyncio
+    async def test_refresh_skips_rejected_token(self):
+        """A watcher's expired token should not stop refreshes for the other watchers."""
+        store = TaskSnapshotStore()
+        request = httpx.Request("POST", "https://api.github.com/graphql")
+        expired = httpx.HTTPStatusError(
+            "401", request=request, response=httpx.Response(401, request=request)
+        )
+
+        async def fetch(token, *_args):
+            if token == "expired":
+                raise expired
+            return [make_task("A")]
+
+        with patch(
+            "src.services.task_snapshots.github_projects_service.get_project_items",
+            new_callable=AsyncMock,
+            side_effect=fetch,
+        ) as mock_fetch:
+            first = store.watch("valid", "user1", "PVT_1", interval=0.01)
+            await anext(first)
+            second = store.watch("expired", "user1", "PVT_1", interval=0.01)
+            second_next = asyncio.ensure_future(anext(second))
+            await asyncio.sleep(0.05)
+            feed = store._feeds[("PVT_1", "user1")]
+            tokens = [call.args[0] for call in mock_fetch.call_args_list]
+            second_next.cancel()
+            await first.aclose()
+
+        assert feed.rejected == {"expired"}
+        assert tokens.count("expired") == 1
+        assert tokens[-1] == "valid"
+
+    @pytest.mark.asyncio
+    async def test_request_refresh_skips_the_interval(self):
+        """A requested refresh should reach watchers without waiting for the interval."""
+        store = TaskSnapshotStore()
+        fetch = AsyncMock(side_effect=[[make_task("A")], [make_task("A", status="Done")]])
+        with patch("src.services.task_snapshots.github_projects_service.get_project_items", fetch):
+            watcher = store.watch("token", "user1", "PVT_1", interval=60)
+            await anext(watcher)
+            await asyncio.sleep(0)
+            store.request_refresh("PVT_1")
+            snapshot = await asyncio.wait_for(anext(watcher), timeout=1)
+            await watcher.aclose()
+
+        assert snapshot.records["A"]["status"] == "Done"
@@ -0,0 +1,109 @@
+"""Unit tests for the workflow transition audit log."""
+
+import os
+from datetime import datetime, timedelta
+
+from src.models.chat import TriggeredBy, WorkflowTransition
+from src.services.transition_log import TransitionLog
+
+START = datetime.utcnow() - timedelta(days=1)
+
+
+def transition(n: int, issue_id: str = "I_1", project_id: str = "P_1") -> WorkflowTransition:
+    return WorkflowTransition(
+        issue_id=issue_id,
+        project_id=project_id,
+        to_status=f"s{n}",
+        triggered_by=TriggeredBy.AUTOMATIC,
+        success=True,
+        timestamp=START + timedelta(minutes=n),
+    )
+
+
+def statuses(transitions: list[WorkflowTransition]) -> list[str]:
+    return [t.to_status for t in transitions]
+
+
+class TestTransitionLogQueries:
+    """Tests for indexed and time-range queries."""
+
+    def test_returns_latest_transitions_oldest_first(self):
+        """Should return the last ``limit`` transitions in append order."""
+        log = TransitionLog()
+        for n in range(5):
+            log.append(transition(n))
+
+        assert statuses(log.query(limit=3)) == ["s2", "s3", "s4"]
+
+    def test_filters_by_issue_and_project(self):
+        """Should use the issue and project indexes."""
+        log = TransitionLog()
+        log.append(transition(0, issue_id="I_1", project_id="P_1"))
+        log.append(transition(1, issue_id="I_2", project_id="P_1"))
+        log.append(transition(2, issue_id="I_1", project_id="P_2"))
+
+        assert statuses(log.query(issue_id="I_1")) == ["s0", "s2"]
+        assert statuses(log.query(project_id="P_1")) == ["s0", "s1"]
+        assert statuses(log.query(issue_id="I_1", project_id="P_2")) == ["s2"]
+
+    def test_filters_by_time_range(self):
+        """Should return only transitions between since and until (inclusive)."""
+        log = TransitionLog()
+        for n in range(10):
+            log.append(transition(n, issue_id=f"I_{n % 2}"))
+
+        since, until = START + timedelta(minutes=3), START + timedelta(minutes=6)
+
+        assert statuses(log.query(since=since, until=until)) == ["s3", "s4", "s5", "s6"]
+        assert statuses(log.query(issue_id="I_0", since=since, until=until)) == ["s4", "s6"]
+
+    def test_evicts_oldest_from_memory_and_indexes(self):
+        """Should keep only ``capacity`` transitions and drop evicted index entries."""
+        log = TransitionLog(capacity=3)
+        log.append(transition(0, issue_id="I_old"))
+        for n in range(1, 4):
+            log.append(transition(n))
+
+        assert len(log) == 3
+        assert log.query(issue_id="I_old") == []
+        assert statuses(log.query()) == ["s1", "s2", "s3"]
+        assert log.stats()["issues"] == 1
+
+
+class TestTransitionLogSegments:
+    """Tests for on-disk segments."""
+
+    def test_restores_recent_transitions_after_restart(self, tmp_path):
+        """Should reload the newest transitions from segments."""
+        log = TransitionLog(segment_records=2)
+        log.enable_persistence(str(tmp_path))
+        for n in range(5):
+            log.append(transition(n))
+
+        restarted = TransitionLog(capacity=3)
+        restored = restarted.enable_persistence(str(tmp_path))
+
+        assert restored == 3
+        assert statuses(restarted.query()) == ["s2", "s3", "s4"]
+        assert len(os.listdir(tmp_path)) == 3
+
+    def test_time_range_reads_segments_beyond_memory(self, tmp_path):
+        """Should find transitions that only exist on disk."""
+        log = TransitionLog(capacity=2)
+        log.enable_persistence(str(tmp_path))
+        for n in range(6):
+            log.append(transition(n))
+
+        assert statuses(log.query(limit=10)) == ["s4", "s5"]
+        assert statuses(log.query(since=START, limit=10)) == ["s0", "s1", "s2", "s3", "s4", "s5"]
+        assert statuses(log.query(since=START, limit=3)) == ["s3", "s4", "s5"]
+
+    def test_compaction_deletes_segments_past_retention(self, tmp_path):
+        """Should delete sealed segments older than the retention period."""
+        log = TransitionLog(segment_records=2, retention=timedelta(days=1))
+        log.enable_persistence(str(tmp_path))
+        for n in range(4):
+            log.append(transition(n).model_copy(update={"timestamp": START - timedelta(days=1)}))
+        log.append(transition(4))
+
+        assert log.stats()["segments"] == 1
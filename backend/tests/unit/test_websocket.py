@@ -0,0 +1,164 @@
+"""Unit tests for the WebSocket connection manager."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services.websocket import ConnectionManager, build_snapshot_frame, encode_message
+
+
+def make_websocket(send_delay: float = 0.0, fail: bool = False):
+    """Create a fake WebSocket that records sent messages."""
+    websocket = AsyncMock()
+    websocket.sent = []
+
+    async def send_text(frame):
+        if fail:
+            raise RuntimeError("connection reset")
+        if send_delay:
+            await asyncio.sleep(send_delay)
+        websocket.sent.append(json.loads(frame))
+
+    websocket.send_text = AsyncMock(side_effect=send_text)
+    return websocket
+
+
+async def drain():
+    """Let writer tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConnectionManagerBroadcast:
+    """Tests for fan-out broadcasting."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_delivers_to_all_connections(self):
+        """Should deliver the message to every subscriber of the project."""
+        manager = ConnectionManager()
+        ws1, ws2 = make_websocket(), make_websocket()
+        await manager.connect(ws1, "PVT_1")
+        await manager.connect(ws2, "PVT_1")
+
+        await manager.broadcast_to_project("PVT_1", {"type": "task_created"})
+        await drain()
+
+        assert ws1.sent == [{"type": "task_created"}]
+        assert ws2.sent == [{"type": "task_created"}]
+
+        manager.disconnect(ws1)
+        manager.disconnect(ws2)
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_does_not_block_broadcast(self):
+        """Broadcast should return without waiting on a slow socket."""
+        manager = ConnectionManager()
+        slow, fast = make_websocket(send_delay=10), make_websocket()
+        await manager.connect(slow, "PVT_1")
+        await manager.connect(fast, "PVT_1")
+
+        await asyncio.wait_for(
+            manager.broadcast_to_project("PVT_1", {"type": "task_created"}), timeout=0.5
+        )
+        await drain()
+
+        assert fast.sent == [{"type": "task_created"}]
+        assert slow.sent == []
+
+        manager.disconnect(slow)
+        manager.disconnect(fast)
+
+    @pytest.mark.asyncio
+    async def test_failed_send_disconnects_socket(self):
+        """A socket whose send fails should be removed."""
+        manager = ConnectionManager()
+        broken = make_websocket(fail=True)
+        await manager.connect(broken, "PVT_1")
+
+        await manager.broadcast_to_project("PVT_1", {"type": "task_created"})
+        await drain()
+
+        assert manager.get_connection_count("PVT_1") == 0
+
+
+class TestConnectionManagerQueuePolicy:
+    """Tests for bounded queues and snapshot coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        """Should drop the oldest message and count it per project."""
+        manager = ConnectionManager(max_queue_size=2)
+        slow = make_websocket(send_delay=10)
+        await manager.connect(slow, "PVT_1")
+        # Let the writer pick up the first message and block on it
+        await manager.broadcast_to_project("PVT_1", {"type": "task_update", "n": 0})
+        await drain()
+
+        for n in range(1, 5):
+            await manager.broadcast_to_project("PVT_1", {"type": "task_update", "n": n})
+
+        stats = manager.get_project_stats("PVT_1")
+        assert stats["max_queue_depth"] == 2
+        assert stats["dropped_messages"] == 2
+
+        manager.disconnect(slow)
+
+    @pytest.mark.asyncio
+    async def test_snapshots_are_coalesced(self):
+        """Only the latest queued snapshot should be kept."""
+        manager = ConnectionManager()
+        slow = make_websocket(send_delay=10)
+        await manager.connect(slow, "PVT_1")
+        manager.send_to_connection(slow, {"type": "pong"})
+        await drain()
+
+        manager.send_to_connection(slow, {"type": "refresh", "version": 1})
+        manager.send_to_connection(slow, {"type": "task_created"})
+        manager.send_to_connection(slow, {"type": "refresh", "version": 2})
+
+        sender = manager._senders[slow]
+        assert [json.loads(frame) for _, frame in sender.queue] == [
+            {"type": "task_created"},
+            {"type": "refresh", "version": 2},
+        ]
+        assert manager.get_project_stats("PVT_1")["dropped_messages"] == 1
+
+        manager.disconnect(slow)
+
+
+class TestConnectionManagerEncoding:
+    """Tests for encode-once frames."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once(self):
+        """Should encode a broadcast once regardless of subscriber count."""
+        manager = ConnectionManager()
+        sockets = [make_websocket() for _ in range(5)]
+        for ws in sockets:
+            await manager.connect(ws, "PVT_1")
+
+        with patch(
+            "src.services.websocket.encode_message", side_effect=encode_message
+        ) as mock_encode:
+            await manager.broadcast_to_project("PVT_1", {"type": "task_created", "id": 1})
+        await drain()
+
+        assert mock_encode.call_count == 1
+        assert all(ws.sent == [{"type": "task_created", "id": 1}] for ws in sockets)
+
+        for ws in sockets:
+            manager.disconnect(ws)
+
+    def test_snapshot_frame_matches_full_encoding(self):
+        """Should produce the same JSON as encoding the whole message."""
+        tasks = [{"task_id": "a", "title": 'Fix "quotes"'}]
+        frame = build_snapshot_frame("refresh", "PVT_1", encode_message(tasks), len(tasks))
+
+        assert json.loads(frame) == {
+            "type": "refresh",
+            "project_id": "PVT_1",
+            "tasks": tasks,
+            "count": 1,
+        }
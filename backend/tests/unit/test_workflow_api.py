@@ -0,0 +1,152 @@
+"""Unit tests for confirming issue recommendations in bulk."""
+
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.api.chat import _recommendations
+from src.api.workflow import (
+    _confirming,
+    _recent_requests,
+    confirm_recommendation,
+    confirm_recommendations,
+)
+from src.exceptions import ValidationError
+from src.models.chat import (
+    BulkConfirmRequest,
+    IssueRecommendation,
+    RecommendationStatus,
+    WorkflowResult,
+)
+from src.models.user import UserSession
+
+
+def make_recommendation(session: UserSession, title: str) -> IssueRecommendation:
+    recommendation = IssueRecommendation(
+        session_id=session.session_id,
+        original_input=f"Please add {title}",
+        title=title,
+        user_story="As a user",
+        ui_ux_description="A button",
+        functional_requirements=["Works"],
+    )
+    _recommendations[str(recommendation.recommendation_id)] = recommendation
+    return recommendation
+
+
+@pytest.fixture
+def session():
+    """Create a session with a selected project."""
+    return UserSession(
+        github_user_id="42",
+        github_username="octocat",
+        access_token="token",
+        selected_project_id="PVT_1",
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_state():
+    """Start every test without recommendations or recent requests."""
+    _recommendations.clear()
+    _recent_requests.clear()
+    _confirming.clear()
+    yield
+    _recommendations.clear()
+    _recent_requests.clear()
+    _confirming.clear()
+
+
+class TestConfirmRecommendations:
+    """Tests for the bulk confirm endpoint."""
+
+    @pytest.mark.asyncio
+    @patch("src.api.workflow.connection_manager")
+    @patch("src.api.workflow.get_workflow_orchestrator")
+    @patch("src.api.workflow.github_projects_service")
+    async def test_confirms_pending_and_reports_rejected(
+        self, mock_service, mock_get_orchestrator, mock_manager, session
+    ):
+        """Should run one bulk workflow and report unknown recommendations as failed."""
+        first = make_recommendation(session, "CSV export")
+        second = make_recommendation(session, "PDF export")
+        mock_service.get_project_repository = AsyncMock(return_value=("octocat", "app"))
+        mock_manager.broadcast_to_project = AsyncMock()
+
+        async def execute_bulk_workflow(ctx, recommendations, on_progress):
+            results = []
+            for number, recommendation in enumerate(recommendations, start=1):
+                result = WorkflowResult(
+                    success=True, issue_number=number, current_status="in_progress", message="ok"
+                )
+                await on_progress(str(recommendation.recommendation_id), "completed", result)
+                results.append(result)
+            return results
+
+        orchestrator = Mock()
+        orchestrator.execute_bulk_workflow = AsyncMock(side_effect=execute_bulk_workflow)
+        mock_get_orchestrator.return_value = orchestrator
+
+        ids = [str(first.recommendation_id), "missing", str(second.recommendation_id)]
+        response = await confirm_recommendations(
+            BulkConfirmRequest(recommendation_ids=ids + [ids[0]]), session
+        )
+
+        assert list(response.results) == ids
+        assert (response.succeeded, response.failed) == (2, 1)
+        assert "not found" in response.results["missing"].message
+        assert first.status == RecommendationStatus.CONFIRMED
+        assert second.status == RecommendationStatus.CONFIRMED
+        orchestrator.execute_bulk_workflow.assert_awaited_once()
+
+        messages = [call.args[1] for call in mock_manager.broadcast_to_project.call_args_list]
+        progress = [m for m in messages if m["type"] == "bulk_confirm_progress"]
+        assert [(m["stage"], m["finished"], m["total"]) for m in progress] == [
+            ("failed", 1, 3),
+            ("completed", 2, 3),
+            ("completed", 3, 3),
+        ]
+        assert messages[-1] == {"type": "bulk_confirm_completed", "succeeded": 2, "failed": 1}
+
+    @pytest.mark.asyncio
+    @patch("src.api.workflow.connection_manager")
+    @patch("src.api.workflow.get_workflow_orchestrator")
+    @patch("src.api.workflow.github_projects_service")
+    async def test_in_flight_recommendations_cannot_be_confirmed_again(
+        self, mock_service, mock_get_orchestrator, mock_manager, session
+    ):
+        """Should block concurrent confirms while issues are created, then release on failure."""
+        recommendation = make_recommendation(session, "CSV export")
+        recommendation_id = str(recommendation.recommendation_id)
+        mock_service.get_project_repository = AsyncMock(return_value=("octocat", "app"))
+        mock_manager.broadcast_to_project = AsyncMock()
+
+        async def execute_bulk_workflow(ctx, recommendations, on_progress):
+            with pytest.raises(ValidationError, match="already being confirmed"):
+                await confirm_recommendation(recommendation_id, session)
+            concurrent = await confirm_recommendations(
+                BulkConfirmRequest(recommendation_ids=[recommendation_id]), session
+            )
+            assert concurrent.failed == 1
+            return [WorkflowResult(success=False, message="GitHub unavailable")]
+
+        orchestrator = Mock()
+        orchestrator.execute_bulk_workflow = AsyncMock(side_effect=execute_bulk_workflow)
+        mock_get_orchestrator.return_value = orchestrator
+
+        response = await confirm_recommendations(
+            BulkConfirmRequest(recommendation_ids=[recommendation_id]), session
+        )
+
+        assert response.failed == 1
+        orchestrator.execute_bulk_workflow.assert_awaited_once()
+        assert recommendation.status == RecommendationStatus.PENDING
+        assert recommendation_id not in _confirming
+
+    def test_request_size_is_bounded(self):
+        """Should reject empty and oversized requests."""
+        with pytest.raises(ValueError):
+            BulkConfirmRequest(recommendation_ids=[])
+        with pytest.raises(ValueError):
+            BulkConfirmRequest(recommendation_ids=[str(uuid4()) for _ in range(51)])
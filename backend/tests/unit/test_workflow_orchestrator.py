@@ -1,14 +1,20 @@
 """Unit tests for Workflow Orchestrator - Custom agent assignment on Ready status."""
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
 
 import pytest
 
-from src.models.chat import WorkflowConfiguration
+from src.models.chat import IssueMetadata, IssueRecommendation, WorkflowConfiguration
 from src.services.workflow_orchestrator import (
+    RateBudget,
     WorkflowContext,
     WorkflowOrchestrator,
     WorkflowState,
+    WorkflowStep,
+    run_workflow_steps,
 )
 
 
@@ -185,6 +191,7 @@ class TestHandleReadyStatusWithCustomAgent:
             project_id="PROJECT_123",
             item_id="ITEM_456",
             status_name="In Progress",
+            fields=None,
         )
 
     @pytest.mark.asyncio
@@ -457,3 +464,312 @@ class TestWorkflowConfigurationCustomAgent:
         assert config.custom_agent == "speckit.specify"
         assert config.copilot_assignee == "fallback-user"
         assert config.enabled is True
+
+
+class TestRunWorkflowSteps:
+    """Tests for running workflow steps as a dependency graph."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_overlap(self):
+        """Should start a step as soon as its own dependencies finished."""
+        events = []
+        release = asyncio.Event()
+
+        async def slow():
+            events.append("slow started")
+            await release.wait()
+
+        async def fast():
+            events.append("fast")
+            release.set()
+
+        async def last():
+            events.append("last")
+
+        timings = {}
+        await run_workflow_steps(
+            [
+                WorkflowStep("slow", slow),
+                WorkflowStep("fast", fast),
+                WorkflowStep("last", last, after=("slow", "fast")),
+            ],
+            timings,
+        )
+
+        assert events == ["slow started", "fast", "last"]
+        assert set(timings) == {"slow", "fast", "last"}
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_pending_steps(self):
+        """Should not run dependents of a failed step and re-raise its error."""
+        ran = []
+
+        async def fail():
+            raise ValueError("boom")
+
+        async def dependent():
+            ran.append("dependent")
+
+        timings = {}
+        with pytest.raises(ValueError, match="boom"):
+            await run_workflow_steps(
+                [WorkflowStep("fail", fail), WorkflowStep("dependent", dependent, after=("fail",))],
+                timings,
+            )
+
+        assert ran == []
+        assert timings == {}
+
+
+class TestExecuteFullWorkflow:
+    """Tests for the confirmation workflow graph."""
+
+    @pytest.fixture
+    def mock_github_service(self):
+        """Create mock GitHub service."""
+        service = Mock()
+        service.create_issue = AsyncMock(
+            return_value={"node_id": "I_1", "number": 7, "html_url": "https://x/7"}
+        )
+        service.get_project_fields = AsyncMock(
+            return_value={"Status": {"id": "F_S", "options": [{"id": "o1", "name": "Ready"}]}}
+        )
+        service.add_issue_to_project = AsyncMock(return_value="ITEM_1")
+        service.set_issue_metadata = AsyncMock(return_value={})
+        service.update_item_status_by_name = AsyncMock(return_value=True)
+        service.get_issue_with_comments = AsyncMock(return_value={})
+        service.format_issue_context_as_prompt = Mock(return_value="Issue context")
+        service.assign_copilot_to_issue = AsyncMock(return_value=True)
+        return service
+
+    @pytest.fixture
+    def recommendation(self):
+        """Create a confirmed recommendation."""
+        return IssueRecommendation(
+            session_id=uuid4(),
+            original_input="Add CSV export",
+            title="CSV export",
+            user_story="As a user I want CSV export",
+            ui_ux_description="A button",
+            functional_requirements=["Exports CSV"],
+        )
+
+    @pytest.fixture
+    def workflow_context(self):
+        """Create a workflow context with a custom agent configured."""
+        return WorkflowContext(
+            session_id="test-session",
+            project_id="PROJECT_123",
+            access_token="test-token",
+            repository_owner="test-owner",
+            repository_name="test-repo",
+            config=WorkflowConfiguration(
+                project_id="PROJECT_123",
+                repository_owner="test-owner",
+                repository_name="test-repo",
+                custom_agent="speckit.specify",
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_runs_all_steps_and_reports_timings(
+        self, mock_github_service, recommendation, workflow_context
+    ):
+        """Should complete the workflow, reuse the loaded fields and time every step."""
+        orchestrator = WorkflowOrchestrator(Mock(), mock_github_service)
+
+        result = await orchestrator.execute_full_workflow(workflow_context, recommendation)
+
+        assert result.success is True
+        assert result.project_item_id == "ITEM_1"
+        assert workflow_context.current_state == WorkflowState.IN_PROGRESS
+        assert set(result.step_timings_ms) == {
+            "create_issue",
+            "load_fields",
+            "add_to_project",
+            "issue_context",
+            "set_metadata",
+            "transition_to_ready",
+            "handle_ready",
+        }
+        mock_github_service.get_project_fields.assert_awaited_once()
+        for call in mock_github_service.update_item_status_by_name.call_args_list:
+            assert "Status" in call.kwargs["fields"]
+        assert (
+            mock_github_service.assign_copilot_to_issue.call_args.kwargs["custom_instructions"]
+            == "Issue context"
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_step_reports_error_with_finished_timings(
+        self, mock_github_service, recommendation, workflow_context
+    ):
+        """Should return an error result when a required step fails."""
+        mock_github_service.add_issue_to_project.side_effect = RuntimeError("no access")
+        orchestrator = WorkflowOrchestrator(Mock(), mock_github_service)
+
+        result = await orchestrator.execute_full_workflow(workflow_context, recommendation)
+
+        assert result.success is False
+        assert "no access" in result.message
+        assert "create_issue" in result.step_timings_ms
+        assert "transition_to_ready" not in result.step_timings_ms
+        mock_github_service.assign_copilot_to_issue.assert_not_called()
+
+
+class TestRateBudget:
+    """Tests for the bulk confirmation rate budget."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """Should run at most ``concurrency`` blocks at once."""
+        budget = RateBudget(concurrency=2)
+        running = peak = 0
+
+        async def work():
+            nonlocal running, peak
+            async with budget.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work() for _ in range(5)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_spaces_starts_by_interval(self):
+        """Should start blocks at least ``interval`` apart."""
+        budget = RateBudget(concurrency=3, interval=0.02)
+        starts = []
+
+        async def work():
+            async with budget.slot():
+                starts.append(time.monotonic())
+
+        await asyncio.gather(*(work() for _ in range(3)))
+
+        gaps = [b - a for a, b in zip(starts, starts[1:], strict=False)]
+        assert all(gap >= 0.015 for gap in gaps)
+
+
+class TestExecuteBulkWorkflow:
+    """Tests for confirming several recommendations at once."""
+
+    @pytest.fixture
+    def mock_github_service(self):
+        """Create mock GitHub service with batch methods."""
+        service = Mock()
+        numbers = iter(range(1, 100))
+
+        async def create_issue(**_kwargs):
+            number = next(numbers)
+            return {"node_id": f"I_{number}", "number": number, "html_url": f"https://x/{number}"}
+
+        service.create_issue = AsyncMock(side_effect=create_issue)
+        service.get_project_fields = AsyncMock(
+            return_value={
+                "Status": {"id": "F_S", "options": [{"id": "o_ready", "name": "Ready"}]},
+                "Priority": {
+                    "id": "F_P",
+                    "dataType": "SINGLE_SELECT",
+                    "options": [{"id": "o_p1", "name": "P1"}],
+                },
+            }
+        )
+        service.add_issues_to_project = AsyncMock(
+            side_effect=lambda _token, _project, node_ids: [f"ITEM_{n}" for n in node_ids]
+        )
+        service.set_item_field_values = AsyncMock(
+            side_effect=lambda _token, _project, updates: [True] * len(updates)
+        )
+        service.update_item_status_by_name = AsyncMock(return_value=True)
+        service.assign_copilot_to_issue = AsyncMock(return_value=True)
+        return service
+
+    @pytest.fixture
+    def workflow_context(self):
+        """Create a shared workflow context without a custom agent."""
+        return WorkflowContext(
+            session_id="test-session",
+            project_id="PROJECT_123",
+            access_token="test-token",
+            repository_owner="test-owner",
+            repository_name="test-repo",
+            config=WorkflowConfiguration(
+                project_id="PROJECT_123",
+                repository_owner="test-owner",
+                repository_name="test-repo",
+            ),
+        )
+
+    def recommendation(self, title: str, priority: str = "P2") -> IssueRecommendation:
+        return IssueRecommendation(
+            session_id=uuid4(),
+            original_input=title,
+            title=title,
+            user_story="As a user",
+            ui_ux_description="A button",
+            functional_requirements=["Works"],
+            metadata=IssueMetadata(priority=priority),
+        )
+
+    @pytest.mark.asyncio
+    async def test_batches_project_writes(self, mock_github_service, workflow_context):
+        """Should add all issues and set metadata and Ready status in one batch each."""
+        recommendations = [self.recommendation("A", priority="P1"), self.recommendation("B")]
+        orchestrator = WorkflowOrchestrator(Mock(), mock_github_service)
+
+        results = await orchestrator.execute_bulk_workflow(
+            workflow_context, recommendations, budget=RateBudget(4)
+        )
+
+        assert [r.success for r in results] == [True, True]
+        assert [r.current_status for r in results] == ["in_progress", "in_progress"]
+        mock_github_service.get_project_fields.assert_awaited_once()
+        mock_github_service.add_issues_to_project.assert_awaited_once()
+        updates = mock_github_service.set_item_field_values.call_args.args[2]
+        # B's default P2 priority is not an option of the project's Priority field
+        assert sorted(updates) == [
+            ("ITEM_I_1", "F_P", {"singleSelectOptionId": "o_p1"}),
+            ("ITEM_I_1", "F_S", {"singleSelectOptionId": "o_ready"}),
+            ("ITEM_I_2", "F_S", {"singleSelectOptionId": "o_ready"}),
+        ]
+        assert mock_github_service.assign_copilot_to_issue.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_stop_others(self, mock_github_service, workflow_context):
+        """Should report a failed recommendation and finish the rest."""
+        create_issue = mock_github_service.create_issue.side_effect
+
+        async def flaky_create_issue(**kwargs):
+            if kwargs["title"] == "Broken":
+                raise RuntimeError("validation failed")
+            return await create_issue(**kwargs)
+
+        mock_github_service.create_issue.side_effect = flaky_create_issue
+        recommendations = [self.recommendation("Broken"), self.recommendation("Fine")]
+        progress = []
+
+        async def on_progress(recommendation_id, stage, result):
+            progress.append((recommendation_id, stage))
+
+        orchestrator = WorkflowOrchestrator(Mock(), mock_github_service)
+        results = await orchestrator.execute_bulk_workflow(
+            workflow_context, recommendations, on_progress, budget=RateBudget(4)
+        )
+
+        assert results[0].success is False
+        assert "validation failed" in results[0].message
+        assert results[1].success is True
+        broken, fine = (str(r.recommendation_id) for r in recommendations)
+        assert [stage for rid, stage in progress if rid == broken] == ["failed"]
+        assert [stage for rid, stage in progress if rid == fine] == [
+            "issue_created",
+            "added_to_project",
+            "ready",
+            "completed",
+        ]
+        node_ids = mock_github_service.add_issues_to_project.call_args.args[2]
+        assert len(node_ids) == 1
@@ -53,14 +53,15 @@ class MockWebSocket {
 }
 
 // Create wrapper with QueryClientProvider
-function createWrapper() {
-  const queryClient = new QueryClient({
+function createWrapper(
+  queryClient = new QueryClient({
     defaultOptions: {
       queries: {
         retry: false,
       },
     },
-  });
+  })
+) {
   return function Wrapper({ children }: { children: ReactNode }) {
     return (
       <QueryClientProvider client={queryClient}>
@@ -200,4 +201,55 @@ describe('useRealTimeSync', () => {
     // lastUpdate should be set
     expect(result.current.lastUpdate).not.toBeNull();
   });
+
+  it('should apply task deltas to cached tasks', async () => {
+    const queryClient = new QueryClient();
+    renderHook(() => useRealTimeSync('PVT_123'), {
+      wrapper: createWrapper(queryClient),
+    });
+    const ws = mockWebSocketInstances[0];
+    const task = { github_item_id: 'PVTI_1', title: 'One', status: 'Todo' };
+
+    await act(async () => {
+      ws.simulateOpen();
+      ws.simulateMessage({ type: 'initial_data', version: 1, tasks: [task] });
+      ws.simulateMessage({
+        type: 'tasks_delta',
+        base_version: 1,
+        version: 2,
+        tasks_added: [{ github_item_id: 'PVTI_2', title: 'Two', status: 'Todo' }],
+        tasks_removed: [],
+        tasks_patched: [{ github_item_id: 'PVTI_1', status: 'Done' }],
+      });
+    });
+
+    const data = queryClient.getQueryData<{ tasks: typeof task[] }>(['projects', 'PVT_123', 'tasks']);
+    expect(data?.tasks).toEqual([
+      { ...task, status: 'Done' },
+      { github_item_id: 'PVTI_2', title: 'Two', status: 'Todo' },
+    ]);
+  });
+
+  it('should request a resync when a delta is missed', async () => {
+    renderHook(() => useRealTimeSync('PVT_123'), {
+      wrapper: createWrapper(),
+    });
+    const ws = mockWebSocketInstances[0];
+    const send = vi.spyOn(ws, 'send');
+
+    await act(async () => {
+      ws.simulateOpen();
+      ws.simulateMessage({ type: 'initial_data', version: 1, tasks: [] });
+      ws.simulateMessage({
+        type: 'tasks_delta',
+        base_version: 5,
+        version: 6,
+        tasks_added: [],
+        tasks_removed: [],
+        tasks_patched: [],
+      });
+    });
+
+    expect(send).toHaveBeenCalledWith(JSON.stringify({ type: 'resync' }));
+  });
 });
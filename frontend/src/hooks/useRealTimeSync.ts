@@ -4,9 +4,31 @@
 
 import { useEffect, useRef, useCallback, useState } from 'react';
 import { useQueryClient } from '@tanstack/react-query';
+import type { Task, TaskListResponse } from '@/types';
 
 type SyncStatus = 'disconnected' | 'connecting' | 'connected' | 'polling';
 
+interface TasksDeltaMessage {
+  type: 'tasks_delta';
+  base_version: number;
+  version: number;
+  tasks_added: Task[];
+  tasks_removed: string[];
+  tasks_patched: (Partial<Task> & { github_item_id: string })[];
+}
+
+function applyTasksDelta(tasks: Task[], delta: TasksDeltaMessage): Task[] {
+  const removed = new Set(delta.tasks_removed);
+  const patches = new Map(delta.tasks_patched.map((patch) => [patch.github_item_id, patch]));
+  const next = tasks
+    .filter((task) => !removed.has(task.github_item_id))
+    .map((task) => {
+      const patch = patches.get(task.github_item_id);
+      return patch ? { ...task, ...patch } : task;
+    });
+  return [...next, ...delta.tasks_added];
+}
+
 interface UseRealTimeSyncReturn {
   status: SyncStatus;
   lastUpdate: Date | null;
@@ -20,6 +42,8 @@ export function useRealTimeSync(projectId: string | null): UseRealTimeSyncReturn
   const pollingIntervalRef = useRef<number | null>(null);
   const reconnectTimeoutRef = useRef<number | null>(null);
   const reconnectAttempts = useRef(0);
+  // Snapshot version last received, used to resume with deltas after reconnecting
+  const versionRef = useRef<number | null>(null);
   const maxReconnectAttempts = 3;
 
   const handleMessage = useCallback(
@@ -27,10 +51,29 @@ export function useRealTimeSync(projectId: string | null): UseRealTimeSyncReturn
       try {
         const data = JSON.parse(event.data);
 
+        const tasksKey = ['projects', projectId, 'tasks'];
+
         // Handle initial data with all tasks
         if (data.type === 'initial_data' || data.type === 'refresh') {
-          // Force refresh to get the updated data
-          queryClient.invalidateQueries({ queryKey: ['projects', projectId, 'tasks'] });
+          versionRef.current = data.version ?? null;
+          queryClient.setQueryData<TaskListResponse>(tasksKey, { tasks: data.tasks });
+          setLastUpdate(new Date());
+          return;
+        }
+
+        // Apply only the fields that changed since our version
+        if (data.type === 'tasks_delta') {
+          const cached = queryClient.getQueryData<TaskListResponse>(tasksKey);
+          if (data.base_version !== versionRef.current || !cached) {
+            // Missed an update; ask for a full snapshot
+            wsRef.current?.send(JSON.stringify({ type: 'resync' }));
+            return;
+          }
+          queryClient.setQueryData<TaskListResponse>(tasksKey, {
+            ...cached,
+            tasks: applyTasksDelta(cached.tasks, data),
+          });
+          versionRef.current = data.version;
           setLastUpdate(new Date());
           return;
         }
@@ -81,7 +124,8 @@ export function useRealTimeSync(projectId: string | null): UseRealTimeSyncReturn
       setStatus('connecting');
     }
 
-    const wsUrl = `${window.location.protocol === 'https:' ? 'wss:' : 'ws:'}//${window.location.host}/api/v1/projects/${projectId}/subscribe`;
+    const since = versionRef.current !== null ? `?since_version=${versionRef.current}` : '';
+    const wsUrl = `${window.location.protocol === 'https:' ? 'wss:' : 'ws:'}//${window.location.host}/api/v1/projects/${projectId}/subscribe${since}`;
 
     try {
       const ws = new WebSocket(wsUrl);
@@ -140,6 +184,7 @@ export function useRealTimeSync(projectId: string | null): UseRealTimeSyncReturn
   useEffect(() => {
     if (projectId) {
       reconnectAttempts.current = 0;
+      versionRef.current = null;
       // Start with polling immediately so UI shows "Polling mode" instead of "Offline"
       startPolling();
       // Then try to upgrade to WebSocket
@@ -1,17 +1,19 @@
 /**
  * useWorkflow Hook
  *
- * Provides functions for confirming and rejecting AI-generated
- * issue recommendations, communicating with the workflow API.
+ * Provides functions for confirming (one at a time or in bulk) and
+ * rejecting AI-generated issue recommendations, communicating with the
+ * workflow API.
  */
 
 import { useState, useCallback } from 'react';
-import type { WorkflowResult, WorkflowConfiguration } from '../types';
+import type { BulkWorkflowResult, WorkflowResult, WorkflowConfiguration } from '../types';
 
 const API_BASE = '/api/v1';
 
 interface UseWorkflowReturn {
   confirmRecommendation: (recommendationId: string) => Promise<WorkflowResult>;
+  confirmRecommendations: (recommendationIds: string[]) => Promise<BulkWorkflowResult>;
   rejectRecommendation: (recommendationId: string) => Promise<void>;
   getConfig: () => Promise<WorkflowConfiguration>;
   updateConfig: (config: Partial<WorkflowConfiguration>) => Promise<WorkflowConfiguration>;
@@ -58,6 +60,39 @@ export function useWorkflow(): UseWorkflowReturn {
     []
   );
 
+  const confirmRecommendations = useCallback(
+    async (recommendationIds: string[]): Promise<BulkWorkflowResult> => {
+      setIsLoading(true);
+      setError(null);
+
+      try {
+        const response = await fetch(`${API_BASE}/workflow/recommendations/confirm`, {
+          method: 'POST',
+          credentials: 'include',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+          body: JSON.stringify({ recommendation_ids: recommendationIds }),
+        });
+
+        if (!response.ok) {
+          const errorData = await response.json().catch(() => ({}));
+          throw new Error(errorData.error || `Failed to confirm: ${response.status}`);
+        }
+
+        const result: BulkWorkflowResult = await response.json();
+        return result;
+      } catch (err) {
+        const message = err instanceof Error ? err.message : 'Failed to confirm recommendations';
+        setError(message);
+        throw err;
+      } finally {
+        setIsLoading(false);
+      }
+    },
+    []
+  );
+
   const rejectRecommendation = useCallback(
     async (recommendationId: string): Promise<void> => {
       setIsLoading(true);
@@ -152,6 +187,7 @@ export function useWorkflow(): UseWorkflowReturn {
 
   return {
     confirmRecommendation,
+    confirmRecommendations,
     rejectRecommendation,
     getConfig,
     updateConfig,
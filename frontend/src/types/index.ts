@@ -123,6 +123,7 @@ export interface ChatMessageRequest {
 
 export interface ChatMessagesResponse {
   messages: ChatMessage[];
+  next_cursor?: string | null;
 }
 
 // ============ AI Task Proposals ============
@@ -233,6 +234,13 @@ export interface WorkflowResult {
   project_item_id?: string;
   current_status?: string;
   message: string;
+  step_timings_ms?: Record<string, number>;
+}
+
+export interface BulkWorkflowResult {
+  succeeded: number;
+  failed: number;
+  results: Record<string, WorkflowResult>;
 }
 
 export interface WorkflowConfiguration {